@@ -5,7 +5,9 @@ This demonstrates the typical user experience.
 
 import asyncio
 import json
+import statistics
 from raglint import RAGPipelineAnalyzer, Config
+from raglint.reporting import Reporter
 
 async def main():
     print("🔍 RAGLint Demo - Python API")
@@ -56,16 +58,17 @@ async def main():
     result = await analyzer.analyze_async(test_data, show_progress=False)
     
     # Step 5: Display results
-    print("=" * 60)
-    print("📈 RESULTS")
-    print("=" * 60)
-    print()
+    r = Reporter()
+    r.line("=" * 60)
+    r.line("📈 RESULTS")
+    r.line("=" * 60)
+    r.line()
     
     # Display detailed results
     for i, item_result in enumerate(result.detailed_results, 1):
         test_case = test_data[i-1]
-        print(f"Query {i}: \"{test_case['query']}\"")
-        print("-" * 60)
+        r.line(f"Query {i}: \"{test_case['query']}\"")
+        r.line("-" * 60)
         
         # Extract metrics from detailed section
         detailed = item_result.get("detailed", {})
@@ -76,46 +79,47 @@ async def main():
             for metric_name, score in metrics.items():
                 if isinstance(score, (int, float)):
                     emoji = "✓" if score >= 0.7 else "✗"
-                    print(f"   {metric_name:20s}: {score:.2f} {emoji}")
+                    r.line(f"   {metric_name:20s}: {score:.2f} {emoji}")
         
         # Display semantic score
         if detailed.get("semantic_score"):
             score = detailed["semantic_score"]
             emoji = "✓" if score >= 0.7 else "✗"
-            print(f"   {'semantic':20s}: {score:.2f} {emoji}")
+            r.line(f"   {'semantic':20s}: {score:.2f} {emoji}")
         
         # Display faithfulness
         if detailed.get("faithfulness_score") is not None:
             score = detailed["faithfulness_score"]
             emoji = "✓" if score >= 0.7 else "✗"
-            print(f"   {'faithfulness':20s}: {score:.2f} {emoji}")
+            r.line(f"   {'faithfulness':20s}: {score:.2f} {emoji}")
         
-        print()
+        r.line()
     
     # Step 6: Calculate overall score
-    print("=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    r.line("=" * 60)
+    r.line("📊 SUMMARY")
+    r.line("=" * 60)
     
     # Collect scores from semantic and faithfulness
     all_scores = result.semantic_scores + result.faithfulness_scores
-    avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
+    avg_score = statistics.fmean(all_scores) if all_scores else 0.0
     
-    print(f"   Total queries analyzed: {len(test_data)}")
-    print(f"   Average score: {avg_score:.2f}")
-    print()
+    r.line(f"   Total queries analyzed: {len(test_data)}")
+    r.line(f"   Average score: {avg_score:.2f}")
+    r.line()
     
     if avg_score >= 0.85:
-        print("   ✅ EXCELLENT! Your RAG system is performing well!")
+        r.line("   ✅ EXCELLENT! Your RAG system is performing well!")
     elif avg_score >= 0.70:
-        print("   ⚠️  GOOD, but room for improvement")
+        r.line("   ⚠️  GOOD, but room for improvement")
     else:
-        print("   ❌ NEEDS WORK - Consider improving your RAG pipeline")
+        r.line("   ❌ NEEDS WORK - Consider improving your RAG pipeline")
     
-    print()
-    print("=" * 60)
-    print("🎉 Demo complete!")
-    print("=" * 60)
+    r.line()
+    r.line("=" * 60)
+    r.line("🎉 Demo complete!")
+    r.line("=" * 60)
+    r.flush()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -3,7 +3,6 @@ Generate demo traffic for RAGLint.
 Simulates a RAG pipeline to populate the dashboard and traces.
 """
 
-import time
 import random
 import asyncio
 from raglint import watch
@@ -11,7 +10,7 @@ from raglint import watch
 # Simulate a retrieval function
 @watch(tags=["retrieval"])
 async def retrieve_documents(query: str):
-    time.sleep(0.1 + random.random() * 0.5) # Simulate latency
+    await asyncio.sleep(0.1 + random.random() * 0.5) # Simulate latency
     return [
         f"Document {i} relevant to '{query}'" 
         for i in range(random.randint(1, 3))
@@ -20,7 +19,7 @@ async def retrieve_documents(query: str):
 # Simulate an LLM generation
 @watch(tags=["llm", "generation"])
 async def generate_answer(query: str, context: list):
-    time.sleep(0.5 + random.random() * 1.0) # Simulate latency
+    await asyncio.sleep(0.5 + random.random() * 1.0) # Simulate latency
     if random.random() < 0.1:
         raise Exception("LLM API Timeout")
     return f"Here is the answer to '{query}' based on {len(context)} documents."
@@ -47,9 +46,7 @@ async def main():
     ]
     
     print("Generating demo traffic...")
-    for q in queries:
-        await rag_pipeline(q)
-        time.sleep(1)
+    await asyncio.gather(*(rag_pipeline(q) for q in queries))
     print("Done! Check the dashboard.")
 
 if __name__ == "__main__":
@@ -10,18 +10,36 @@ This example demonstrates:
 """
 
 import asyncio
+import functools
 import json
+import statistics
 from pathlib import Path
 
-from raglint import RAGPipelineAnalyzer
+from raglint import RAGPipelineAnalyzer, fast_json
 from raglint.config import Config
-from raglint.reporting import generate_html_report
+from raglint.reporting import Reporter, generate_html_report_async
 
 
+@functools.lru_cache(maxsize=1)
 def load_sample_data():
-    """Load sample data from file."""
-    with open("sample_data.json") as f:
-        return json.load(f)
+    """
+    Load sample data from file.
+    The parsed list is cached and shared across examples, so treat it as read-only.
+    """
+    return fast_json.load_file("sample_data.json")
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_analyzer(use_smart_metrics, config_json):
+    return RAGPipelineAnalyzer(use_smart_metrics=use_smart_metrics, config=json.loads(config_json))
+
+
+def get_analyzer(use_smart_metrics=False, config=None):
+    """
+    Return an analyzer for this mode and config, building each distinct one only once.
+    Smart analyzers load an embedding model, so the examples share them.
+    """
+    return _cached_analyzer(use_smart_metrics, json.dumps(config or {}, sort_keys=True))
 
 
 def example_1_basic_analysis():
@@ -31,7 +49,7 @@ def example_1_basic_analysis():
     print("=" * 70)
 
     data = load_sample_data()
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=False)
+    analyzer = get_analyzer(use_smart_metrics=False)
     results = analyzer.analyze(data)
 
     print(f"\n📊 Results:")
@@ -51,16 +69,16 @@ def example_2_smart_analysis_mock():
 
     data = load_sample_data()
     config = {"provider": "mock"}
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
+    analyzer = get_analyzer(use_smart_metrics=True, config=config)
     results = analyzer.analyze(data, show_progress=False)
 
     print(f"\n🧠 Smart Metrics:")
     if results.semantic_scores:
-        avg_semantic = sum(results.semantic_scores) / len(results.semantic_scores)
+        avg_semantic = statistics.fmean(results.semantic_scores)
         print(f"  • Average semantic similarity: {avg_semantic:.2f}")
 
     if results.faithfulness_scores:
-        avg_faith = sum(results.faithfulness_scores) / len(results.faithfulness_scores)
+        avg_faith = statistics.fmean(results.faithfulness_scores)
         print(f"  • Average faithfulness: {avg_faith:.2f}")
 
     print(f"  • Mode: {'MOCK' if results.is_mock else 'REAL'}")
@@ -76,7 +94,7 @@ async def example_3_async_processing():
 
     data = load_sample_data()
     config = {"provider": "mock"}
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
+    analyzer = get_analyzer(use_smart_metrics=True, config=config)
 
     print("\n⚡ Running async analysis...")
     results = await analyzer.analyze_async(data, show_progress=True)
@@ -113,7 +131,7 @@ def example_4_custom_config():
     }
 
     data = load_sample_data()
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config_dict)
+    analyzer = get_analyzer(use_smart_metrics=True, config=config_dict)
     results = analyzer.analyze(data, show_progress=False)
 
     print(f"\n✅ Analysis complete with custom config")
@@ -129,52 +147,45 @@ def example_5_detailed_inspection():
 
     data = load_sample_data()
     config = {"provider": "mock"}
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
+    analyzer = get_analyzer(use_smart_metrics=True, config=config)
     results = analyzer.analyze(data, show_progress=False)
 
-    print(f"\n🔍 Detailed Inspection:")
+    r = Reporter()
+    r.line(f"\n🔍 Detailed Inspection:")
     for i, item_result in enumerate(results.detailed_results, 1):
-        print(f"\n  Item {i}: {item_result['query'][:50]}...")
-        print(f"    Precision: {item_result['metrics']['precision']:.2f}")
-        print(f"    Recall: {item_result['metrics']['recall']:.2f}")
+        r.line(f"\n  Item {i}: {item_result['query'][:50]}...")
+        r.line(f"    Precision: {item_result['metrics']['precision']:.2f}")
+        r.line(f"    Recall: {item_result['metrics']['recall']:.2f}")
 
         if item_result.get("semantic_score"):
-            print(f"    Semantic: {item_result['semantic_score']:.2f}")
+            r.line(f"    Semantic: {item_result['semantic_score']:.2f}")
 
         if item_result.get("faithfulness_score"):
-            print(f"    Faithfulness: {item_result['faithfulness_score']:.2f}")
+            r.line(f"    Faithfulness: {item_result['faithfulness_score']:.2f}")
+    r.flush()
 
 
-def example_6_export_results():
-    """Example 6: Export results to JSON."""
+async def example_6_export_results():
+    """Example 6: Stream per-item results to a JSON Lines file."""
     print("\n" + "=" * 70)
     print("Example 6: Export Results")
     print("=" * 70)
 
     data = load_sample_data()
     config = {"provider": "mock"}
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
-    results = analyzer.analyze(data, show_progress=False)
+    analyzer = get_analyzer(use_smart_metrics=True, config=config)
 
-    # Export to JSON
-    export_data = {
-        "chunk_stats": results.chunk_stats,
-        "retrieval_stats": results.retrieval_stats,
-        "semantic_scores": results.semantic_scores,
-        "faithfulness_scores": results.faithfulness_scores,
-        "is_mock": results.is_mock,
-        "total_items": len(results.detailed_results),
-    }
-
-    output_file = "results_export.json"
-    with open(output_file, "w") as f:
-        json.dump(export_data, f, indent=2)
+    # Write each item as soon as it is scored instead of building one big blob
+    output_file = "results_export.jsonl"
+    with open(output_file, "wb") as f:
+        async for index, item_result in analyzer.analyze_stream(data):
+            f.write(fast_json.dumps({"index": index, **item_result["detailed"]}) + b"\n")
 
     print(f"\n💾 Results exported to: {output_file}")
     print(f"  • File size: {Path(output_file).stat().st_size} bytes")
 
 
-def example_7_generate_reports():
+async def example_7_generate_reports():
     """Example 7: Generate multiple reports."""
     print("\n" + "=" * 70)
     print("Example 7: Generate Multiple Reports")
@@ -182,17 +193,20 @@ def example_7_generate_reports():
 
     data = load_sample_data()
 
-    # Generate basic report
-    analyzer_basic = RAGPipelineAnalyzer(use_smart_metrics=False)
+    # Analyze in basic and smart mode
+    analyzer_basic = get_analyzer(use_smart_metrics=False)
     results_basic = analyzer_basic.analyze(data, show_progress=False)
-    generate_html_report(results_basic, "report_basic.html")
-    print(f"\n📄 Generated: report_basic.html")
 
-    # Generate smart report
     config = {"provider": "mock"}
-    analyzer_smart = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
-    results_smart = analyzer_smart.analyze(data, show_progress=False)
-    generate_html_report(results_smart, "report_smart.html")
+    analyzer_smart = get_analyzer(use_smart_metrics=True, config=config)
+    results_smart = await analyzer_smart.analyze_async(data, show_progress=False)
+
+    # Render both reports concurrently off the event loop
+    await asyncio.gather(
+        generate_html_report_async(results_basic, "report_basic.html"),
+        generate_html_report_async(results_smart, "report_smart.html"),
+    )
+    print(f"\n📄 Generated: report_basic.html")
     print(f"📄 Generated: report_smart.html")
 
     print(f"\n✅ All reports generated!")
@@ -209,13 +223,13 @@ def main():
     example_2_smart_analysis_mock()
     example_4_custom_config()
     example_5_detailed_inspection()
-    example_6_export_results()
-    example_7_generate_reports()
 
-    # Run async example
+    # Run async examples
     print("\n" + "=" * 70)
-    print("Running async example...")
+    print("Running async examples...")
     print("=" * 70)
+    asyncio.run(example_6_export_results())
+    asyncio.run(example_7_generate_reports())
     asyncio.run(example_3_async_processing())
 
     print("\n" + "=" * 70)
@@ -224,7 +238,7 @@ def main():
     print("\n📚 Check generated files:")
     print("  • report_basic.html")
     print("  • report_smart.html")
-    print("  • results_export.json")
+    print("  • results_export.jsonl")
     print("\n🎉 Happy analyzing!")
 
 
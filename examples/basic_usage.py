@@ -4,10 +4,10 @@ Basic RAGLint usage example.
 This script demonstrates how to use RAGLint to analyze RAG pipeline data.
 """
 
-import json
+import statistics
 
-from raglint import RAGPipelineAnalyzer
-from raglint.reporting import generate_html_report
+from raglint import RAGPipelineAnalyzer, fast_json
+from raglint.reporting import Reporter, generate_html_report
 
 
 def main():
@@ -17,8 +17,7 @@ def main():
 
     # Load sample data
     print("\n📂 Loading sample data...")
-    with open("sample_data.json") as f:
-        data = json.load(f)
+    data = fast_json.load_file("sample_data.json")
     
     print(f"   ✓ Loaded {len(data)} RAG interactions")
 
@@ -49,11 +48,11 @@ def main():
     print(f"\n📊 Smart Metrics:")
     
     if results_smart.semantic_scores:
-        avg_semantic = sum(results_smart.semantic_scores) / len(results_smart.semantic_scores)
+        avg_semantic = statistics.fmean(results_smart.semantic_scores)
         print(f"   • Semantic Similarity: {avg_semantic:.2f}")
     
     if results_smart.faithfulness_scores:
-        avg_faithfulness = sum(results_smart.faithfulness_scores) / len(results_smart.faithfulness_scores)
+        avg_faithfulness = statistics.fmean(results_smart.faithfulness_scores)
         print(f"   • Faithfulness Score: {avg_faithfulness:.2f}")
 
     # Example 3: Generate HTML Report
@@ -66,24 +65,26 @@ def main():
     print(f"   → Open in your browser to view interactive visualizations!")
 
     # Example 4: Accessing Detailed Results
-    print("\n\n📋 Example 4: Accessing Detailed Results")
-    print("-" * 70)
+    r = Reporter()
+    r.line("\n\n📋 Example 4: Accessing Detailed Results")
+    r.line("-" * 70)
     
-    print(f"\nDetailed results for first interaction:")
+    r.line(f"\nDetailed results for first interaction:")
     first_result = results_smart.detailed_results[0]
-    print(f"   • Query: {first_result['query']}")
-    print(f"   • Precision: {first_result['metrics']['precision']:.2f}")
-    print(f"   • Recall: {first_result['metrics']['recall']:.2f}")
+    r.line(f"   • Query: {first_result['query']}")
+    r.line(f"   • Precision: {first_result['metrics']['precision']:.2f}")
+    r.line(f"   • Recall: {first_result['metrics']['recall']:.2f}")
     
     if first_result.get('semantic_score'):
-        print(f"   • Semantic Score: {first_result['semantic_score']:.2f}")
+        r.line(f"   • Semantic Score: {first_result['semantic_score']:.2f}")
     
     if first_result.get('faithfulness_score'):
-        print(f"   • Faithfulness: {first_result['faithfulness_score']:.2f}")
+        r.line(f"   • Faithfulness: {first_result['faithfulness_score']:.2f}")
 
-    print("\n" + "=" * 70)
-    print("✅ Examples completed successfully!")
-    print("=" * 70)
+    r.line("\n" + "=" * 70)
+    r.line("✅ Examples completed successfully!")
+    r.line("=" * 70)
+    r.flush()
 
 
 if __name__ == "__main__":
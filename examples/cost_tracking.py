@@ -3,6 +3,7 @@ Example: Cost and latency tracking
 """
 
 from raglint import RAGPipelineAnalyzer
+from raglint.reporting import Reporter
 from raglint.tracking import get_tracker, reset_tracker
 
 
@@ -39,49 +40,50 @@ def main():
     stats = tracker.get_summary()
     
     # Display results
-    print("\n" + "="*60)
-    print("COST TRACKING")
-    print("="*60)
+    r = Reporter()
+    r.line("\n" + "="*60)
+    r.line("COST TRACKING")
+    r.line("="*60)
     
     cost = stats["cost"]
-    print(f"\n💰 Total Cost: ${cost['total_cost_usd']:.4f}")
-    print(f"   Input tokens: {cost['total_input_tokens']:,}")
-    print(f"   Output tokens: {cost['total_output_tokens']:,}")
-    print(f"   Total tokens: {cost['total_tokens']:,}")
-    print(f"   Avg cost/call: ${cost['avg_cost_per_call']:.4f}")
-    print(f"   LLM calls: {cost['num_llm_calls']}")
+    r.line(f"\n💰 Total Cost: ${cost['total_cost_usd']:.4f}")
+    r.line(f"   Input tokens: {cost['total_input_tokens']:,}")
+    r.line(f"   Output tokens: {cost['total_output_tokens']:,}")
+    r.line(f"   Total tokens: {cost['total_tokens']:,}")
+    r.line(f"   Avg cost/call: ${cost['avg_cost_per_call']:.4f}")
+    r.line(f"   LLM calls: {cost['num_llm_calls']}")
     
     if cost['costs_by_operation']:
-        print(f"\n   Costs by operation:")
+        r.line(f"\n   Costs by operation:")
         for op, op_cost in cost['costs_by_operation'].items():
-            print(f"     - {op}: ${op_cost:.4f}")
+            r.line(f"     - {op}: ${op_cost:.4f}")
     
-    print("\n" + "="*60)
-    print("LATENCY TRACKING")
-    print("="*60)
+    r.line("\n" + "="*60)
+    r.line("LATENCY TRACKING")
+    r.line("="*60)
     
     latency = stats["latency"]
-    print(f"\n⏱️  Total time: {latency['total_time_seconds']:.2f}s")
-    print(f"   Operations: {latency['num_operations']}")
-    print(f"   Avg latency: {latency['avg_latency_ms']:.2f}ms")
-    print(f"   Min latency: {latency['min_latency_ms']:.2f}ms")
-    print(f"   Max latency: {latency['max_latency_ms']:.2f}ms")
-    print(f"   P50 latency: {latency['p50_latency_ms']:.2f}ms")
-    print(f"   P95 latency: {latency['p95_latency_ms']:.2f}ms")
-    print(f"   P99 latency: {latency['p99_latency_ms']:.2f}ms")
+    r.line(f"\n⏱️  Total time: {latency['total_time_seconds']:.2f}s")
+    r.line(f"   Operations: {latency['num_operations']}")
+    r.line(f"   Avg latency: {latency['avg_latency_ms']:.2f}ms")
+    r.line(f"   Min latency: {latency['min_latency_ms']:.2f}ms")
+    r.line(f"   Max latency: {latency['max_latency_ms']:.2f}ms")
+    r.line(f"   P50 latency: {latency['p50_latency_ms']:.2f}ms")
+    r.line(f"   P95 latency: {latency['p95_latency_ms']:.2f}ms")
+    r.line(f"   P99 latency: {latency['p99_latency_ms']:.2f}ms")
     
     if stats['operations']:
-        print(f"\n   Latency by operation:")
+        r.line(f"\n   Latency by operation:")
         for op, op_stats in stats['operations'].items():
-            print(f"     - {op}:")
-            print(f"         avg: {op_stats['avg_latency_ms']:.2f}ms")
-            print(f"         p95: {op_stats['p95_latency_ms']:.2f}ms")
-            print(f"         calls: {op_stats['num_calls']}")
+            r.line(f"     - {op}:")
+            r.line(f"         avg: {op_stats['avg_latency_ms']:.2f}ms")
+            r.line(f"         p95: {op_stats['p95_latency_ms']:.2f}ms")
+            r.line(f"         calls: {op_stats['num_calls']}")
     
     # Cost estimation
-    print("\n" + "="*60)
-    print("COST ESTIMATION")
-    print("="*60)
+    r.line("\n" + "="*60)
+    r.line("COST ESTIMATION")
+    r.line("="*60)
     
     estimates = [
         (100, "gpt-3.5-turbo"),
@@ -93,14 +95,15 @@ def main():
     for num_queries, model in estimates:
         estimate = tracker.estimate_cost(num_queries, model)
         if "error" not in estimate:
-            print(f"\n📊 {num_queries:,} queries with {model}:")
-            print(f"   Estimated cost: ${estimate['estimated_cost_usd']:.2f}")
-            print(f"   Cost per query: ${estimate['avg_cost_per_query']:.4f}")
-            print(f"   Estimated tokens: {estimate['estimated_tokens']:,}")
+            r.line(f"\n📊 {num_queries:,} queries with {model}:")
+            r.line(f"   Estimated cost: ${estimate['estimated_cost_usd']:.2f}")
+            r.line(f"   Cost per query: ${estimate['avg_cost_per_query']:.4f}")
+            r.line(f"   Estimated tokens: {estimate['estimated_tokens']:,}")
     
-    print("\n" + "="*60)
-    print("Demo complete!")
-    print("="*60)
+    r.line("\n" + "="*60)
+    r.line("Demo complete!")
+    r.line("="*60)
+    r.flush()
 
 
 if __name__ == "__main__":
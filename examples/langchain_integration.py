@@ -3,6 +3,8 @@ Example: Using RAGLint with LangChain
 """
 
 import asyncio
+import functools
+import os
 from langchain_community.vectorstores import FAISS
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain.chains import RetrievalQA
@@ -10,23 +12,43 @@ from langchain_community.llms import FakeListLLM
 
 from raglint.integrations.langchain import LangChainEvaluator
 
+# Sample documents
+DOCUMENTS = [
+    "Python is a high-level programming language known for its simplicity.",
+    "Python was created by Guido van Rossum and first released in 1991.",
+    "Python supports multiple programming paradigms including procedural, object-oriented, and functional.",
+    "RAG stands for Retrieval-Augmented Generation, a technique combining retrieval and generation.",
+    "RAG improves LLM outputs by grounding them in retrieved relevant documents."
+]
+
+FAISS_CACHE_DIR = ".faiss_cache"
+
+
+@functools.lru_cache(maxsize=1)
+def _vectorstore():
+    """
+    Load the embedding model and build the FAISS index once per process.
+    The index is also saved to FAISS_CACHE_DIR so later runs skip re-embedding;
+    delete that directory after editing DOCUMENTS.
+    """
+    embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+    if os.path.isdir(FAISS_CACHE_DIR):
+        # The index was written by this script, so loading its pickle is safe
+        vectorstore = FAISS.load_local(
+            FAISS_CACHE_DIR, embeddings, allow_dangerous_deserialization=True
+        )
+    else:
+        vectorstore = FAISS.from_texts(DOCUMENTS, embeddings)
+        vectorstore.save_local(FAISS_CACHE_DIR)
+    return vectorstore, embeddings
+
 
 async def main():
     # 1. Create a simple LangChain RAG setup
     print("Setting up LangChain RAG chain...")
     
-    # Sample documents
-    documents = [
-        "Python is a high-level programming language known for its simplicity.",
-        "Python was created by Guido van Rossum and first released in 1991.",
-        "Python supports multiple programming paradigms including procedural, object-oriented, and functional.",
-        "RAG stands for Retrieval-Augmented Generation, a technique combining retrieval and generation.",
-        "RAG improves LLM outputs by grounding them in retrieved relevant documents."
-    ]
-    
-    # Create embeddings and vector store
-    embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-    vectorstore = FAISS.from_texts(documents, embeddings)
+    # Create embeddings and vector store (cached across calls and runs)
+    vectorstore, embeddings = _vectorstore()
     
     # Create a fake LLM for demo (replace with OpenAI("gpt-3.5-turbo") in production)
     llm = FakeListLLM(responses=[
@@ -67,7 +89,8 @@ async def main():
     print("="*60)
     
     print(f"\nSummary Metrics:")
-    for metric, value in results.summary_metrics.items():
+    summary = {"chunk_stats": results.chunk_stats, "retrieval_stats": results.retrieval_stats}
+    for metric, value in summary.items():
         if isinstance(value, dict):
             print(f"  {metric}:")
             for k, v in value.items():
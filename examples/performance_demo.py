@@ -4,7 +4,6 @@ Performance demo: Async vs Sync analysis.
 Run this script to see the speed improvement of async processing.
 """
 
-import json
 import time
 
 from raglint.core import RAGPipelineAnalyzer
@@ -12,23 +11,21 @@ from raglint.core import RAGPipelineAnalyzer
 # Create sample data
 def create_sample_data(n_items=20):
     """Create sample RAG data for testing."""
-    data = []
-    for i in range(n_items):
-        data.append(
-            {
-                "query": f"What is concept {i}?",
-                "retrieved_contexts": [
-                    f"Concept {i} is about topic A.",
-                    f"It relates to subject B in area {i}.",
-                    f"The key idea is understanding principle {i}.",
-                ],
-                "ground_truth_contexts": [
-                    f"Concept {i} refers to topic A and B.",
-                ],
-                "response": f"Concept {i} is related to topics A and B, focusing on principle {i}.",
-            }
-        )
-    return data
+    return [
+        {
+            "query": f"What is concept {i}?",
+            "retrieved_contexts": [
+                f"Concept {i} is about topic A.",
+                f"It relates to subject B in area {i}.",
+                f"The key idea is understanding principle {i}.",
+            ],
+            "ground_truth_contexts": [
+                f"Concept {i} refers to topic A and B.",
+            ],
+            "response": f"Concept {i} is related to topics A and B, focusing on principle {i}.",
+        }
+        for i in range(n_items)
+    ]
 
 
 def main():
@@ -46,10 +43,10 @@ def main():
     print("\n🐢 Running SYNCHRONOUS analysis...")
     analyzer_sync = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
     
-    start = time.time()
+    start = time.perf_counter()
     # Force sync by using _analyze_sync directly
     result_sync = analyzer_sync._analyze_sync(data)
-    sync_time = time.time() - start
+    sync_time = time.perf_counter() - start
 
     print(f"   ✓ Completed in {sync_time:.2f}s")
     print(f"   • Faithfulness scores: {len(result_sync.faithfulness_scores)}")
@@ -59,9 +56,9 @@ def main():
     print("\n🚀 Running ASYNCHRONOUS analysis...")
     analyzer_async = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
 
-    start = time.time()
+    start = time.perf_counter()
     result_async = analyzer_async.analyze(data, show_progress=True)
-    async_time = time.time() - start
+    async_time = time.perf_counter() - start
 
     print(f"   ✓ Completed in {async_time:.2f}s")
     print(f"   • Faithfulness scores: {len(result_async.faithfulness_scores)}")
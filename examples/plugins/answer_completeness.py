@@ -5,33 +5,64 @@ Evaluates whether the generated answer fully addresses all parts of the query.
 Useful for customer support, legal Q&A, and other contexts where partial answers
 are insufficient.
 """
-from typing import Dict, Any
+import asyncio
+import re
+from typing import Any
+
+from raglint import fast_json
 from raglint.plugins.interface import PluginInterface
 
+# Outermost {...} span, same as slicing from the first "{" to the last "}"
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+_SCORE_RE = re.compile(r"score:\s*([0-9.]+)", re.IGNORECASE)
+
 
 class AnswerCompletenessPlugin(PluginInterface):
     """
     Measures whether the answer addresses all parts of a multi-part question.
-    
+
     Example:
         Query: "What's the price and warranty?"
         Good: "Price is $299. Warranty is 2 years."
         Bad: "Price is $299." (missing warranty)
     """
-    
+
     name = "answer_completeness"
     version = "1.0.0"
     description = "Evaluates if answer fully addresses all query components"
-    
-    def __init__(self, llm=None):
-        """Initialize with optional LLM for smart evaluation."""
+
+    __slots__ = ("llm", "_cache", "_hits", "_misses")
+
+    def __init__(self, llm=None, semantic_cache: bool = False, embed_fn=None):
+        """
+        Initialize with optional LLM for smart evaluation.
+
+        With semantic_cache=True, results are reused for (query, response) pairs
+        whose embedding is near-identical to one already scored. embed_fn maps a
+        string to a vector and defaults to the local sentence-transformers model.
+        """
         self.llm = llm or self._get_default_llm()
-    
+        self._cache = None
+        self._hits = 0
+        self._misses = 0
+        if semantic_cache:
+            from raglint.cache import SemanticCache
+
+            if embed_fn is None:
+                from raglint.metrics.semantic import SemanticMatcher
+
+                matcher = SemanticMatcher()
+
+                def embed_fn(text: str):
+                    return matcher.encode([text])[0]
+
+            self._cache = SemanticCache(embed_fn=embed_fn)
+
     def _get_default_llm(self):
         """Get default LLM for evaluation."""
         from raglint.llm import MockLLM
         return MockLLM()
-    
+
     async def calculate_async(
         self,
         query: str,
@@ -39,10 +70,10 @@ class AnswerCompletenessPlugin(PluginInterface):
         contexts: list,
         ground_truth: str = None,
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """
         Calculate completeness score asynchronously.
-        
+
         Returns:
             dict: {
                 "score": float (0.0-1.0),
@@ -50,19 +81,81 @@ class AnswerCompletenessPlugin(PluginInterface):
                 "missing_components": list
             }
         """
+        cached = self._cache_get(query, response)
+        if cached is not None:
+            return cached
+
+        try:
+            response_text = await self.llm.agenerate(self._build_prompt(query, response))
+        except Exception as e:
+            return self._error_result(e)
+        result = self._to_result(response_text)
+        self._cache_set(query, response, result)
+        return result
+
+    async def calculate_batch_async(
+        self, items: list[dict[str, Any]], max_concurrent: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        Score many {"query", "response"} items, sending the LLM calls concurrently.
+        At most max_concurrent calls are in flight; results keep the input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate(prompt: str) -> str:
+            async with semaphore:
+                return await self.llm.agenerate(prompt)
+
+        results = [self._cache_get(item["query"], item["response"]) for item in items]
+        misses = [i for i, result in enumerate(results) if result is None]
+        prompts = [self._build_prompt(items[i]["query"], items[i]["response"]) for i in misses]
+        raw = await asyncio.gather(*[generate(p) for p in prompts], return_exceptions=True)
+
+        for i, r in zip(misses, raw):
+            if isinstance(r, Exception):
+                results[i] = self._error_result(r)
+            else:
+                results[i] = self._to_result(r)
+                self._cache_set(items[i]["query"], items[i]["response"], results[i])
+        return results
+
+    def cache_stats(self) -> dict[str, int]:
+        """Semantic cache hit/miss counts (all zero when the cache is disabled)."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": self._cache.size() if self._cache is not None else 0,
+        }
+
+    def _cache_get(self, query: str, response: str):
+        if self._cache is None:
+            return None
+        result = self._cache.get(f"{query}\n{response}")
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return result
+
+    def _cache_set(self, query: str, response: str, result: dict[str, Any]) -> None:
+        if self._cache is not None:
+            self._cache.set(f"{query}\n{response}", result)
+
+    def _build_prompt(self, query: str, response: str) -> str:
+        """Build the completeness evaluation prompt."""
         # Use LLM to identify query components
-        prompt = f"""
+        return f"""
         Analyze this question and answer:
-        
+
         Question: {query}
         Answer: {response}
-        
+
         Task:
         1. Identify all components/sub-questions in the Question
         2. Check if the Answer addresses each component
         3. List any missing components
         4. Assign a completeness score (0.0 = incomplete, 1.0 = fully complete)
-        
+
         Output format (JSON):
         {{
             "components": ["component1", "component2"],
@@ -72,55 +165,53 @@ class AnswerCompletenessPlugin(PluginInterface):
             "reasoning": "Missing warranty information"
         }}
         """
-        
+
+    def _to_result(self, response_text: str) -> dict[str, Any]:
+        """Turn a raw LLM response into the plugin's result dict."""
         try:
-            response_text = await self.llm.agenerate(prompt)
             result = self._parse_response(response_text)
-            
             return {
                 "score": result.get("score", 0.5),
                 "reasoning": result.get("reasoning", "Partial answer"),
                 "missing_components": result.get("missing", []),
             }
         except Exception as e:
-            return {
-                "score": 0.5,
-                "reasoning": f"Error evaluating completeness: {str(e)}",
-                "missing_components": [],
-            }
-    
+            return self._error_result(e)
+
+    def _error_result(self, error: Exception) -> dict[str, Any]:
+        return {
+            "score": 0.5,
+            "reasoning": f"Error evaluating completeness: {str(error)}",
+            "missing_components": [],
+        }
+
     def _parse_response(self, response: str) -> dict:
         """Parse LLM response."""
-        import json
-        try:
-            # Try to extract JSON from response
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            if start != -1 and end > start:
-                json_str = response[start:end]
-                return json.loads(json_str)
-        except:
-            pass
-        
+        # Try to extract JSON from response
+        match = _JSON_RE.search(response)
+        if match:
+            try:
+                return fast_json.loads(match.group(0))
+            except ValueError:
+                pass
+
         # Fallback: parse score from text
         score = 0.5
-        if "score:" in response.lower():
+        match = _SCORE_RE.search(response)
+        if match:
             try:
-                score_line = [l for l in response.split("\n") if "score:" in l.lower()][0]
-                score = float(score_line.split(":")[-1].strip())
-            except:
+                score = float(match.group(1))
+            except ValueError:
                 pass
-        
+
         return {"score": score, "reasoning": response, "missing": []}
 
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
-    
     async def test_plugin():
         plugin = AnswerCompletenessPlugin()
-        
+
         # Test case 1: Complete answer
         result1 = await plugin.calculate_async(
             query="What's the price and warranty?",
@@ -128,7 +219,7 @@ if __name__ == "__main__":
             contexts=["Price: $299", "Warranty: 2 years"]
         )
         print(f"Complete answer score: {result1['score']}")  # Expect ~1.0
-        
+
         # Test case 2: Incomplete answer
         result2 = await plugin.calculate_async(
             query="What's the price and warranty?",
@@ -137,5 +228,5 @@ if __name__ == "__main__":
         )
         print(f"Incomplete answer score: {result2['score']}")  # Expect <0.6
         print(f"Missing: {result2['missing_components']}")
-    
+
     asyncio.run(test_plugin())
@@ -4,29 +4,51 @@ Example custom plugin: Response Latency Tracker
 Tracks how long it takes to generate responses and provides insights
 into performance bottlenecks. Useful for production monitoring.
 """
-import time
-from typing import Dict, Any
+import asyncio
+from typing import Any, Optional
+
+import numpy as np
+
 from raglint.plugins.interface import PluginInterface
 
 
 class ResponseLatencyPlugin(PluginInterface):
     """
     Tracks response generation latency and identifies slow queries.
-    
+
     Helps identify:
     - Which queries are slowest
     - Retrieval vs generation time
     - Performance degradation over time
     """
-    
+
     name = "response_latency"
     version = "1.0.0"
     description = "Tracks and analyzes response generation latency"
-    
-    def __init__(self):
-        """Initialize latency tracker."""
-        self.latency_history = []
-    
+
+    __slots__ = ("_timings", "_total")
+
+    def __init__(self, max_history: int = 10_000):
+        """
+        Initialize latency tracker.
+
+        Keeps the most recent max_history samples as (total, retrieval, generation)
+        rows of one preallocated array; older samples are overwritten in place.
+        """
+        self._timings = np.empty((max_history, 3), dtype=np.float64)
+        self._total = 0  # Samples seen; the next row written is _total % max_history
+
+    @property
+    def latency_history(self) -> list[dict[str, float]]:
+        """Recorded samples, oldest first."""
+        timings = self._window()
+        if self._total > len(self._timings):
+            timings = np.roll(timings, -(self._total % len(self._timings)), axis=0)
+        return [
+            {"total_time": total, "retrieval_time": retrieval, "generation_time": generation}
+            for total, retrieval, generation in timings.tolist()
+        ]
+
     async def calculate_async(
         self,
         query: str,
@@ -34,10 +56,10 @@ class ResponseLatencyPlugin(PluginInterface):
         contexts: list,
         metadata: dict = None,
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """
         Calculate latency metrics.
-        
+
         Expects metadata with timing information:
         {
             "retrieval_time": float,  # seconds
@@ -47,29 +69,29 @@ class ResponseLatencyPlugin(PluginInterface):
         """
         if not metadata:
             metadata = {}
-        
+
         retrieval_time = metadata.get("retrieval_time", 0)
         generation_time = metadata.get("generation_time", 0)
         total_time = metadata.get("total_time", retrieval_time + generation_time)
-        
+
         # Calculate metrics
         retrieval_pct = (retrieval_time / total_time * 100) if total_time > 0 else 0
         generation_pct = (generation_time / total_time * 100) if total_time > 0 else 0
-        
+
         # Store in history
-        self.latency_history.append({
-            "query": query,
-            "total_time": total_time,
-            "retrieval_time": retrieval_time,
-            "generation_time": generation_time,
-        })
-        
+        self._timings[self._total % len(self._timings)] = (
+            total_time,
+            retrieval_time,
+            generation_time,
+        )
+        self._total += 1
+
         # Determine if slow
         is_slow = total_time > 3.0  # 3 second threshold
-        
+
         # Calculate percentiles if we have history
         percentile_90 = self._calculate_percentile(90)
-        
+
         return {
             "total_latency_ms": total_time * 1000,
             "retrieval_latency_ms": retrieval_time * 1000,
@@ -80,16 +102,21 @@ class ResponseLatencyPlugin(PluginInterface):
             "p90_latency_ms": percentile_90 * 1000 if percentile_90 else None,
             "recommendation": self._get_recommendation(retrieval_pct, total_time)
         }
-    
-    def _calculate_percentile(self, percentile: int) -> float:
-        """Calculate percentile from latency history."""
-        if not self.latency_history:
+
+    def _window(self) -> np.ndarray:
+        """The filled rows of the timing buffer (in storage order, not time order)."""
+        return self._timings[: min(self._total, len(self._timings))]
+
+    def _calculate_percentile(self, percentile: int) -> Optional[float]:
+        """Nearest-rank percentile of total time over the kept samples (None if empty)."""
+        times = self._window()[:, 0]
+        if not len(times):
             return None
-        
-        times = sorted([h["total_time"] for h in self.latency_history])
-        idx = int(len(times) * percentile / 100)
-        return times[min(idx, len(times) - 1)]
-    
+
+        idx = min(int(len(times) * percentile / 100), len(times) - 1)
+        # Partial sort: only the element at idx needs to land in its sorted position
+        return float(np.partition(times, idx)[idx])
+
     def _get_recommendation(self, retrieval_pct: float, total_time: float) -> str:
         """Get optimization recommendation based on latency profile."""
         if total_time < 1.0:
@@ -100,35 +127,32 @@ class ResponseLatencyPlugin(PluginInterface):
             return "⚠️ Generation is slow - consider using faster model or reducing max_tokens"
         else:
             return "⚠️ Both retrieval and generation are slow - optimize holistically"
-    
-    def get_summary(self) -> Dict[str, Any]:
-        """Get summary statistics across all queries."""
-        if not self.latency_history:
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get summary statistics across the kept samples."""
+        timings = self._window()
+        if not len(timings):
             return {"error": "No latency data collected"}
-        
-        times = [h["total_time"] for h in self.latency_history]
-        retrieval_times = [h["retrieval_time"] for h in self.latency_history]
-        generation_times = [h["generation_time"] for h in self.latency_history]
-        
+
+        avg_total, avg_retrieval, avg_generation = timings.mean(axis=0) * 1000
+
         return {
-            "total_queries": len(self.latency_history),
-            "avg_latency_ms": sum(times) / len(times) * 1000,
+            "total_queries": len(timings),
+            "avg_latency_ms": float(avg_total),
             "p50_latency_ms": self._calculate_percentile(50) * 1000,
             "p90_latency_ms": self._calculate_percentile(90) * 1000,
             "p99_latency_ms": self._calculate_percentile(99) * 1000,
-            "avg_retrieval_ms": sum(retrieval_times) / len(retrieval_times) * 1000,
-            "avg_generation_ms": sum(generation_times) / len(generation_times) * 1000,
-            "slow_queries_count": sum(1 for t in times if t > 3.0),
+            "avg_retrieval_ms": float(avg_retrieval),
+            "avg_generation_ms": float(avg_generation),
+            "slow_queries_count": int(np.count_nonzero(timings[:, 0] > 3.0)),
         }
 
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
-    
     async def test_plugin():
         plugin = ResponseLatencyPlugin()
-        
+
         # Simulate some queries with different latency profiles
         test_cases = [
             {"retrieval": 0.5, "generation": 0.3},  # Fast
@@ -136,7 +160,7 @@ if __name__ == "__main__":
             {"retrieval": 0.3, "generation": 2.5},  # Slow generation
             {"retrieval": 1.5, "generation": 1.5},  # Both slow
         ]
-        
+
         for i, case in enumerate(test_cases):
             result = await plugin.calculate_async(
                 query=f"Test query {i}",
@@ -151,12 +175,12 @@ if __name__ == "__main__":
             print(f"\nQuery {i}:")
             print(f"  Total: {result['total_latency_ms']:.0f}ms")
             print(f"  Recommendation: {result['recommendation']}")
-        
+
         # Print summary
         print("\n=== Summary ===")
         summary = plugin.get_summary()
         print(f"Avg latency: {summary['avg_latency_ms']:.0f}ms")
         print(f"P90 latency: {summary['p90_latency_ms']:.0f}ms")
         print(f"Slow queries: {summary['slow_queries_count']}/{summary['total_queries']}")
-    
+
     asyncio.run(test_plugin())
@@ -2,8 +2,11 @@
 Example: Running RAGLint benchmarks
 """
 
+import statistics
+
 from raglint.benchmarks import SQUADBenchmark, BenchmarkRegistry
 from raglint import RAGPipelineAnalyzer
+from raglint.reporting import Reporter
 
 
 def run_squad_benchmark():
@@ -28,24 +31,25 @@ def run_squad_benchmark():
     results = analyzer.analyze(test_data, show_progress=True)
     
     # 4. Display results
-    print("\n" + "="*60)
-    print("BENCHMARK RESULTS")
-    print("="*60)
+    r = Reporter()
+    r.line("\n" + "="*60)
+    r.line("BENCHMARK RESULTS")
+    r.line("="*60)
     
-    print(f"\nSummary Metrics:")
+    r.line(f"\nSummary Metrics:")
     
     # Calculate summary metrics from results
-    avg_faithfulness = sum(results.faithfulness_scores) / len(results.faithfulness_scores) if results.faithfulness_scores else 0
-    avg_semantic = sum(results.semantic_scores) / len(results.semantic_scores) if results.semantic_scores else 0
+    avg_faithfulness = statistics.fmean(results.faithfulness_scores) if results.faithfulness_scores else 0.0
+    avg_semantic = statistics.fmean(results.semantic_scores) if results.semantic_scores else 0.0
     
-    print(f"  avg_faithfulness: {avg_faithfulness:.3f}")
-    print(f"  avg_semantic_score: {avg_semantic:.3f}")
-    print(f"  retrieval_stats:")
+    r.line(f"  avg_faithfulness: {avg_faithfulness:.3f}")
+    r.line(f"  avg_semantic_score: {avg_semantic:.3f}")
+    r.line(f"  retrieval_stats:")
     for k, v in results.retrieval_stats.items():
-        print(f"    {k}: {v:.3f}" if isinstance(v, float) else f"    {k}: {v}")
+        r.line(f"    {k}: {v:.3f}" if isinstance(v, float) else f"    {k}: {v}")
     
     # Compare to baseline (example values)
-    print("\nComparison to Baseline:")
+    r.line("\nComparison to Baseline:")
     baseline = {
         "avg_faithfulness": 0.85,
         "avg_semantic_score": 0.80,
@@ -61,7 +65,8 @@ def run_squad_benchmark():
             current = current_metrics[metric]
             diff = current - baseline_value
             emoji = "✅" if diff >= 0 else "❌"
-            print(f"  {emoji} {metric}: {current:.3f} (baseline: {baseline_value:.3f}, Δ {diff:+.3f})")
+            r.line(f"  {emoji} {metric}: {current:.3f} (baseline: {baseline_value:.3f}, Δ {diff:+.3f})")
+    r.flush()
     
     return results
 
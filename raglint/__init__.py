@@ -4,44 +4,68 @@ This package provides a comprehensive framework for evaluating
 Retrieval-Augmented Generation (RAG) systems.
 """
 
-from raglint.config import Config
-from raglint.core import RAGPipelineAnalyzer
-from raglint.exceptions import (
-    ConfigError,
-    DashboardError,
-    DataValidationError,
-    GenerationError,
-    LLMError,
-    MetricError,
-    PluginError,
-    RAGLintError,
-)
-from raglint.instrumentation import Monitor, watch
-from raglint.integrations.langchain import RAGLintCallbackHandler
-from raglint.llm import BaseLLM, LLMFactory, MockLLM, OllamaLLM, OpenAI_LLM
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.2.0"
 
-__all__ = [
+# Public name -> defining module. Modules are imported on first attribute access
+# (PEP 562), so e.g. `from raglint import Config` does not pull in the analyzer,
+# LLM clients or the LangChain integration.
+_LAZY_ATTRS = {
     # Core classes
-    "Config",
-    "RAGPipelineAnalyzer",
-    "LLMFactory",
-    "watch",
-    "Monitor",
-    "RAGLintCallbackHandler",
+    "Config": "raglint.config",
+    "RAGPipelineAnalyzer": "raglint.core",
+    "LLMFactory": "raglint.llm",
+    "watch": "raglint.instrumentation",
+    "Monitor": "raglint.instrumentation",
+    "RAGLintCallbackHandler": "raglint.integrations.langchain",
     # LLM providers
-    "BaseLLM",
-    "MockLLM",
-    "OpenAI_LLM",
-    "OllamaLLM",
+    "BaseLLM": "raglint.llm",
+    "MockLLM": "raglint.llm",
+    "OpenAI_LLM": "raglint.llm",
+    "OllamaLLM": "raglint.llm",
     # Exceptions
-    "RAGLintError",
-    "ConfigError",
-    "MetricError",
-    "LLMError",
-    "PluginError",
-    "DataValidationError",
-    "DashboardError",
-    "GenerationError",
-]
+    "RAGLintError": "raglint.exceptions",
+    "ConfigError": "raglint.exceptions",
+    "MetricError": "raglint.exceptions",
+    "LLMError": "raglint.exceptions",
+    "PluginError": "raglint.exceptions",
+    "DataValidationError": "raglint.exceptions",
+    "DashboardError": "raglint.exceptions",
+    "GenerationError": "raglint.exceptions",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+if TYPE_CHECKING:
+    from raglint.config import Config
+    from raglint.core import RAGPipelineAnalyzer
+    from raglint.exceptions import (
+        ConfigError,
+        DashboardError,
+        DataValidationError,
+        GenerationError,
+        LLMError,
+        MetricError,
+        PluginError,
+        RAGLintError,
+    )
+    from raglint.instrumentation import Monitor, watch
+    from raglint.integrations.langchain import RAGLintCallbackHandler
+    from raglint.llm import BaseLLM, LLMFactory, MockLLM, OllamaLLM, OpenAI_LLM
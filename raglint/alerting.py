@@ -4,28 +4,108 @@ Handles sending notifications to external channels (e.g., Slack) when issues are
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import threading
+from concurrent.futures import Future
 from typing import Any, Optional
 
 import aiohttp
 
+from raglint import fast_json
+
 logger = logging.getLogger(__name__)
 
+_SLACK_COLORS = {"info": "#36a64f", "warning": "#ffcc00", "error": "#ff0000"}
+
+# Seconds to wait at interpreter exit for sync alerts that are still being sent
+_SHUTDOWN_TIMEOUT = 5.0
+
 
 class AlertManager:
     """
     Manages system alerts and notifications.
+    Use get_alert_manager() for the shared, environment-configured instance.
     """
 
-    _instance = None
+    def __init__(self, slack_webhook_url: Optional[str] = None):
+        self.slack_webhook_url = slack_webhook_url or os.getenv("SLACK_WEBHOOK_URL")
+        self.enabled = bool(self.slack_webhook_url)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_lock = threading.Lock()
+
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the event loop used for alerts sent from sync code.
+        It runs on a daemon thread, started on first use, and is drained and
+        stopped at interpreter exit by shutdown().
+        """
+        with self._bg_lock:
+            if self._bg_loop is None:
+                loop = asyncio.new_event_loop()
+                self._bg_thread = threading.Thread(
+                    target=loop.run_forever, name="raglint-alerts", daemon=True
+                )
+                self._bg_thread.start()
+                self._bg_loop = loop
+                atexit.register(self.shutdown)
+        return self._bg_loop
+
+    def shutdown(self, timeout: float = _SHUTDOWN_TIMEOUT) -> None:
+        """
+        Wait up to timeout seconds for pending sync alerts, close the HTTP session
+        and stop the background loop. Registered with atexit so short CLI runs
+        don't drop alerts they just queued.
+        """
+        with self._bg_lock:
+            loop, thread = self._bg_loop, self._bg_thread
+            self._bg_loop = self._bg_thread = None
+        if loop is None:
+            return
+        atexit.unregister(self.shutdown)
+
+        async def drain() -> None:
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            if pending:
+                await asyncio.wait(pending, timeout=timeout)
+            if self._session_loop is loop:
+                await self.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(drain(), loop).result(timeout + 1)
+        except Exception as e:
+            logger.warning(f"Alerts still pending at shutdown were dropped: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=1)
+        if not thread.is_alive():
+            loop.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session so keep-alive connections are reused across alerts.
+        A session is bound to its event loop, so if the loop changed the old session is
+        closed and a new one is made.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            await _close_session(self._session, self._session_loop)
+            self._session = None
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+            )
+            self._session_loop = loop
+        return self._session
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.slack_webhook_url = os.getenv("SLACK_WEBHOOK_URL")
-            cls._instance.enabled = bool(cls._instance.slack_webhook_url)
-        return cls._instance
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await _close_session(self._session, self._session_loop)
+        self._session = None
 
     async def send_alert(
         self,
@@ -47,29 +127,28 @@ class AlertManager:
         self, title: str, message: str, level: str, details: Optional[dict[str, Any]]
     ):
         """Send alert to Slack."""
-        color = "#36a64f"  # Green (Info)
-        if level == "warning":
-            color = "#ffcc00"
-        elif level == "error":
-            color = "#ff0000"
-
+        fields = [{"title": k, "value": str(v), "short": True} for k, v in (details or {}).items()]
         payload = {
             "attachments": [
-                {"color": color, "title": f"RAGLint Alert: {title}", "text": message, "fields": []}
+                {
+                    # Unknown levels are shown as info
+                    "color": _SLACK_COLORS.get(level, _SLACK_COLORS["info"]),
+                    "title": f"RAGLint Alert: {title}",
+                    "text": message,
+                    "fields": fields,
+                }
             ]
         }
 
-        if details:
-            for k, v in details.items():
-                payload["attachments"][0]["fields"].append(
-                    {"title": k, "value": str(v), "short": True}
-                )
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.slack_webhook_url, json=payload) as resp:
-                    if resp.status != 200:
-                        logger.error(f"Failed to send Slack alert: {await resp.text()}")
+            session = await self._get_session()
+            async with session.post(
+                self.slack_webhook_url,
+                data=fast_json.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            ) as resp:
+                if resp.status != 200:
+                    logger.error(f"Failed to send Slack alert: {await resp.text()}")
         except Exception as e:
             logger.error(f"Error sending Slack alert: {e}")
 
@@ -79,19 +158,53 @@ class AlertManager:
         message: str,
         level: str = "info",
         details: Optional[dict[str, Any]] = None,
-    ):
-        """Synchronous wrapper for sending alerts."""
+    ) -> Optional[Future]:
+        """
+        Synchronous wrapper for sending alerts.
+
+        The alert is sent on a background event loop, so this never blocks and works
+        whether or not the caller is inside a running loop. The returned future can be
+        waited on with .result(timeout) if delivery must finish first; otherwise alerts
+        still in flight at exit get up to _SHUTDOWN_TIMEOUT seconds (see shutdown()).
+        """
         if not self.enabled:
-            return
+            return None
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is running, we schedule it as a task
-                loop.create_task(self.send_alert(title, message, level, details))
-            else:
-                loop.run_until_complete(self.send_alert(title, message, level, details))
-        except Exception as e:
-            # Fallback for when no loop is available or other issues
-            # In a real app, might use 'requests' here for true sync fallback
-            logger.warning(f"Could not send async alert from sync context: {e}")
+        future = asyncio.run_coroutine_threadsafe(
+            self.send_alert(title, message, level, details), self._get_background_loop()
+        )
+        future.add_done_callback(_log_alert_failure)
+        return future
+
+
+async def _close_session(
+    session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close a session, on the loop it was created on if that is another running loop."""
+    if session.closed:
+        return
+    if loop is not None and loop.is_running() and loop is not asyncio.get_running_loop():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+        return
+    try:
+        await session.close()
+    except RuntimeError as e:
+        # Its loop is closed, so the pooled connections are already unusable
+        logger.debug(f"Discarded HTTP session from a closed event loop: {e}")
+
+
+def _log_alert_failure(future: Future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"Could not send alert from sync context: {future.exception()}")
+
+
+# Global alert manager instance
+_global_alert_manager: Optional[AlertManager] = None
+
+
+def get_alert_manager() -> AlertManager:
+    """Get or create the global alert manager."""
+    global _global_alert_manager
+    if _global_alert_manager is None:
+        _global_alert_manager = AlertManager()
+    return _global_alert_manager
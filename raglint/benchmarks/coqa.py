@@ -2,11 +2,14 @@
 CoQA (Conversational Question Answering) benchmark loader.
 """
 
-import json
+import asyncio
+import itertools
 import os
 from pathlib import Path
 from typing import Any, Optional
 
+from raglint import fast_json
+
 
 class CoQABenchmark:
     """
@@ -15,6 +18,8 @@ class CoQABenchmark:
     Focuses on conversational context and history.
     """
 
+    __slots__ = ("subset_size", "cache_dir", "name", "description")
+
     def __init__(self, subset_size: int = 50, cache_dir: Optional[str] = None):
         """
         Initialize CoQA benchmark.
@@ -27,7 +32,6 @@ class CoQABenchmark:
         self.cache_dir = cache_dir or os.path.join(Path.home(), ".cache", "raglint", "benchmarks")
         self.name = "CoQA"
         self.description = "Conversational Question Answering Challenge"
-        os.makedirs(self.cache_dir, exist_ok=True)
 
     def load(self) -> list[dict[str, Any]]:
         """
@@ -38,18 +42,26 @@ class CoQABenchmark:
         """
         cache_file = os.path.join(self.cache_dir, f"coqa_subset_{self.subset_size}.json")
 
-        if os.path.exists(cache_file):
-            with open(cache_file) as f:
-                return json.load(f)
+        try:
+            return fast_json.load_file(cache_file)
+        except FileNotFoundError:
+            pass
 
         # Generate sample data
         data = self._generate_sample_coqa()
 
-        with open(cache_file, "w") as f:
-            json.dump(data, f, indent=2)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fast_json.dump_file(data, cache_file)
 
         return data
 
+    async def load_async(self) -> list[dict[str, Any]]:
+        """
+        Async version of load().
+        Cache file I/O runs on a worker thread so the event loop stays free.
+        """
+        return await asyncio.to_thread(self.load)
+
     def _generate_sample_coqa(self) -> list[dict[str, Any]]:
         """Generate sample CoQA-style data."""
         samples = [
@@ -72,35 +84,24 @@ class CoQABenchmark:
             },
         ]
 
-        raglint_data = []
-        count = 0
-
-        # Flatten conversations into RAG queries
+        # Flatten conversations into RAG queries, cycling through them until subset_size.
         # In a real CoQA eval, we might pass history.
-        # Here we simulate RAG by concatenating history or just treating as independent queries with context.
-
-        while count < self.subset_size:
-            for sample in samples:
-                history = []
-                for turn in sample["questions"]:
-                    if count >= self.subset_size:
-                        break
-
-                    # Construct query with some context if needed, or just raw
-                    # For RAGLint, we'll just use the question and provide the story as context
-
-                    raglint_item = {
-                        "query": turn["q"],
-                        "retrieved_contexts": [sample["story"]],
-                        "ground_truth_contexts": [sample["story"]],
-                        "response": turn["a"],
-                        "ground_truth": turn["a"],
-                        "metadata": {"history": history.copy(), "source": "coqa"},
-                    }
-                    raglint_data.append(raglint_item)
-
-                    # Update history for next turn metadata
-                    history.append({"q": turn["q"], "a": turn["a"]})
-                    count += 1
-
-        return raglint_data[: self.subset_size]
+        # Here each question is an independent query with the story as context,
+        # and the earlier turns of its conversation are kept as metadata.
+        turns = [
+            (sample["story"], turn, sample["questions"][:i])
+            for sample in samples
+            for i, turn in enumerate(sample["questions"])
+        ]
+
+        return [
+            {
+                "query": turn["q"],
+                "retrieved_contexts": [story],
+                "ground_truth_contexts": [story],
+                "response": turn["a"],
+                "ground_truth": turn["a"],
+                "metadata": {"history": history, "source": "coqa"},
+            }
+            for story, turn, history in itertools.islice(itertools.cycle(turns), self.subset_size)
+        ]
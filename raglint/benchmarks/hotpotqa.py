@@ -2,11 +2,14 @@
 HotpotQA benchmark loader.
 """
 
-import json
+import asyncio
+import itertools
 import os
 from pathlib import Path
 from typing import Any, Optional
 
+from raglint import fast_json
+
 
 class HotpotQABenchmark:
     """
@@ -15,6 +18,8 @@ class HotpotQABenchmark:
     Focuses on multi-hop reasoning across multiple documents.
     """
 
+    __slots__ = ("subset_size", "cache_dir", "name", "description")
+
     def __init__(self, subset_size: int = 50, cache_dir: Optional[str] = None):
         """
         Initialize HotpotQA benchmark.
@@ -27,7 +32,6 @@ class HotpotQABenchmark:
         self.cache_dir = cache_dir or os.path.join(Path.home(), ".cache", "raglint", "benchmarks")
         self.name = "HotpotQA"
         self.description = "Dataset for diverse, explainable multi-hop question answering"
-        os.makedirs(self.cache_dir, exist_ok=True)
 
     def load(self) -> list[dict[str, Any]]:
         """
@@ -38,18 +42,26 @@ class HotpotQABenchmark:
         """
         cache_file = os.path.join(self.cache_dir, f"hotpotqa_subset_{self.subset_size}.json")
 
-        if os.path.exists(cache_file):
-            with open(cache_file) as f:
-                return json.load(f)
+        try:
+            return fast_json.load_file(cache_file)
+        except FileNotFoundError:
+            pass
 
         # Generate sample data
         data = self._generate_sample_hotpotqa()
 
-        with open(cache_file, "w") as f:
-            json.dump(data, f, indent=2)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fast_json.dump_file(data, cache_file)
 
         return data
 
+    async def load_async(self) -> list[dict[str, Any]]:
+        """
+        Async version of load().
+        Cache file I/O runs on a worker thread so the event loop stays free.
+        """
+        return await asyncio.to_thread(self.load)
+
     def _generate_sample_hotpotqa(self) -> list[dict[str, Any]]:
         """Generate sample HotpotQA-style data."""
         samples = [
@@ -83,14 +95,10 @@ class HotpotQABenchmark:
             },
         ]
 
-        raglint_data = []
-        for i in range(self.subset_size):
-            sample = samples[i % len(samples)]
-
-            # In HotpotQA, retrieved contexts should ideally be the supporting facts
-            # plus potentially some distractors.
-
-            raglint_item = {
+        # In HotpotQA, retrieved contexts should ideally be the supporting facts
+        # plus potentially some distractors.
+        return [
+            {
                 "query": sample["question"],
                 "retrieved_contexts": sample["supporting_facts"],
                 "ground_truth_contexts": sample["supporting_facts"],
@@ -98,6 +106,5 @@ class HotpotQABenchmark:
                 "ground_truth": sample["answer"],
                 "metadata": {"type": sample["type"], "source": "hotpotqa"},
             }
-            raglint_data.append(raglint_item)
-
-        return raglint_data
+            for sample in itertools.islice(itertools.cycle(samples), self.subset_size)
+        ]
@@ -4,16 +4,27 @@ Benchmark registry for RAGLint.
 Manages available benchmarks and lazy loading.
 """
 
+import functools
 from typing import Any
 
 
+@functools.cache
+def _benchmark_classes() -> dict[str, type]:
+    """Name -> benchmark class, imported on first use."""
+    from .coqa import CoQABenchmark
+    from .hotpotqa import HotpotQABenchmark
+    from .squad import SQUADBenchmark
+
+    return {"squad": SQUADBenchmark, "coqa": CoQABenchmark, "hotpotqa": HotpotQABenchmark}
+
+
 class BenchmarkRegistry:
     """Registry of available benchmarks."""
 
     @staticmethod
     def list_benchmarks() -> list[str]:
         """List all available benchmarks."""
-        return ["squad", "coqa", "hotpotqa"]
+        return list(_benchmark_classes())
 
     @staticmethod
     def load(name: str, **kwargs) -> list[dict[str, Any]]:
@@ -27,27 +38,10 @@ class BenchmarkRegistry:
         Returns:
             List of test cases
         """
-        name = name.lower()
-
-        if name == "squad":
-            from .squad import SQUADBenchmark
-
-            benchmark = SQUADBenchmark(**kwargs)
-            return benchmark.load()
-
-        elif name == "coqa":
-            from .coqa import CoQABenchmark
-
-            benchmark = CoQABenchmark(**kwargs)
-            return benchmark.load()
-
-        elif name == "hotpotqa":
-            from .hotpotqa import HotpotQABenchmark
-
-            benchmark = HotpotQABenchmark(**kwargs)
-            return benchmark.load()
-
-        else:
+        benchmark_cls = _benchmark_classes().get(name.lower())
+        if benchmark_cls is None:
             raise ValueError(
-                f"Unknown benchmark: {name}. Available: {BenchmarkRegistry.list_benchmarks()}"
+                f"Unknown benchmark: {name.lower()}. "
+                f"Available: {BenchmarkRegistry.list_benchmarks()}"
             )
+        return benchmark_cls(**kwargs).load()
@@ -1,49 +1,406 @@
-"""Simple LRU cache for LLM responses to avoid duplicate API calls."""
+"""Caches for LLM responses and metric results to avoid duplicate API calls."""
 
 import hashlib
-from typing import Any, Optional
+import mmap
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from . import fast_json
+
+# LLMCache log record header: 64-bit key, 32-bit response length
+_LOG_HEADER = struct.Struct("<QI")
+
+
+def _encode_record(key: int, response: str) -> bytes:
+    data = response.encode("utf-8")
+    return _LOG_HEADER.pack(key, len(data)) + data
 
 
 class LLMCache:
-    """Thread-safe LLM response cache."""
+    """
+    Thread-safe LLM response cache with least-recently-used eviction.
+
+    If ``path`` is given, every set() is also appended to a log file there and the
+    log is replayed on startup, so responses survive across CLI runs. Records are
+    ``<u64 key><u32 length><utf-8 response>``; a torn record at the tail (e.g. from
+    a crash mid-write) is ignored.
+    """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, path: Optional[Union[str, Path]] = None):
         self.max_size = max_size
-        self._cache: dict[str, Any] = {}
+        self.path = Path(path) if path else None
+        # Ordered oldest to most recently used
+        self._cache: OrderedDict[int, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._log_fd: Optional[int] = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._replay_log()
+            self._log_fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _make_key(self, prompt: str, model: str = "default") -> int:
+        """
+        Generate cache key from prompt and model.
+        In memory, Python's own 64-bit string hash is enough; it is computed once per
+        string object and needs no encoding. Persisted keys must match across
+        processes, where hash() is salted differently, so those use BLAKE2b.
+        """
+        if self.path is None:
+            return hash((model, prompt))
+        digest = hashlib.blake2b(f"{model}\x00{prompt}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
 
-    def _make_key(self, prompt: str, model: str = "default") -> str:
-        """Generate cache key from prompt and model."""
-        content = f"{model}:{prompt}"
-        return hashlib.sha256(content.encode()).hexdigest()
+    def _replay_log(self) -> None:
+        """Load the newest max_size entries from the log, compacting it if it has grown."""
+        try:
+            with open(self.path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    num_records = 0
+                    offset = 0
+                    while offset + _LOG_HEADER.size <= len(mm):
+                        key, length = _LOG_HEADER.unpack_from(mm, offset)
+                        start = offset + _LOG_HEADER.size
+                        if start + length > len(mm):
+                            break
+                        self._store(key, mm[start : start + length].decode("utf-8"))
+                        offset = start + length
+                        num_records += 1
+        except (OSError, ValueError):
+            # Missing or empty file (mmap rejects zero length) means nothing to load
+            return
+
+        if num_records > 2 * self.max_size:
+            self._rewrite_log()
+
+    def _rewrite_log(self) -> None:
+        """Replace the log with just the live entries via a temp file + rename."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for key, response in self._cache.items():
+                    f.write(_encode_record(key, response))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _store(self, key: int, response: Any) -> None:
+        self._cache[key] = response
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def get_with_key(self, prompt: str, model: str = "default") -> tuple[int, Optional[str]]:
+        """
+        Look up a response and also return its key, so a miss can be filled with
+        set_with_key() without hashing the prompt a second time.
+        """
+        key = self._make_key(prompt, model)
+        with self._lock:
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+            return key, response
+
+    def set_with_key(self, key: int, response: str) -> None:
+        """Cache a response under a key returned by get_with_key()."""
+        with self._lock:
+            self._store(key, response)
+            if self._log_fd is not None:
+                # One write() per record so concurrent appenders don't interleave
+                os.write(self._log_fd, _encode_record(key, response))
 
     def get(self, prompt: str, model: str = "default") -> Optional[str]:
         """Get cached response if available."""
-        key = self._make_key(prompt, model)
-        return self._cache.get(key)
+        return self.get_with_key(prompt, model)[1]
 
     def set(self, prompt: str, response: str, model: str = "default") -> None:
-        """Cache a response."""
-        if len(self._cache) >= self.max_size:
-            # Simple FIFO eviction
-            first_key = next(iter(self._cache))
-            del self._cache[first_key]
-
-        key = self._make_key(prompt, model)
-        self._cache[key] = response
+        """Cache a response, evicting the least recently used one if full."""
+        self.set_with_key(self._make_key(prompt, model), response)
 
     def clear(self) -> None:
-        """Clear all cached responses."""
-        self._cache.clear()
+        """Clear all cached responses, including the on-disk log."""
+        with self._lock:
+            self._cache.clear()
+            if self._log_fd is not None:
+                os.ftruncate(self._log_fd, 0)
 
     def size(self) -> int:
         """Return current cache size."""
         return len(self._cache)
 
 
+class SemanticCache:
+    """
+    Cache keyed by embedding similarity rather than exact text.
+
+    A lookup returns the value stored for the most similar previous key if its
+    cosine similarity is at least ``threshold``. An optional ``scope`` restricts
+    matches to entries stored with an equal scope, for parts of the input that
+    must match exactly. Candidates are found with
+    random-projection LSH: each embedding is hashed to ``num_bits`` sign bits
+    per table, and only entries in the query's bucket (or a bucket one bit
+    away) are compared exactly. More tables trade memory for recall.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Any],
+        threshold: float = 0.95,
+        max_size: int = 10_000,
+        num_bits: int = 16,
+        num_tables: int = 2,
+        seed: int = 0,
+    ):
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_size = max_size
+        self.num_bits = num_bits
+        self.num_tables = num_tables
+        self.seed = seed
+        self._embeddings: Optional[np.ndarray] = None
+        self._projection: Optional[np.ndarray] = None
+        self._values: list[Any] = []
+        self._slot_keys: list[tuple[int, ...]] = []
+        self._scopes: list[Hashable] = []
+        self._lock = threading.Lock()
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in range(num_tables)]
+        self._bit_weights = 1 << np.arange(num_bits, dtype=np.int64)
+        self._next = 0  # Ring-buffer slot to overwrite once full (FIFO eviction)
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed text and L2-normalize it so dot products are cosine similarities."""
+        vector = np.asarray(self.embed_fn(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _hash(self, vector: np.ndarray) -> tuple[int, ...]:
+        """Return one bucket key per table from the signs of random projections."""
+        if self._projection is None:
+            rng = np.random.default_rng(self.seed)
+            self._projection = rng.standard_normal(
+                (vector.shape[0], self.num_bits * self.num_tables)
+            ).astype(np.float32)
+        signs = (vector @ self._projection > 0).reshape(self.num_tables, self.num_bits)
+        return tuple(int(key) for key in signs @ self._bit_weights)
+
+    def _candidates(self, keys: tuple[int, ...]) -> list[int]:
+        """Collect slots in each table's bucket and its Hamming-distance-1 neighbors."""
+        slots: set[int] = set()
+        for table, key in zip(self._buckets, keys):
+            slots.update(table.get(key, ()))
+            for bit in range(self.num_bits):
+                slots.update(table.get(key ^ (1 << bit), ()))
+        return list(slots)
+
+    def _lookup(self, vector: np.ndarray, scope: Hashable) -> Optional[Any]:
+        if not self._values:
+            return None
+        candidates = [
+            slot for slot in self._candidates(self._hash(vector)) if self._scopes[slot] == scope
+        ]
+        if not candidates:
+            return None
+        similarities = self._embeddings[candidates] @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._values[candidates[best]]
+        return None
+
+    def _insert(self, vector: np.ndarray, value: Any, scope: Hashable) -> None:
+        count = len(self._values)
+        if self._embeddings is None:
+            capacity = min(64, self.max_size)
+            self._embeddings = np.empty((capacity, vector.shape[0]), dtype=np.float32)
+        elif count == len(self._embeddings) < self.max_size:
+            # Grow geometrically so inserts stay amortized O(d)
+            capacity = min(2 * count, self.max_size)
+            grown = np.empty((capacity, vector.shape[0]), dtype=np.float32)
+            grown[:count] = self._embeddings
+            self._embeddings = grown
+
+        keys = self._hash(vector)
+        if count < self.max_size:
+            slot = count
+            self._values.append(value)
+            self._slot_keys.append(keys)
+            self._scopes.append(scope)
+        else:
+            slot = self._next
+            self._next = (self._next + 1) % self.max_size
+            for table, old_key in zip(self._buckets, self._slot_keys[slot]):
+                bucket = table[old_key]
+                bucket.discard(slot)
+                if not bucket:
+                    del table[old_key]
+            self._values[slot] = value
+            self._slot_keys[slot] = keys
+            self._scopes[slot] = scope
+
+        self._embeddings[slot] = vector
+        for table, key in zip(self._buckets, keys):
+            table.setdefault(key, set()).add(slot)
+
+    def get(self, text: str, scope: Hashable = None) -> Optional[Any]:
+        """Get the cached value for a semantically similar text in the same scope, if any."""
+        vector = self._embed(text)
+        with self._lock:
+            return self._lookup(vector, scope)
+
+    def set(self, text: str, value: Any, scope: Hashable = None) -> None:
+        """Cache a value for the given text within a scope."""
+        vector = self._embed(text)
+        with self._lock:
+            self._insert(vector, value, scope)
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        with self._lock:
+            self._embeddings = None
+            self._values = []
+            self._slot_keys = []
+            self._scopes = []
+            self._buckets = [{} for _ in range(self.num_tables)]
+            self._next = 0
+
+    def size(self) -> int:
+        """Return current cache size."""
+        return len(self._values)
+
+
+class CachedEmbedder:
+    """
+    Filesystem-backed embedding cache wrapping a sentence-transformers model.
+
+    Each vector is stored as ``<cache_dir>/<hash[:2]>/<hash>.npy`` where the hash
+    is SHA-256 of the model name and text, so repeated runs skip the forward
+    pass for texts they have already embedded.
+    """
+
+    def __init__(self, inner: Any, model_name: str, cache_dir: Union[str, Path]):
+        self.inner = inner
+        self.model_name = model_name
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, text: str) -> Path:
+        digest = hashlib.sha256(f"{self.model_name}\x00{text}".encode()).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.npy"
+
+    def _save(self, path: Path, vector: np.ndarray) -> None:
+        """Write a vector via a temp file + rename so readers never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, vector)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts, computing only those missing from the cache in one batch."""
+        vectors: list[Optional[np.ndarray]] = [None] * len(texts)
+        misses: dict[str, list[int]] = {}
+
+        for i, text in enumerate(texts):
+            path = self._path(text)
+            try:
+                vectors[i] = np.load(path)
+            except (OSError, ValueError):
+                misses.setdefault(text, []).append(i)
+
+        if misses:
+            computed = self.inner.encode(list(misses), convert_to_numpy=True)
+            for text, vector in zip(misses, computed):
+                self._save(self._path(text), vector)
+                for i in misses[text]:
+                    vectors[i] = vector
+
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(vectors)
+
+
+class ScoreCache:
+    """
+    Persistent cache of metric scorer results in a SQLite database.
+
+    Entries are keyed by a SHA-256 digest of everything that determines a score
+    (scorer, model, prompt template and inputs; see make_key()), so re-running an
+    unchanged dataset skips prompt rendering, the LLM call and response parsing.
+    Values are stored as JSON; tuples come back as tuples.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Shared with asyncio.to_thread workers; access is serialized by _lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, value BLOB)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash JSON-serializable key parts (strings, lists of contexts, None)."""
+        return hashlib.sha256(fast_json.dumps(parts)).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the cached result for a key, if any."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM scores WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value = fast_json.loads(row[0])
+        return tuple(value) if isinstance(value, list) else value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a result under a key from make_key()."""
+        data = fast_json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scores (key, value) VALUES (?, ?)", (key, data)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        with self._lock:
+            self._conn.execute("DELETE FROM scores")
+            self._conn.commit()
+
+    def size(self) -> int:
+        """Return current cache size."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 # Global cache instance
-_global_cache = LLMCache(max_size=1000)
+_global_cache: Optional[LLMCache] = None
 
 
 def get_cache() -> LLMCache:
-    """Get the global LLM cache instance."""
+    """
+    Get the global LLM cache instance.
+    Set RAGLINT_LLM_CACHE_PATH to persist it across runs.
+    """
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = LLMCache(max_size=1000, path=os.getenv("RAGLINT_LLM_CACHE_PATH"))
     return _global_cache
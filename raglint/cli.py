@@ -1,16 +1,42 @@
+import importlib
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
+from . import fast_json
 from .config import Config
-from .core import RAGPipelineAnalyzer
 from .logging import get_logger, setup_logging
-from .reporting import generate_html_report
 
 logger = get_logger(__name__)
 
+# Heavy imports are deferred to the commands that use them (PEP 562), so
+# `raglint --help`, `plugins` and `config` start without loading the analyzer stack.
+_LAZY_ATTRS = {
+    "RAGPipelineAnalyzer": "raglint.core",
+    "generate_html_report": "raglint.reporting",
+}
+
+if TYPE_CHECKING:
+    from .core import RAGPipelineAnalyzer
+    from .reporting import generate_html_report
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Resolve a deferred name from inside this module, preferring anything already bound."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
 
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
@@ -60,8 +86,7 @@ def analyze(
 
     try:
         # Load and validate input data
-        with open(data_file) as f:
-            data = json.load(f)
+        data = fast_json.load_file(data_file)
 
         if not isinstance(data, list):
             logger.error("Input data must be a list of dictionaries.")
@@ -97,7 +122,7 @@ def analyze(
 
         # Initialize analyzer
         use_smart = smart
-        analyzer = RAGPipelineAnalyzer(use_smart_metrics=use_smart, config=config_dict)
+        analyzer = _lazy("RAGPipelineAnalyzer")(use_smart_metrics=use_smart, config=config_dict)
 
         # Check if mock mode and warn user
         if use_smart and cfg.provider == "mock":
@@ -117,20 +142,18 @@ def analyze(
         click.echo(f"Retrieval Recall: {results.retrieval_stats['recall']:.2f}")
 
         if smart:
+            import numpy as np
+
             avg_semantic = (
-                sum(results.semantic_scores) / len(results.semantic_scores)
-                if results.semantic_scores
-                else 0.0
+                float(np.mean(results.semantic_scores)) if results.semantic_scores else 0.0
             )
             avg_faithfulness = (
-                sum(results.faithfulness_scores) / len(results.faithfulness_scores)
-                if results.faithfulness_scores
-                else 0.0
+                float(np.mean(results.faithfulness_scores)) if results.faithfulness_scores else 0.0
             )
             click.echo(f"Semantic Similarity: {avg_semantic:.2f}")
             click.echo(f"Faithfulness Score: {avg_faithfulness:.2f}")
 
-        generate_html_report(results, output)
+        _lazy("generate_html_report")(results, output)
         click.echo(f"Report saved to {output}")
         logger.info(f"Analysis completed successfully. Report saved to {output}")
 
@@ -158,12 +181,13 @@ def compare(ctx, file1, file2):
     logger.info(f"Starting comparison: {file1} vs {file2}")
 
     try:
-        with open(file1) as f1, open(file2) as f2:
-            data1 = json.load(f1)
-            data2 = json.load(f2)
+        data1 = fast_json.load_file(file1)
+        data2 = fast_json.load_file(file2)
 
-        # Run quick analysis (fast mode for speed)
-        analyzer = RAGPipelineAnalyzer(use_smart_metrics=False)
+        # Run quick analysis (fast mode for speed); one analyzer serves both files.
+        # Without smart metrics both runs are CPU-bound Python, so running them on
+        # threads would not overlap under the GIL.
+        analyzer = _lazy("RAGPipelineAnalyzer")(use_smart_metrics=False)
         res1 = analyzer.analyze(data1)
         res2 = analyzer.analyze(data2)
 
@@ -254,12 +278,10 @@ def config():
 def snapshot(message, config_path):
     """Save the current configuration as a new version."""
     import asyncio
-    import hashlib
-    import json
 
-    from raglint.config import Config
+    from raglint.config import Config, config_hash
     from raglint.dashboard.database import SessionLocal, init_db
-    from raglint.dashboard.models import PipelineVersion
+    from raglint.dashboard.models import PipelineVersion, time_ordered_id
 
     # Load config
     try:
@@ -267,9 +289,7 @@ def snapshot(message, config_path):
         from dataclasses import asdict
 
         config_dict = asdict(cfg)
-        # Canonical JSON for hashing
-        config_json = json.dumps(config_dict, sort_keys=True)
-        config_hash = hashlib.sha256(config_json.encode()).hexdigest()
+        version_hash = config_hash(config_dict)
     except Exception as e:
         click.echo(f"Error loading config: {e}", err=True)
         return
@@ -281,12 +301,12 @@ def snapshot(message, config_path):
             from sqlalchemy import select
 
             result = await session.execute(
-                select(PipelineVersion).where(PipelineVersion.hash == config_hash)
+                select(PipelineVersion).where(PipelineVersion.hash == version_hash)
             )
             existing = result.scalar_one_or_none()
 
             if existing:
-                click.echo(f"Configuration version already exists: {existing.id[:8]}")
+                click.echo(f"Configuration version already exists: {existing.id}")
                 if message and not existing.description:
                     existing.description = message
                     await session.commit()
@@ -294,15 +314,13 @@ def snapshot(message, config_path):
                 return
 
             # Create new
-            import uuid
-
-            new_id = str(uuid.uuid4())
+            new_id = time_ordered_id()
             version = PipelineVersion(
-                id=new_id, hash=config_hash, config=config_dict, description=message
+                id=new_id, hash=version_hash, config=config_dict, description=message
             )
             session.add(version)
             await session.commit()
-            click.echo(f"Created new configuration version: {new_id[:8]}")
+            click.echo(f"Created new configuration version: {new_id}")
 
     asyncio.run(_save_snapshot())
 
@@ -342,7 +360,6 @@ def dashboard(host, port, reload):
 def benchmark(dataset, subset_size, output, config_path, show_progress):
     """Run RAGLint on a standard benchmark dataset."""
     try:
-        from raglint.analyzer import RAGPipelineAnalyzer
         from raglint.benchmarks import BenchmarkRegistry
         from raglint.benchmarks.utils import create_summary_metrics, display_result, save_result
         from raglint.config import Config
@@ -351,7 +368,7 @@ def benchmark(dataset, subset_size, output, config_path, show_progress):
         test_data = BenchmarkRegistry.load(dataset, subset_size=subset_size)
 
         cfg = Config.load(config_path) if config_path else Config.load()
-        analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=cfg.as_dict())
+        analyzer = _lazy("RAGPipelineAnalyzer")(use_smart_metrics=True, config=cfg.as_dict())
 
         click.echo("Running evaluation...")
         result = analyzer.analyze(test_data, show_progress=show_progress)
@@ -383,7 +400,6 @@ def generate(input_file, count, output, api_key):
     INPUT_FILE: Path to the source document.
     """
     import asyncio
-    import json
 
     from raglint.config import Config
     from raglint.generation import DatasetGenerator
@@ -412,8 +428,7 @@ def generate(input_file, count, output, api_key):
             click.echo("Failed to generate any valid QA pairs.", err=True)
             sys.exit(1)
 
-        with open(output, "w") as f:
-            json.dump(results, f, indent=2)
+        fast_json.dump_file(results, output, indent=True)
 
         click.echo(f"✅ Successfully generated {len(results)} pairs.")
         click.echo(f"Saved to: {output}")
@@ -442,8 +457,6 @@ def estimate_cost(input_file, model):
 
     INPUT_FILE: Path to the dataset (JSON).
     """
-    import json
-
     from raglint.tracking import LLM_PRICING
 
     if model not in LLM_PRICING:
@@ -453,15 +466,16 @@ def estimate_cost(input_file, model):
         sys.exit(1)
 
     try:
-        with open(input_file) as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
+        try:
+            # Only the item count matters, so avoid materializing the dataset
+            num_items = fast_json.count_items(input_file)
+        except fast_json.JSONParseError as e:
+            click.echo(f"Error: Input file is not valid JSON: {e}", err=True)
+            sys.exit(1)
+        except fast_json.NotAnArrayError:
             click.echo("Error: Input file must be a list of items.", err=True)
             sys.exit(1)
 
-        num_items = len(data)
-
         # Rough estimation:
         # Input: Query + Contexts + System Prompt (~500 tokens)
         # Output: Evaluation reasoning + Score (~200 tokens)
@@ -2,15 +2,27 @@
 Enhanced CLI for RAGLint with better UX
 """
 
-import json
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
+
+from raglint import fast_json
 
 console = Console()
 
+# HTTP session shared by marketplace requests so repeated installs reuse connections
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+    return _session
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -41,9 +53,13 @@ def eval(pipeline_file, config, output, format):
     # Load config
     cfg = Config.load(config) if config else Config()
 
-    # Load data
-    with open(pipeline_file) as f:
-        data = json.load(f)
+    # Load data (JSON array, or JSON Lines with one item per line). JSON Lines is
+    # accepted for convenience only: analyze() batches over the whole dataset and
+    # the report needs every result, so the items are collected into a list anyway.
+    if pipeline_file.endswith((".jsonl", ".ndjson")):
+        data = list(fast_json.iter_jsonl(pipeline_file))
+    else:
+        data = fast_json.load_file(pipeline_file)
 
     # Analyze
     analyzer = RAGPipelineAnalyzer(cfg)
@@ -59,8 +75,7 @@ def eval(pipeline_file, config, output, format):
 
     elif format == "json":
         output_path = output or "raglint_report.json"
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        fast_json.dump_file(results, output_path, indent=True)
         console.print(f"[green]✓[/] Report saved to: {output_path}")
 
     elif format == "pdf":
@@ -102,6 +117,8 @@ def watch_stop():
 @watch.command("status")
 def watch_status():
     """Check monitoring status"""
+    from rich.table import Table
+
     from raglint.instrumentation import Monitor
 
     monitor = Monitor()
@@ -158,6 +175,8 @@ def plugin():
 @plugin.command("list")
 def plugin_list():
     """List installed plugins"""
+    from rich.table import Table
+
     from raglint.plugins.loader import PluginLoader
 
     loader = PluginLoader()
@@ -181,25 +200,23 @@ def plugin_install(plugin_name):
     console.print(f"[yellow]Installing plugin: {plugin_name}[/]")
 
     # Download from registry
-    import requests
-
     registry_url = f"https://raglint.io/api/plugins/{plugin_name}"
 
     try:
-        resp = requests.get(registry_url)
-        if resp.status_code == 200:
-            plugin_code = resp.text
-
-            # Save to plugins dir
-            plugin_dir = Path.home() / ".raglint" / "plugins"
-            plugin_dir.mkdir(parents=True, exist_ok=True)
-
-            plugin_file = plugin_dir / f"{plugin_name}.py"
-            plugin_file.write_text(plugin_code)
-
-            console.print(f"[green]✓[/] Plugin installed: {plugin_file}")
-        else:
-            console.print("[red]✗[/] Plugin not found in marketplace")
+        with _get_session().get(registry_url, timeout=30, stream=True) as resp:
+            if resp.status_code == 200:
+                # Save to plugins dir, streaming so the plugin is never held in memory
+                plugin_dir = Path.home() / ".raglint" / "plugins"
+                plugin_dir.mkdir(parents=True, exist_ok=True)
+
+                plugin_file = plugin_dir / f"{plugin_name}.py"
+                with open(plugin_file, "wb") as f:
+                    for chunk in resp.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+
+                console.print(f"[green]✓[/] Plugin installed: {plugin_file}")
+            else:
+                console.print("[red]✗[/] Plugin not found in marketplace")
     except Exception as e:
         console.print(f"[red]✗[/] Error: {e}")
 
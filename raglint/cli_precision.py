@@ -1,14 +1,11 @@
 """CLI extension for precision mode."""
 
 import asyncio
-import json
 
 import click
 
+from raglint import fast_json
 from raglint.config import Config
-from raglint.core import RAGPipelineAnalyzer
-from raglint.metrics.enhanced_faithfulness import EnhancedFaithfulnessScorer
-from raglint.precision_mode import PrecisionMode
 
 
 @click.command()
@@ -22,76 +19,208 @@ from raglint.precision_mode import PrecisionMode
 )
 @click.option("--output", "-o", type=click.Path(), help="Output JSON file")
 @click.option("--provider", default="mock", help="LLM provider (mock/openai/ollama)")
-def analyze_precision(data_file, precision, confidence_threshold, output, provider):
+@click.option(
+    "--max-concurrent",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Maximum items scored at the same time",
+)
+@click.option(
+    "--jsonl",
+    is_flag=True,
+    help=(
+        "Write --output as JSON Lines, one result per line as soon as each item finishes "
+        "(with --workers, as soon as each worker's shard finishes)"
+    ),
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Processes to split the dataset across (CPU-bound runs)",
+)
+def analyze_precision(
+    data_file, precision, confidence_threshold, output, provider, max_concurrent, jsonl, workers
+):
     """
     Analyze RAG pipeline with optional precision mode.
 
     Example:
         raglint-precision data.json --precision --confidence-threshold 0.95
     """
+    if jsonl and not output:
+        raise click.UsageError("--jsonl requires --output")
+
     # Load config
     config = Config(provider=provider)
 
-    # Load data
-    with open(data_file) as f:
-        data = json.load(f)
+    # Load data. In single-process --precision runs, JSON Lines files are read one
+    # item at a time as workers free up; the other paths collect them into a list.
+    if data_file.endswith((".jsonl", ".ndjson")):
+        data = fast_json.iter_jsonl(data_file)
+    else:
+        data = fast_json.load_file(data_file)
 
-    if not isinstance(data, list):
-        data = [data]
+        if not isinstance(data, list):
+            data = [data]
 
     # Run analysis
-    results = asyncio.run(run_precision_analysis(data, config, precision, confidence_threshold))
+    args = (config, precision, confidence_threshold, max_concurrent)
+    if output and jsonl:
+        # Results are written and flushed as they complete rather than held until the
+        # end, so memory stays flat and an interrupted run leaves every finished line
+        with open(output, "wb") as f:
+
+            def write_line(index, result):
+                f.write(fast_json.dumps({"index": index, **result}) + b"\n")
+                f.flush()
+
+            if workers > 1:
+                run_sharded_precision_analysis(list(data), workers, *args, on_result=write_line)
+            else:
+                asyncio.run(run_precision_analysis(data, *args, on_result=write_line))
+        click.echo(f"✅ Results saved to {output}")
+        return
+
+    if workers > 1:
+        results = run_sharded_precision_analysis(list(data), workers, *args)
+    else:
+        results = asyncio.run(run_precision_analysis(data, *args))
 
     # Output results
     if output:
-        with open(output, "w") as f:
-            json.dump(results, f, indent=2)
+        fast_json.dump_file(results, output, indent=True)
         click.echo(f"✅ Results saved to {output}")
     else:
         # Print summary
         print_precision_summary(results, precision)
 
 
-async def run_precision_analysis(data, config, use_precision, confidence_threshold):
-    """Run analysis with optional precision mode."""
-    analyzer = RAGPipelineAnalyzer(config)
+async def run_precision_analysis(
+    data, config, use_precision, confidence_threshold, max_concurrent=8, on_result=None
+):
+    """
+    Run analysis with optional precision mode.
+
+    If on_result is given, on_result(index, result) is called for each item as it
+    finishes (in completion order) and results are not collected; the returned
+    list is then empty.
+    """
+    # Imported here so `--help` does not load the analyzer stack
+    from raglint.core import RAGPipelineAnalyzer
+    from raglint.metrics.enhanced_faithfulness import EnhancedFaithfulnessScorer
+    from raglint.precision_mode import PrecisionMode
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config.as_dict())
 
     if not use_precision:
-        # Standard analysis
-        return await analyzer.evaluate_batch_async(data)
+        # Standard analysis: one detailed result per item
+        items = list(data)
+        results = [None] * len(items)
+        async for index, item_result in analyzer.analyze_stream(items, max_concurrent):
+            if on_result is None:
+                results[index] = item_result["detailed"]
+            else:
+                on_result(index, item_result["detailed"])
+        return results if on_result is None else []
 
     # Precision mode analysis
     PrecisionMode(confidence_threshold=confidence_threshold)
 
-    results = []
-    for item in data:
-        query = item.get("query", "")
-        response = item.get("response", "")
-        contexts = item.get("retrieved_contexts", [])
-
-        # Use enhanced metrics
-        llm = analyzer.llm
-        enhanced_faithfulness = EnhancedFaithfulnessScorer(llm)
-
-        # Get precision score
-        faith_result = await enhanced_faithfulness.precision_score(
-            query=query,
-            response=response,
-            retrieved_contexts=contexts,
-            confidence_threshold=confidence_threshold,
-        )
-
-        results.append(
-            {
+    # Use enhanced metrics
+    enhanced_faithfulness = EnhancedFaithfulnessScorer(analyzer.llm)
+
+    # Items are LLM-bound, so max_concurrent workers score them concurrently. The
+    # bounded queue means an iterator input is only read a little ahead of scoring.
+    pending: asyncio.Queue = asyncio.Queue(maxsize=2 * max_concurrent)
+    results: dict[int, dict] = {}
+
+    async def feed() -> None:
+        for job in enumerate(data):
+            await pending.put(job)
+        for _ in range(max_concurrent):
+            await pending.put(None)
+
+    async def score() -> None:
+        while (job := await pending.get()) is not None:
+            index, item = job
+            query = item.get("query", "")
+            response = item.get("response", "")
+
+            # Get precision score
+            faith_result = await enhanced_faithfulness.precision_score(
+                query=query,
+                response=response,
+                retrieved_contexts=item.get("retrieved_contexts", []),
+                confidence_threshold=confidence_threshold,
+            )
+
+            result = {
                 "query": query,
                 "response": response,
                 "precision_results": faith_result,
                 "approved": faith_result.get("approved", False),
                 "needs_review": faith_result.get("needs_review", True),
             }
-        )
+            if on_result is None:
+                results[index] = result
+            else:
+                on_result(index, result)
+
+    tasks = [asyncio.create_task(feed())]
+    tasks += [asyncio.create_task(score()) for _ in range(max_concurrent)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # On failure, stop the remaining workers instead of leaving them blocked
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return [results[index] for index in sorted(results)]
+
+
+def _analyze_shard(shard, config, use_precision, confidence_threshold, max_concurrent):
+    """Process-pool entry point: analyze one shard on the worker's own event loop."""
+    return asyncio.run(
+        run_precision_analysis(shard, config, use_precision, confidence_threshold, max_concurrent)
+    )
+
+
+def run_sharded_precision_analysis(
+    data, workers, config, use_precision, confidence_threshold, max_concurrent=8, on_result=None
+):
+    """
+    Split data into contiguous shards and analyze each in a separate process.
+
+    asyncio only overlaps LLM waits; fact extraction (difflib) and local models
+    are CPU-bound and serialized by the GIL, so large runs on local providers
+    scale with cores instead. Each process builds its own analyzer. Results are
+    returned in input order.
+
+    If on_result is given, on_result(index, result) is called for every item of a
+    shard as soon as that shard finishes (shards in completion order), and the
+    returned list is empty.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if not data:
+        return []
+    shard_size = -(-len(data) // workers)
+    starts = range(0, len(data), shard_size)
+    args = (config, use_precision, confidence_threshold, max_concurrent)
 
-    return results
+    with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+        futures = {
+            pool.submit(_analyze_shard, data[start : start + shard_size], *args): start
+            for start in starts
+        }
+        if on_result is None:
+            return [result for future in futures for result in future.result()]
+        for future in as_completed(futures):
+            for offset, result in enumerate(future.result()):
+                on_result(futures[future] + offset, result)
+        return []
 
 
 def print_precision_summary(results, precision_mode):
@@ -4,7 +4,7 @@ This module provides confidence calculation for metric scores,
 helping identify when results are uncertain and may need human review.
 """
 
-import statistics
+import numpy as np
 
 
 class ConfidenceScorer:
@@ -33,14 +33,17 @@ class ConfidenceScorer:
         if not scores:
             return 0.0, 0.0
 
-        # Calculate average
-        avg_score = statistics.mean(scores)
+        # Calculate average. Sample lists are tiny (num_samples, 3 by default), so
+        # plain sums beat the statistics module's exact-fraction arithmetic.
+        n = len(scores)
+        avg_score = sum(scores) / n
 
-        # Calculate variance (low variance = high confidence)
-        if len(scores) == 1:
+        # Calculate sample variance (low variance = high confidence); one
+        # sample carries no spread information, so it counts as zero variance
+        if n == 1:
             variance = 0.0
         else:
-            variance = statistics.variance(scores)
+            variance = sum((x - avg_score) ** 2 for x in scores) / (n - 1)
 
         # Convert variance to confidence (inverse relationship)
         # Low variance (< 0.01) = high confidence (> 0.9)
@@ -48,6 +51,29 @@ class ConfidenceScorer:
 
         return avg_score, confidence
 
+    def calculate_confidence_batch(self, scores: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_confidence() for many items at once.
+
+        Args:
+            scores: Array of shape (num_items, num_samples), one row per item
+
+        Returns:
+            Tuple of (average_scores, confidence_scores) arrays of length num_items
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        num_items, num_samples = scores.shape
+        if num_samples == 0:
+            return np.zeros(num_items), np.zeros(num_items)
+
+        avg_scores = scores.mean(axis=1)
+        if num_samples == 1:
+            variances = np.zeros(num_items)
+        else:
+            variances = scores.var(axis=1, ddof=1)
+
+        return avg_scores, np.clip(1.0 - variances * 10, 0.0, 1.0)
+
     def is_high_confidence(self, confidence: float, threshold: float = 0.85) -> bool:
         """
         Check if confidence meets threshold.
@@ -83,6 +109,39 @@ class ConfidenceScorer:
             return "VERY_LOW"
 
 
+class OnlineConfidence:
+    """
+    Streaming counterpart of ConfidenceScorer.calculate_confidence().
+
+    Scores are folded in one at a time with Welford's algorithm, so the running
+    mean and variance need O(1) memory and no list of samples is kept.
+    """
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the running mean
+
+    def update(self, score: float) -> None:
+        """Add one score sample."""
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+
+    def finalize(self) -> tuple[float, float]:
+        """
+        Return (average_score, confidence_score), as calculate_confidence() would
+        for the same samples.
+        """
+        if self.count == 0:
+            return 0.0, 0.0
+        variance = self._m2 / (self.count - 1) if self.count > 1 else 0.0
+        return self.mean, max(0.0, min(1.0, 1.0 - (variance * 10)))
+
+
 class ConsensusScorer:
     """Calculate consensus between multiple models or evaluations."""
 
@@ -107,12 +166,16 @@ class ConsensusScorer:
                 "models": [s[0] for s in scores],
             }
 
-        # Extract scores
-        score_values = [s[1] for s in scores]
-
-        # Calculate range
-        min_score = min(score_values)
-        max_score = max(score_values)
+        # Min, max and sum in one pass; for a handful of models this is cheaper
+        # than building a list and scanning it with min(), max() and sum()
+        min_score = max_score = scores[0][1]
+        total = 0.0
+        for _, value in scores:
+            total += value
+            if value < min_score:
+                min_score = value
+            elif value > max_score:
+                max_score = value
         score_range = max_score - min_score
 
         # Check agreement
@@ -120,7 +183,9 @@ class ConsensusScorer:
 
         # Calculate consensus score (average if agreement, min if not)
         if agreement:
-            consensus_score = statistics.mean(score_values)
+            # Identical scores (e.g. one model run repeatedly) need no averaging,
+            # which would also drift in the last bit: 0.1 * 3 / 3 != 0.1
+            consensus_score = min_score if score_range == 0 else total / len(scores)
             confidence = "HIGH"
         else:
             # Use minimum score when models disagree (conservative)
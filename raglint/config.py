@@ -1,33 +1,73 @@
+import functools
+import hashlib
+import json
 import os
+import string
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+try:
+    # libyaml's C parser; PyYAML wheels bundle it on most platforms
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - exercised when PyYAML is built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
-class Config:
-    provider: str = "mock"  # mock, openai, ollama
-    openai_api_key: Optional[str] = None
-    model_name: str = "gpt-3.5-turbo"
-    db_url: Optional[str] = None  # Database connection string
-    slack_webhook_url: Optional[str] = None  # Slack webhook for alerts
-    metrics: dict[str, bool] = field(
-        default_factory=lambda: {
-            "chunking": True,
-            "retrieval": True,
-            "semantic": True,
-            "faithfulness": True,
-            "context_relevance": True,
-            "answer_relevance": True,
-        }
-    )
-    thresholds: dict[str, float] = field(
-        default_factory=lambda: {"faithfulness": 0.7, "relevance": 0.7}
-    )
-    prompts: dict[str, str] = field(
-        default_factory=lambda: {
-            "faithfulness": """
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+def _parse_bool(value: Any) -> bool:
+    """Parse a config flag; strings like "false" or "0" are false, not truthy."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"expected true/false, got {value!r}")
+
+
+# Top-level config file keys that Config.load copies onto the instance, each with
+# an optional converter, and the dict fields whose entries are merged into defaults
+_SCALAR_KEYS = (
+    ("provider", None),
+    ("openai_api_key", None),
+    ("model_name", None),
+    ("db_url", None),
+    ("slack_webhook_url", None),
+    ("max_concurrency", int),
+    ("semantic_cache", _parse_bool),
+    ("embedding_cache_dir", None),
+    ("score_cache_dir", None),
+)
+_MERGE_KEYS = ("metrics", "thresholds", "prompts")
+
+# Execution-only settings: they change how a run is executed, not what it
+# measures, so they are left out of the pipeline version hash
+_RUNTIME_KEYS = frozenset(
+    {"max_concurrency", "semantic_cache", "embedding_cache_dir", "score_cache_dir"}
+)
+
+_DEFAULT_METRICS: dict[str, bool] = {
+    "chunking": True,
+    "retrieval": True,
+    "semantic": True,
+    "faithfulness": True,
+    "context_relevance": True,
+    "answer_relevance": True,
+}
+
+_DEFAULT_THRESHOLDS: dict[str, float] = {"faithfulness": 0.7, "relevance": 0.7}
+
+# Prompt templates use str.format fields; see render_prompt()
+_DEFAULT_PROMPTS: dict[str, str] = {
+    "faithfulness": """
         You are a judge evaluating a RAG system.
         Query: {query}
         Retrieved Contexts: {context}
@@ -39,7 +79,7 @@ class Config:
         Reasoning: <step-by-step reasoning>
         Score: <0.0 or 1.0>
         """,
-            "context_relevance": """
+    "context_relevance": """
         Query: {query}
         Context: {context}
         Task: Evaluate the relevance of the Context to the Query.
@@ -49,7 +89,7 @@ class Config:
         Reasoning: <step-by-step reasoning>
         Score: <0.0-1.0>
         """,
-            "answer_relevance": """
+    "answer_relevance": """
         Query: {query}
         Response: {response}
         Task: Evaluate if the Response actually answers the Query.
@@ -59,8 +99,24 @@ class Config:
         Reasoning: <step-by-step reasoning>
         Score: <0.0-1.0>
         """,
-        }
-    )
+}
+
+
+@dataclass
+class Config:
+    provider: str = "mock"  # mock, openai, ollama
+    openai_api_key: Optional[str] = None
+    model_name: str = "gpt-3.5-turbo"
+    db_url: Optional[str] = None  # Database connection string
+    slack_webhook_url: Optional[str] = None  # Slack webhook for alerts
+    max_concurrency: int = 8  # Max in-flight LLM metric calls during async analysis
+    semantic_cache: bool = False  # Reuse faithfulness scores for near-duplicate inputs
+    embedding_cache_dir: Optional[str] = None  # Persist embeddings here across runs
+    score_cache_dir: Optional[str] = None  # Persist LLM metric scores here across runs
+    # Each instance gets its own shallow copy of the module-level defaults
+    metrics: dict[str, bool] = field(default_factory=_DEFAULT_METRICS.copy)
+    thresholds: dict[str, float] = field(default_factory=_DEFAULT_THRESHOLDS.copy)
+    prompts: dict[str, str] = field(default_factory=_DEFAULT_PROMPTS.copy)
 
     def as_dict(self) -> dict:
         """Convert config to dictionary."""
@@ -70,11 +126,19 @@ class Config:
             "model_name": self.model_name,
             "db_url": self.db_url,
             "slack_webhook_url": self.slack_webhook_url,
+            "max_concurrency": self.max_concurrency,
+            "semantic_cache": self.semantic_cache,
+            "embedding_cache_dir": self.embedding_cache_dir,
+            "score_cache_dir": self.score_cache_dir,
             "metrics": self.metrics,
             "thresholds": self.thresholds,
             "prompts": self.prompts,
         }
 
+    def render_prompt(self, name: str, **values: Any) -> str:
+        """Fill in the named prompt template; see render_prompt()."""
+        return render_prompt(self.prompts[name], **values)
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "Config":
         """
@@ -104,25 +168,24 @@ class Config:
         # Load from file if exists
         if os.path.exists(path):
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f) or {}
-
-                if "provider" in data:
-                    config.provider = data["provider"]
-                if "openai_api_key" in data:
-                    config.openai_api_key = data["openai_api_key"]
-                if "model_name" in data:
-                    config.model_name = data["model_name"]
-                if "db_url" in data:
-                    config.db_url = data["db_url"]
-                if "slack_webhook_url" in data:
-                    config.slack_webhook_url = data["slack_webhook_url"]
-                if "metrics" in data:
-                    config.metrics.update(data["metrics"])
-                if "thresholds" in data:
-                    config.thresholds.update(data["thresholds"])
-                if "prompts" in data:
-                    config.prompts.update(data["prompts"])
+                stat = os.stat(path)
+                data = _read_yaml(path, stat.st_mtime_ns, stat.st_size)
+
+                for key, convert in _SCALAR_KEYS:
+                    if key not in data:
+                        continue
+                    value = data[key]
+                    if convert:
+                        try:
+                            value = convert(value)
+                        except (TypeError, ValueError) as e:
+                            # One bad value keeps its default instead of discarding the file
+                            print(f"Warning: Ignoring invalid {key} in {path}: {e}")
+                            continue
+                    setattr(config, key, value)
+                for key in _MERGE_KEYS:
+                    if key in data:
+                        getattr(config, key).update(data[key])
             except Exception as e:
                 print(f"Warning: Failed to load config from {path}: {e}")
 
@@ -136,3 +199,57 @@ class Config:
             config.slack_webhook_url = env_slack
 
         return config
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a config file. Keyed by modification time and size so edits are picked
+    up, while repeated loads (e.g. one per dashboard request) skip the YAML parse.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_prompt(template: str) -> Optional[tuple[tuple[str, Optional[str]], ...]]:
+    """
+    Split a template into (literal, field_name) pairs once per distinct template.
+    Returns None if it uses anything beyond plain {name} fields (format specs,
+    conversions, attribute or index lookups); those go through str.format.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (not field_name.isidentifier() or format_spec or conversion):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def render_prompt(template: str, **values: Any) -> str:
+    """
+    Equivalent to template.format(**values), but the template is parsed once and
+    reused, since metrics fill the same few templates for every item.
+    """
+    parts = _compile_prompt(template)
+    if parts is None:
+        return template.format(**values)
+    pieces = []
+    for literal, field_name in parts:
+        pieces.append(literal)
+        if field_name is not None:
+            pieces.append(format(values[field_name]))
+    return "".join(pieces)
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """
+    Fingerprint a configuration dict for matching pipeline versions.
+    Hashes canonical (key-sorted) JSON, so key order does not matter. The value is
+    stored in PipelineVersion.hash, so the algorithm must not change. Execution-only
+    settings (_RUNTIME_KEYS) are ignored, so tuning them does not create a new version.
+    """
+    config = {key: value for key, value in config.items() if key not in _RUNTIME_KEYS}
+    config_json = json.dumps(config, sort_keys=True)
+    return hashlib.sha256(config_json.encode()).hexdigest()
@@ -1,9 +1,14 @@
 import asyncio
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+import numpy as np
 from tqdm.asyncio import tqdm as atqdm
 
+from .cache import ScoreCache, SemanticCache
 from .llm import LLMFactory
 from .logging import get_logger
 from .metrics import (
@@ -14,11 +19,18 @@ from .metrics import (
     ToxicityScorer,
     calculate_chunk_size_distribution,
     calculate_retrieval_metrics,
+    calculate_retrieval_metrics_batch,
     estimate_semantic_coherence,
 )
 
 logger = get_logger(__name__)
 
+# Items embedded per batch when pipelining embedding with LLM scoring
+EMBED_BATCH_SIZE = 64
+
+# Retrieval metrics averaged into AnalysisResult.retrieval_stats
+RETRIEVAL_KEYS = ("precision", "recall", "mrr", "ndcg")
+
 
 @dataclass
 class AnalysisResult:
@@ -30,6 +42,52 @@ class AnalysisResult:
     is_mock: bool = False
 
 
+@dataclass
+class AnalysisColumns:
+    """
+    Per-item analysis outputs stored column-wise in input order.
+    Numeric columns are NaN where an item has no value (e.g. no ground truth).
+    """
+
+    chunks: list[list[str]]
+    detailed: list[dict[str, Any]]
+    semantic: np.ndarray
+    faithfulness: np.ndarray
+    retrieval: np.ndarray  # One row per item, columns in RETRIEVAL_KEYS order
+
+    @classmethod
+    def allocate(cls, size: int) -> "AnalysisColumns":
+        return cls(
+            chunks=[[] for _ in range(size)],
+            detailed=[None] * size,
+            semantic=np.full(size, np.nan),
+            faithfulness=np.full(size, np.nan),
+            retrieval=np.full((size, len(RETRIEVAL_KEYS)), np.nan),
+        )
+
+    def record(self, index: int, result: dict[str, Any]) -> None:
+        """Write one analyze_stream() item result into row index."""
+        self.chunks[index] = result["chunks"]
+        self.detailed[index] = result["detailed"]
+        if result["semantic_score"] is not None:
+            self.semantic[index] = result["semantic_score"]
+        if result["faithfulness_score"] is not None:
+            self.faithfulness[index] = result["faithfulness_score"]
+        if result["basic_metrics"]:
+            self.retrieval[index] = [result["basic_metrics"][key] for key in RETRIEVAL_KEYS]
+
+    @staticmethod
+    def present(column: np.ndarray) -> list[float]:
+        """The column's values for items that have one, in input order."""
+        return column[~np.isnan(column)].tolist()
+
+    def retrieval_means(self) -> dict[str, float]:
+        """Average retrieval metrics over items with ground truth (0.0 if none)."""
+        rows = self.retrieval[~np.isnan(self.retrieval[:, 0])]
+        means = rows.mean(axis=0) if len(rows) else np.zeros(len(RETRIEVAL_KEYS))
+        return {key: float(mean) for key, mean in zip(RETRIEVAL_KEYS, means)}
+
+
 class RAGPipelineAnalyzer:
     """
     RAG Pipeline Analyzer with async support for parallel LLM processing.
@@ -38,6 +96,10 @@ class RAGPipelineAnalyzer:
     def __init__(self, use_smart_metrics: bool = False, config: Optional[dict] = None):
         self.use_smart_metrics = use_smart_metrics
         self.config = config or {}
+        self.max_concurrency = self.config.get("max_concurrency") or 8
+        self._cache: Optional[SemanticCache] = None
+        self._score_cache: Optional[ScoreCache] = None
+        self._metric_plugins: tuple[tuple[str, Any], ...] = ()
 
         if self.use_smart_metrics:
             logger.info("Initializing Smart Metrics...")
@@ -47,7 +109,9 @@ class RAGPipelineAnalyzer:
 
             prompts = self.config.get("prompts", {})
 
-            self.semantic_matcher = SemanticMatcher()
+            self.semantic_matcher = SemanticMatcher(
+                cache_dir=self.config.get("embedding_cache_dir")
+            )
             self.faithfulness_scorer = FaithfulnessScorer(
                 llm=self.llm, prompt_template=prompts.get("faithfulness")
             )
@@ -66,6 +130,22 @@ class RAGPipelineAnalyzer:
 
             self.context_precision_scorer = ContextPrecisionScorer(llm=self.llm)
             self.context_recall_scorer = ContextRecallScorer(llm=self.llm)
+
+            # Metric plugins are discovered once here rather than per item
+            from raglint.plugins.loader import PluginLoader
+
+            loader = PluginLoader.get_instance()
+            loader.load_plugins()
+            self._metric_plugins = tuple(loader.metric_plugins.items())
+
+            if self.config.get("semantic_cache"):
+                self._cache = SemanticCache(
+                    embed_fn=lambda text: self.semantic_matcher.encode([text])[0]
+                )
+            if self.config.get("score_cache_dir"):
+                self._score_cache = ScoreCache(
+                    os.path.join(self.config["score_cache_dir"], "scores.sqlite3")
+                )
         else:
             self.semantic_matcher = None
             self.faithfulness_scorer = None
@@ -75,318 +155,395 @@ class RAGPipelineAnalyzer:
     def analyze(self, data: list[dict[str, Any]], show_progress: bool = True) -> AnalysisResult:
         """
         Synchronous analysis (for backwards compatibility).
-        For better performance with smart metrics, use analyze_async().
+        Without smart metrics nothing needs awaiting, so items are scored directly.
+        With smart metrics it runs analyze_async() on a fresh loop (see _run_smart);
+        callers already inside a running loop should prefer awaiting analyze_async().
         """
-        if self.use_smart_metrics and len(data) > 5:
-            logger.info("Using async analysis for better performance with %d items", len(data))
-            # For larger datasets with smart metrics, use async
-            return asyncio.run(self.analyze_async(data, show_progress=show_progress))
-        else:
-            return self._analyze_sync(data)
+        if not self.use_smart_metrics:
+            return self._analyze_basic(data)
+        return self._run_smart(self.analyze_async(data, show_progress=show_progress))
 
     def _analyze_sync(self, data: list[dict[str, Any]]) -> AnalysisResult:
-        """Synchronous analysis implementation."""
-        all_chunks = []
-        all_retrieval_metrics = {"precision": [], "recall": [], "mrr": [], "ndcg": []}
-        coherence_scores = []
-        semantic_scores = []
-        faithfulness_scores = []
-        detailed_results = []
-
-        for item in data:
-            retrieved = item.get("retrieved_contexts", [])
-            ground_truth = item.get("ground_truth_contexts", [])
-            response = item.get("response", "")
-            query = item.get("query", "")
-
-            # Chunking Analysis
-            all_chunks.extend(retrieved)
-            item_coherence = [estimate_semantic_coherence(c) for c in retrieved]
-            coherence_scores.extend(item_coherence)
-
-            # Retrieval Analysis (Basic)
-            basic_metrics = None
-            if ground_truth:
-                basic_metrics = calculate_retrieval_metrics(retrieved, ground_truth)
-                all_retrieval_metrics["precision"].append(basic_metrics["precision"])
-                all_retrieval_metrics["recall"].append(basic_metrics["recall"])
-                all_retrieval_metrics["mrr"].append(basic_metrics["mrr"])
-                all_retrieval_metrics["ndcg"].append(basic_metrics["ndcg"])
-
-            # Smart Metrics
-            semantic_score = None
-            faithfulness_score = None
-
-            if self.use_smart_metrics:
-                if ground_truth:
-                    semantic_score = self.semantic_matcher.calculate_similarity(
-                        retrieved, ground_truth
-                    )
-                    semantic_scores.append(semantic_score)
-
-                if response:
-                    f_score, f_reasoning = self.faithfulness_scorer.score(
-                        query, retrieved, response
-                    )
-                    faithfulness_scores.append(f_score)
-                    faithfulness_score = f_score
-
-            detailed_results.append(
-                {
-                    "query": query,
-                    "metrics": basic_metrics,
-                    "coherence": item_coherence,
-                    "semantic_score": semantic_score,
-                    "faithfulness_score": (
-                        faithfulness_score if self.use_smart_metrics and response else None
-                    ),
-                }
-            )
-
-        chunk_stats = calculate_chunk_size_distribution(all_chunks)
-
-        avg_retrieval_stats = {
-            "precision": (
-                sum(all_retrieval_metrics["precision"]) / len(all_retrieval_metrics["precision"])
-                if all_retrieval_metrics["precision"]
-                else 0.0
-            ),
-            "recall": (
-                sum(all_retrieval_metrics["recall"]) / len(all_retrieval_metrics["recall"])
-                if all_retrieval_metrics["recall"]
-                else 0.0
-            ),
-            "mrr": (
-                sum(all_retrieval_metrics["mrr"]) / len(all_retrieval_metrics["mrr"])
-                if all_retrieval_metrics["mrr"]
-                else 0.0
-            ),
-            "ndcg": (
-                sum(all_retrieval_metrics["ndcg"]) / len(all_retrieval_metrics["ndcg"])
-                if all_retrieval_metrics["ndcg"]
-                else 0.0
-            ),
-        }
-
-        return AnalysisResult(
-            chunk_stats=chunk_stats,
-            retrieval_stats=avg_retrieval_stats,
-            detailed_results=detailed_results,
-            semantic_scores=semantic_scores,
-            faithfulness_scores=faithfulness_scores,
-            is_mock=self.config.get("provider") == "mock",
-        )
+        """Serial analysis: the async pipeline with a single metric call in flight."""
+        if not self.use_smart_metrics:
+            return self._analyze_basic(data)
+        return self._run_smart(self.analyze_async(data, show_progress=False, max_concurrency=1))
+
+    def _analyze_basic(self, data: list[dict[str, Any]]) -> AnalysisResult:
+        """Chunking and retrieval metrics only; no LLM, embedding model or event loop."""
+        columns = AnalysisColumns.allocate(len(data))
+        for index, basic_metrics in enumerate(self._batch_retrieval_metrics(data)):
+            columns.record(index, self._basic_item_result(data[index], basic_metrics))
+        return self._build_result(columns)
+
+    @staticmethod
+    def _run_smart(coro) -> AnalysisResult:
+        """
+        Run a smart-metric analysis coroutine to completion. Inside a running event
+        loop (Jupyter, FastAPI handlers) it runs on a fresh loop in a worker thread,
+        blocking the caller just as the synchronous path used to.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
 
     async def analyze_async(
-        self, data: list[dict[str, Any]], show_progress: bool = True
+        self,
+        data: list[dict[str, Any]],
+        show_progress: bool = True,
+        max_concurrency: Optional[int] = None,
     ) -> AnalysisResult:
         """
         Async analysis with parallel LLM processing.
         Much faster for large datasets with smart metrics.
+        max_concurrency overrides the configured limit for this run.
         """
         logger.info("Starting async analysis of %d items", len(data))
 
-        all_chunks = []
-        all_retrieval_metrics = {"precision": [], "recall": [], "mrr": [], "ndcg": []}
-        coherence_scores = []
-        semantic_scores = []
-        faithfulness_scores = []
-        detailed_results = []
-
-        # Process items in parallel with progress bar
-        if show_progress:
-            tasks = [self._process_item_async(item) for item in data]
-            results = await atqdm.gather(*tasks, desc="Analyzing", unit="item")
-        else:
-            tasks = [self._process_item_async(item) for item in data]
-            results = await asyncio.gather(*tasks)
-
-        # Aggregate results
-        for result in results:
-            if result["chunks"]:
-                all_chunks.extend(result["chunks"])
-            if result["coherence"]:
-                coherence_scores.extend(result["coherence"])
-            if result["basic_metrics"]:
-                for key in ["precision", "recall", "mrr", "ndcg"]:
-                    all_retrieval_metrics[key].append(result["basic_metrics"][key])
-            if result["semantic_score"] is not None:
-                semantic_scores.append(result["semantic_score"])
-            if result["faithfulness_score"] is not None:
-                faithfulness_scores.append(result["faithfulness_score"])
-
-            detailed_results.append(result["detailed"])
-
-        chunk_stats = calculate_chunk_size_distribution(all_chunks)
-
-        avg_retrieval_stats = {
-            "precision": (
-                sum(all_retrieval_metrics["precision"]) / len(all_retrieval_metrics["precision"])
-                if all_retrieval_metrics["precision"]
-                else 0.0
-            ),
-            "recall": (
-                sum(all_retrieval_metrics["recall"]) / len(all_retrieval_metrics["recall"])
-                if all_retrieval_metrics["recall"]
-                else 0.0
-            ),
-            "mrr": (
-                sum(all_retrieval_metrics["mrr"]) / len(all_retrieval_metrics["mrr"])
-                if all_retrieval_metrics["mrr"]
-                else 0.0
-            ),
-            "ndcg": (
-                sum(all_retrieval_metrics["ndcg"]) / len(all_retrieval_metrics["ndcg"])
-                if all_retrieval_metrics["ndcg"]
-                else 0.0
-            ),
-        }
+        # Results arrive in completion order; record each into its input-order slot
+        columns = AnalysisColumns.allocate(len(data))
+        with atqdm(
+            total=len(data), desc="Analyzing", unit="item", disable=not show_progress
+        ) as progress:
+            async for index, result in self.analyze_stream(data, max_concurrency):
+                columns.record(index, result)
+                progress.update()
 
         logger.info("Async analysis completed successfully")
+        return self._build_result(columns)
 
+    def _build_result(self, columns: AnalysisColumns) -> AnalysisResult:
+        """Summarize per-item columns into an AnalysisResult."""
+        chunk_stats = calculate_chunk_size_distribution(
+            [chunk for chunks in columns.chunks for chunk in chunks]
+        )
         return AnalysisResult(
             chunk_stats=chunk_stats,
-            retrieval_stats=avg_retrieval_stats,
-            detailed_results=detailed_results,
-            semantic_scores=semantic_scores,
-            faithfulness_scores=faithfulness_scores,
+            retrieval_stats=columns.retrieval_means(),
+            detailed_results=columns.detailed,
+            semantic_scores=columns.present(columns.semantic),
+            faithfulness_scores=columns.present(columns.faithfulness),
             is_mock=self.config.get("provider") == "mock",
         )
 
-    async def _process_item_async(self, item: dict[str, Any]) -> dict[str, Any]:
-        """Process a single item asynchronously."""
+    @staticmethod
+    def _batch_retrieval_metrics(data: list[dict[str, Any]]) -> list[Optional[dict[str, float]]]:
+        """Compute basic retrieval metrics for every item with ground truth in one pass."""
+        with_ground_truth = [i for i, item in enumerate(data) if item.get("ground_truth_contexts")]
+        batch = calculate_retrieval_metrics_batch(
+            [data[i].get("retrieved_contexts", []) for i in with_ground_truth],
+            [data[i]["ground_truth_contexts"] for i in with_ground_truth],
+        )
+
+        item_metrics: list[Optional[dict[str, float]]] = [None] * len(data)
+        for row, i in enumerate(with_ground_truth):
+            item_metrics[i] = {key: float(values[row]) for key, values in batch.items()}
+        return item_metrics
+
+    @staticmethod
+    def _cache_scope(retrieved: list[str], response: str) -> str:
+        """
+        Exact-match part of the semantic cache key. Only the query is compared by
+        embedding similarity; the response and contexts must be identical.
+        """
+        return ScoreCache.make_key(response, retrieved)
+
+    async def _ascore_faithfulness(
+        self, query: str, retrieved: list[str], response: str
+    ) -> tuple[float, str]:
+        """Score faithfulness, consulting the semantic cache before calling the LLM."""
+        if self._cache is None:
+            return await self._cached_ascore(
+                "faithfulness", self.faithfulness_scorer, query, retrieved, response
+            )
+
+        # Embedding the query is a model forward pass, so keep it off the event loop
+        scope = self._cache_scope(retrieved, response)
+        cached = await asyncio.to_thread(self._cache.get, query, scope)
+        if cached is not None:
+            return cached
+
+        result = await self._cached_ascore(
+            "faithfulness", self.faithfulness_scorer, query, retrieved, response
+        )
+        await asyncio.to_thread(self._cache.set, query, result, scope)
+        return result
+
+    async def _cached_ascore(self, name: str, scorer: Any, *args: Any) -> Any:
+        """
+        Call scorer.ascore(*args), reusing a result from the score cache when one
+        exists for the same scorer, model, prompt template and inputs.
+        """
+        if self._score_cache is None:
+            return await scorer.ascore(*args)
+
+        model = getattr(scorer.llm, "model", type(scorer.llm).__name__)
+        key = ScoreCache.make_key(name, model, getattr(scorer, "prompt_template", None), *args)
+        # SQLite I/O runs in a worker thread so cache lookups don't block the event loop
+        cached = await asyncio.to_thread(self._score_cache.get, key)
+        if cached is not None:
+            return cached
+
+        result = await scorer.ascore(*args)
+        await asyncio.to_thread(self._score_cache.set, key, result)
+        return result
+
+    @staticmethod
+    async def _bounded(coro, semaphore: Optional[asyncio.Semaphore]):
+        """Await a metric coroutine, respecting the analysis concurrency limit."""
+        if semaphore is None:
+            return await coro
+        async with semaphore:
+            return await coro
+
+    def _batch_semantic_scores(self, items: list[dict[str, Any]]) -> list[Optional[float]]:
+        """Semantic scores for items with ground truth, embedding all their texts in one batch."""
+        scores: list[Optional[float]] = [None] * len(items)
+        with_ground_truth = [i for i, item in enumerate(items) if item.get("ground_truth_contexts")]
+        batch_scores = self.semantic_matcher.calculate_similarities(
+            [
+                (items[i].get("retrieved_contexts", []), items[i]["ground_truth_contexts"])
+                for i in with_ground_truth
+            ]
+        )
+        for i, score in zip(with_ground_truth, batch_scores):
+            scores[i] = score
+        return scores
+
+    async def analyze_stream(
+        self, data: list[dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """
+        Analyze items concurrently, yielding (index, item_result) as each one completes.
+        Callers that only aggregate can consume results without holding them all.
+
+        Embedding and LLM scoring are pipelined: a producer embeds EMBED_BATCH_SIZE
+        items at a time on a worker thread and queues them, while max_concurrency
+        workers run the LLM metrics for items that are already embedded.
+        """
+        max_concurrency = max_concurrency or self.max_concurrency
+        # Bound the number of in-flight LLM metric calls across all items. The
+        # semaphore is per run, so concurrent runs on one analyzer don't share it.
+        semaphore = asyncio.Semaphore(max_concurrency)
+        item_retrieval_metrics = self._batch_retrieval_metrics(data)
+
+        num_workers = max(1, min(max_concurrency, len(data)))
+        # Backpressure: embedding runs at most two batches ahead of scoring
+        pending: asyncio.Queue = asyncio.Queue(maxsize=2 * EMBED_BATCH_SIZE)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def embed() -> None:
+            for start in range(0, len(data), EMBED_BATCH_SIZE):
+                batch = data[start : start + EMBED_BATCH_SIZE]
+                if self.use_smart_metrics:
+                    scores = await asyncio.to_thread(self._batch_semantic_scores, batch)
+                else:
+                    scores = [None] * len(batch)
+                for offset, score in enumerate(scores):
+                    await pending.put((start + offset, score))
+            for _ in range(num_workers):
+                await pending.put(None)
+
+        async def score() -> None:
+            while (job := await pending.get()) is not None:
+                index, semantic_score = job
+                result = await self._process_item_async(
+                    data[index],
+                    semantic_score=semantic_score,
+                    basic_metrics=item_retrieval_metrics[index],
+                    semaphore=semaphore,
+                )
+                await finished.put((index, result))
+
+        async def run_stage(stage) -> None:
+            # Surface stage failures to the consumer instead of leaving it waiting
+            try:
+                await stage()
+            except Exception as e:
+                await finished.put(e)
+
+        tasks = [asyncio.create_task(run_stage(embed))]
+        tasks += [asyncio.create_task(run_stage(score)) for _ in range(num_workers)]
+        try:
+            for _ in range(len(data)):
+                outcome = await finished.get()
+                if isinstance(outcome, Exception):
+                    raise outcome
+                yield outcome
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _basic_item_result(
+        self, item: dict[str, Any], basic_metrics: Optional[dict[str, float]] = None
+    ) -> dict[str, Any]:
+        """
+        Result for one item from the metrics that need no LLM or embedding model
+        (chunk coherence and retrieval). Smart metric fields are left as None.
+        """
         retrieved = item.get("retrieved_contexts", [])
         ground_truth = item.get("ground_truth_contexts", [])
-        response = item.get("response", "")
-        query = item.get("query", "")
 
         # Chunking Analysis (sync, fast)
         item_coherence = [estimate_semantic_coherence(c) for c in retrieved]
 
         # Retrieval Analysis (sync, fast)
-        basic_metrics = None
-        if ground_truth:
+        if ground_truth and basic_metrics is None:
             basic_metrics = calculate_retrieval_metrics(retrieved, ground_truth)
 
+        return {
+            "chunks": retrieved,
+            "coherence": item_coherence,
+            "basic_metrics": basic_metrics,
+            "semantic_score": None,
+            "faithfulness_score": None,
+            "plugin_metrics": {},
+            "detailed": {
+                "query": item.get("query", ""),
+                "metrics": basic_metrics,
+                "coherence": item_coherence,
+                "semantic_score": None,
+                "faithfulness_score": None,
+                "context_precision": None,
+                "context_recall": None,
+                "plugin_metrics": {},
+                "answer_relevance_score": None,
+                "toxicity_score": None,
+            },
+        }
+
+    async def _process_item_async(
+        self,
+        item: dict[str, Any],
+        semantic_score: Optional[float] = None,
+        basic_metrics: Optional[dict[str, float]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> dict[str, Any]:
+        """
+        Process a single item asynchronously.
+        semantic_score and basic_metrics may be precomputed for the whole batch;
+        semaphore, if given, bounds the item's LLM metric calls.
+        """
+        result = self._basic_item_result(item, basic_metrics)
+        if not self.use_smart_metrics:
+            return result
+
+        retrieved = result["chunks"]
+        ground_truth = item.get("ground_truth_contexts", [])
+        response = item.get("response", "")
+        query = item.get("query", "")
+
         # Smart Metrics (async, can be slow)
-        semantic_score = None
         faithfulness_score = None
         answer_relevance_score = None
         toxicity_score = None
-        context_precision = None
-        context_recall = None
         plugin_metrics = {}
 
-        if self.use_smart_metrics:
-            # Semantic similarity (embedding-based, relatively fast)
-            if ground_truth:
-                semantic_score = self.semantic_matcher.calculate_similarity(retrieved, ground_truth)
-
-            # Faithfulness (LLM-based, can be slow - make it async)
-            if response:
-                try:
-                    f_score, f_reasoning = await self.faithfulness_scorer.ascore(
-                        query, retrieved, response
-                    )
-                    faithfulness_score = f_score
-                except Exception as e:
-                    logger.error(f"Error calculating faithfulness: {e}")
-                    faithfulness_score = 0.0
-
-            # Answer Relevance
-            if response:
-                try:
-                    ar_score, ar_reasoning = await self.answer_relevance_scorer.ascore(
-                        query, response
-                    )
-                    answer_relevance_score = ar_score
-                except Exception as e:
-                    logger.error(f"Error calculating answer relevance: {e}")
-                    answer_relevance_score = 0.0
-
-            # Toxicity
-            if response:
-                try:
-                    tox_score, tox_reasoning = await self.toxicity_scorer.ascore(response)
-                    toxicity_score = tox_score
-                except Exception as e:
-                    logger.error(f"Error calculating toxicity: {e}")
-                    toxicity_score = 1.0  # Default to safe
+        # Semantic similarity (embedding-based, relatively fast)
+        if ground_truth and semantic_score is None:
+            semantic_score = self.semantic_matcher.calculate_similarity(retrieved, ground_truth)
 
+        # LLM-based metrics are independent of each other, so dispatch them together
+        metric_calls = {}
+        if response:
+            metric_calls["faithfulness"] = self._ascore_faithfulness(query, retrieved, response)
+            metric_calls["answer relevance"] = self._cached_ascore(
+                "answer_relevance", self.answer_relevance_scorer, query, response
+            )
+            metric_calls["toxicity"] = self._cached_ascore(
+                "toxicity", self.toxicity_scorer, response
+            )
+        if retrieved and response:
             # Context Precision (RAGAS-style)
-            if retrieved and response:
-                try:
-                    context_precision = await self.context_precision_scorer.ascore(
-                        query, retrieved, response
-                    )
-                except Exception as e:
-                    logger.error(f"Error calculating context precision: {e}")
-                    context_precision = None
-
+            metric_calls["context precision"] = self._cached_ascore(
+                "context_precision", self.context_precision_scorer, query, retrieved, response
+            )
+        if retrieved and ground_truth:
             # Context Recall (RAGAS-style)
-            if retrieved and ground_truth:
-                try:
-                    context_recall = await self.context_recall_scorer.ascore(
-                        query, retrieved, ground_truth
-                    )
-                except Exception as e:
-                    logger.error(f"Error calculating context recall: {e}")
-                    context_recall = None
-
-            # Calculate Plugin Metrics
-            plugin_metrics = {}
-            from raglint.plugins.loader import PluginLoader
+            metric_calls["context recall"] = self._cached_ascore(
+                "context_recall", self.context_recall_scorer, query, retrieved, ground_truth
+            )
 
-            loader = PluginLoader.get_instance()
-            loader.load_plugins()  # Ensure loaded
-
-            for name, plugin in loader.metric_plugins.items():
-                try:
-                    # Check if plugin has calculate_async (most do)
-                    if hasattr(plugin, "calculate_async"):
-                        result = await plugin.calculate_async(
-                            query=query,
-                            response=response,
-                            contexts=retrieved,
-                            ground_truth_contexts=ground_truth,
-                        )
-                        # Extract score from result dict
-                        if isinstance(result, dict):
-                            plugin_metrics[name] = result.get("score", 0.0)
-                        else:
-                            plugin_metrics[name] = float(result)
-                    else:
-                        # Fallback to sync score
-                        score = plugin.score(
-                            query=query,
-                            response=response,
-                            retrieved_contexts=retrieved,
-                            ground_truth_contexts=ground_truth,
-                        )
-                        plugin_metrics[name] = score
-                except Exception as e:
-                    logger.error(f"Error running plugin {name}: {e}")
-                    plugin_metrics[name] = 0.0
+        # Metric plugins: async ones join the same gather as the built-in metrics
+        plugin_calls = {}
+        for name, plugin in self._metric_plugins:
+            try:
+                # Check if plugin has calculate_async (most do)
+                if hasattr(plugin, "calculate_async"):
+                    plugin_calls[name] = plugin.calculate_async(
+                        query=query,
+                        response=response,
+                        contexts=retrieved,
+                        ground_truth_contexts=ground_truth,
+                    )
+                else:
+                    # Fallback to sync score
+                    plugin_metrics[name] = plugin.score(
+                        query=query,
+                        response=response,
+                        retrieved_contexts=retrieved,
+                        ground_truth_contexts=ground_truth,
+                    )
+            except Exception as e:
+                logger.error(f"Error running plugin {name}: {e}")
+                plugin_metrics[name] = 0.0
 
-        return {
-            "chunks": retrieved,
-            "coherence": item_coherence,
-            "basic_metrics": basic_metrics,
-            "semantic_score": semantic_score,
-            "faithfulness_score": faithfulness_score,
-            "plugin_metrics": plugin_metrics,  # Include plugin metrics
-            "detailed": {
-                "query": query,
-                "metrics": basic_metrics,
-                "coherence": item_coherence,
-                "semantic_score": semantic_score,
-                "faithfulness_score": (
-                    faithfulness_score if self.use_smart_metrics and response else None
-                ),
-                "context_precision": context_precision,
-                "context_recall": context_recall,
-                "plugin_metrics": plugin_metrics,  # Include plugin metrics in detailed
-                "answer_relevance_score": answer_relevance_score,
-                "toxicity_score": toxicity_score,
-            },
+        calls = [*metric_calls.values(), *plugin_calls.values()]
+        outcomes = await asyncio.gather(
+            *(self._bounded(call, semaphore) for call in calls), return_exceptions=True
+        )
+        metric_outcomes = outcomes[: len(metric_calls)]
+        plugin_outcomes = outcomes[len(metric_calls) :]
+
+        metric_results = {}
+        for metric_name, outcome in zip(metric_calls, metric_outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error calculating {metric_name}: {outcome}")
+                continue
+            metric_results[metric_name] = outcome
+
+        if response:
+            faithfulness_score = metric_results.get("faithfulness", (0.0, ""))[0]
+            answer_relevance_score = metric_results.get("answer relevance", (0.0, ""))[0]
+            # Default to safe
+            toxicity_score = metric_results.get("toxicity", (1.0, ""))[0]
+        context_precision = metric_results.get("context precision")
+        context_recall = metric_results.get("context recall")
+
+        for name, outcome in zip(plugin_calls, plugin_outcomes):
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                # Extract score from result dict
+                if isinstance(outcome, dict):
+                    plugin_metrics[name] = outcome.get("score", 0.0)
+                else:
+                    plugin_metrics[name] = float(outcome)
+            except Exception as e:
+                logger.error(f"Error running plugin {name}: {e}")
+                plugin_metrics[name] = 0.0
+
+        # Report plugins in registration order regardless of sync/async
+        plugin_metrics = {
+            name: plugin_metrics[name] for name, _ in self._metric_plugins if name in plugin_metrics
         }
+
+        result.update(
+            semantic_score=semantic_score,
+            faithfulness_score=faithfulness_score,
+            plugin_metrics=plugin_metrics,
+        )
+        result["detailed"].update(
+            semantic_score=semantic_score,
+            faithfulness_score=faithfulness_score if response else None,
+            context_precision=context_precision,
+            context_recall=context_recall,
+            plugin_metrics=plugin_metrics,
+            answer_relevance_score=answer_relevance_score,
+            toxicity_score=toxicity_score,
+        )
+        return result
@@ -47,13 +47,11 @@ class DriftDetector:
         if len(values) < 2:
             return {"drift_detected": False, "reason": "Insufficient metric data"}
 
-        # Calculate baseline (first 30% of data)
-        baseline_size = max(1, len(values) // 3)
-        baseline_mean = np.mean(values[:baseline_size])
-
-        # Calculate recent mean (last 30% of data)
-        recent_size = max(1, len(values) // 3)
-        recent_mean = np.mean(values[-recent_size:])
+        # Convert once; baseline is the first third of the data, recent the last third
+        values_arr = np.asarray(values, dtype=np.float64)
+        window = max(1, len(values_arr) // 3)
+        baseline_mean = values_arr[:window].mean()
+        recent_mean = values_arr[-window:].mean()
 
         # Calculate drift
         if baseline_mean == 0:
@@ -73,7 +71,7 @@ class DriftDetector:
             "timestamps": [
                 ts.isoformat() if isinstance(ts, datetime) else str(ts) for ts in timestamps
             ],
-            "values": [float(v) for v in values],
+            "values": values_arr.tolist(),
         }
 
 
@@ -159,19 +157,18 @@ class CohortAnalyzer:
             # Aggregate metrics across runs
             for run in cohort_runs:
                 for metric_name, value in run.get("metrics", {}).items():
-                    if metric_name not in metrics_summary:
-                        metrics_summary[metric_name] = []
-                    metrics_summary[metric_name].append(value)
+                    metrics_summary.setdefault(metric_name, []).append(value)
 
-            # Calculate statistics
+            # Calculate statistics, converting each metric's values to an array once
             stats = {"count": len(cohort_runs), "metrics": {}}
 
             for metric_name, values in metrics_summary.items():
+                arr = np.asarray(values, dtype=np.float64)
                 stats["metrics"][metric_name] = {
-                    "mean": float(np.mean(values)),
-                    "std": float(np.std(values)),
-                    "min": float(np.min(values)),
-                    "max": float(np.max(values)),
+                    "mean": float(arr.mean()),
+                    "std": float(arr.std()),
+                    "min": float(arr.min()),
+                    "max": float(arr.max()),
                 }
 
             cohort_stats[cohort_name] = stats
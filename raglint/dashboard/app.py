@@ -26,7 +26,7 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from raglint.config import Config
+from raglint.config import Config, config_hash
 from raglint.core import RAGPipelineAnalyzer
 from raglint.dashboard.analytics import CohortAnalyzer, DriftDetector
 from raglint.plugins.loader import PluginLoader, PluginRegistry
@@ -574,20 +574,16 @@ async def trigger_analysis(
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger a new analysis run."""
-    import hashlib
-    import json
-
     from sqlalchemy import select
 
     run_id = str(uuid.uuid4())
 
     # Calculate config hash
-    config_json = json.dumps(request.config, sort_keys=True)
-    config_hash = hashlib.sha256(config_json.encode()).hexdigest()
+    version_hash = config_hash(request.config)
 
     # Find matching version
     result = await db.execute(
-        select(models.PipelineVersion).where(models.PipelineVersion.hash == config_hash)
+        select(models.PipelineVersion).where(models.PipelineVersion.hash == version_hash)
     )
     version = result.scalar_one_or_none()
 
@@ -2,6 +2,8 @@
 SQLAlchemy Models for RAGLint Dashboard.
 """
 
+import secrets
+import time
 import uuid
 
 from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Text
@@ -11,6 +13,18 @@ from sqlalchemy.sql import func
 from .database import Base
 
 
+def time_ordered_id() -> str:
+    """
+    Return a UUIDv7-style id: a 48-bit Unix millisecond timestamp followed by
+    random bits, so ids sort by creation time and new rows append to the
+    primary-key index instead of landing at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -28,7 +42,7 @@ class User(Base):
 class PipelineVersion(Base):
     __tablename__ = "pipeline_versions"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=time_ordered_id)
     hash = Column(String, index=True, unique=True)  # SHA256 of config
     config = Column(JSON, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
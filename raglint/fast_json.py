@@ -0,0 +1,200 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson parses and serializes several times faster than the stdlib and works
+with bytes directly. It is optional (``pip install raglint[fast]``); without it
+these helpers fall back to the stdlib json module with the same output format.
+ijson, from the same extra, lets count_items() stream instead of parsing.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import mmap
+import os
+import threading
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised when ijson is not installed
+    ijson = None
+
+# ijson events that start a value
+_VALUE_EVENTS = frozenset({"start_map", "start_array", "string", "number", "boolean", "null"})
+
+
+class JSONParseError(ValueError):
+    """The file is not valid JSON."""
+
+
+class NotAnArrayError(ValueError):
+    """The JSON document is valid, but its top level is not an array."""
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert values neither backend handles natively (numpy arrays and scalars), plus
+    those only orjson handles (dataclasses, datetimes, UUIDs, enums), so both
+    backends produce the same output.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    # Imported here so that importing this module (e.g. for CLI startup) stays cheap
+    import numpy as np
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Copy obj with NaN and infinities replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    try:
+        return _replace_non_finite(_default(obj))
+    except TypeError:
+        return obj  # Left for json.dumps to reject
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces.
+    Output is the same with or without orjson: non-str dict keys are stringified,
+    NaN and infinities become null, and dataclasses, datetimes and numpy values
+    are converted (see _default()).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        kwargs: dict[str, Any] = {"indent": 2}
+    else:
+        kwargs = {"separators": (",", ":")}
+    try:
+        text = json.dumps(obj, default=_default, allow_nan=False, ensure_ascii=False, **kwargs)
+    except ValueError as e:
+        # Non-finite floats only; the common case skips the extra copy
+        if "Out of range float" not in str(e):
+            raise
+        text = json.dumps(
+            _replace_non_finite(obj),
+            default=_default,
+            allow_nan=False,
+            ensure_ascii=False,
+            **kwargs,
+        )
+    return text.encode("utf-8")
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+    With orjson the file is memory-mapped and parsed in place, so the contents are
+    never copied into an intermediate bytes object.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        if hasattr(os, "posix_fadvise"):
+            # The whole file is read front to back, so ask for aggressive readahead
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return loads(f.read())
+
+
+def iter_jsonl(path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Yield one parsed value per line of a JSON Lines file, skipping blank lines.
+    Only the current line is held in memory.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def count_items(path: Union[str, Path]) -> int:
+    """
+    Count the elements of a JSON file whose top level is an array.
+    With ijson installed the file is streamed and no element is kept in memory;
+    otherwise it is parsed in full. Raises JSONParseError if the file is not valid
+    JSON and NotAnArrayError if the top level is not an array, whichever backend
+    is in use.
+    """
+    if ijson is None:
+        try:
+            data = load_file(path)
+        except ValueError as e:
+            raise JSONParseError(str(e)) from e
+        if not isinstance(data, list):
+            raise NotAnArrayError("JSON document is not an array")
+        return len(data)
+
+    with open(path, "rb") as f:
+        try:
+            events = ijson.parse(f)
+            _, first_event, _ = next(events, (None, None, None))
+            if first_event is None:
+                raise JSONParseError("JSON document is empty")
+            if first_event != "start_array":
+                raise NotAnArrayError("JSON document is not an array")
+            # Top-level elements are the values whose prefix is exactly "item"
+            return sum(
+                1 for prefix, event, _ in events if prefix == "item" and event in _VALUE_EVENTS
+            )
+        except ijson.JSONError as e:
+            raise JSONParseError(str(e)) from e
+
+
+def dump_file(obj: Any, path: Union[str, Path], indent: bool = False) -> None:
+    """
+    Serialize obj and write it to a JSON file.
+    The bytes are written to a temp file next to path and renamed over it, so a
+    crash or a concurrent writer never leaves a partial file for readers.
+    """
+    data = dumps(obj, indent=indent)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -46,9 +46,9 @@ class Monitor:
 
         # Check for alerts
         if event_type == "end" and data.get("status") == "error":
-            from raglint.alerting import AlertManager
+            from raglint.alerting import get_alert_manager
 
-            AlertManager().send_alert_sync(
+            get_alert_manager().send_alert_sync(
                 title="Operation Failed",
                 message=f"Operation '{data.get('operation')}' failed.",
                 level="error",
@@ -57,9 +57,9 @@ class Monitor:
         elif (
             event_type == "end" and data.get("latency_seconds", 0) > 5.0
         ):  # Latency threshold example
-            from raglint.alerting import AlertManager
+            from raglint.alerting import get_alert_manager
 
-            AlertManager().send_alert_sync(
+            get_alert_manager().send_alert_sync(
                 title="High Latency Detected",
                 message=f"Operation '{data.get('operation')}' took {data.get('latency_seconds'):.2f}s.",
                 level="warning",
@@ -95,37 +95,57 @@ def watch(
     def decorator(func: Callable):
         operation_name = name or func.__name__
         monitor = Monitor()
-
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            trace_id = str(uuid.uuid4())
-
-            # Capture inputs
-            inputs = {}
-            if log_inputs:
-                # Simple binding of args to names if possible, otherwise just list
-                try:
-                    sig = inspect.signature(func)
-                    bound = sig.bind(*args, **kwargs)
-                    bound.apply_defaults()
-                    inputs = dict(bound.arguments)
-                except Exception:
-                    inputs = {
-                        "args": [str(a) for a in args],
-                        "kwargs": {k: str(v) for k, v in kwargs.items()},
-                    }
-
+        # Everything that doesn't change between calls is resolved once here
+        operation_tags = list(tags or [])
+        try:
+            signature = inspect.signature(func)
+        except (TypeError, ValueError):
+            signature = None
+
+        def capture_inputs(args, kwargs) -> Optional[dict[str, Any]]:
+            if not log_inputs:
+                return None
+            # Simple binding of args to names if possible, otherwise just list
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return dict(bound.arguments)
+            except Exception:
+                return {
+                    "args": [str(a) for a in args],
+                    "kwargs": {k: str(v) for k, v in kwargs.items()},
+                }
+
+        def log_start(trace_id: str, args, kwargs):
             monitor.log_event(
                 "start",
                 {
                     "trace_id": trace_id,
                     "operation": operation_name,
-                    "inputs": inputs if log_inputs else None,
-                    "tags": tags or [],
+                    "inputs": capture_inputs(args, kwargs),
+                    "tags": operation_tags,
+                },
+            )
+
+        def log_end(trace_id: str, start_time: float, result: Any, status: str, error):
+            monitor.log_event(
+                "end",
+                {
+                    "trace_id": trace_id,
+                    "operation": operation_name,
+                    "outputs": result if log_outputs and status == "success" else None,
+                    "latency_seconds": time.perf_counter() - start_time,
+                    "status": status,
+                    "error": error,
                 },
             )
 
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            trace_id = str(uuid.uuid4())
+            log_start(trace_id, args, kwargs)
+
             try:
                 result = await func(*args, **kwargs)
                 status = "success"
@@ -136,49 +156,15 @@ def watch(
                 error = str(e)
                 raise e
             finally:
-                latency = time.time() - start_time
-                monitor.log_event(
-                    "end",
-                    {
-                        "trace_id": trace_id,
-                        "operation": operation_name,
-                        "outputs": result if log_outputs and status == "success" else None,
-                        "latency_seconds": latency,
-                        "status": status,
-                        "error": error,
-                    },
-                )
+                log_end(trace_id, start_time, result, status, error)
 
             return result
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             trace_id = str(uuid.uuid4())
-
-            # Capture inputs
-            inputs = {}
-            if log_inputs:
-                try:
-                    sig = inspect.signature(func)
-                    bound = sig.bind(*args, **kwargs)
-                    bound.apply_defaults()
-                    inputs = dict(bound.arguments)
-                except Exception:
-                    inputs = {
-                        "args": [str(a) for a in args],
-                        "kwargs": {k: str(v) for k, v in kwargs.items()},
-                    }
-
-            monitor.log_event(
-                "start",
-                {
-                    "trace_id": trace_id,
-                    "operation": operation_name,
-                    "inputs": inputs if log_inputs else None,
-                    "tags": tags or [],
-                },
-            )
+            log_start(trace_id, args, kwargs)
 
             try:
                 result = func(*args, **kwargs)
@@ -190,18 +176,7 @@ def watch(
                 error = str(e)
                 raise e
             finally:
-                latency = time.time() - start_time
-                monitor.log_event(
-                    "end",
-                    {
-                        "trace_id": trace_id,
-                        "operation": operation_name,
-                        "outputs": result if log_outputs and status == "success" else None,
-                        "latency_seconds": latency,
-                        "status": status,
-                        "error": error,
-                    },
-                )
+                log_end(trace_id, start_time, result, status, error)
 
             return result
 
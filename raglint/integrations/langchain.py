@@ -1,11 +1,15 @@
 """
 LangChain integration for RAGLint.
-Provides a callback handler to automatically trace LangChain executions.
+Provides a callback handler to automatically trace LangChain executions
+and an evaluator that runs test cases through a chain and scores the outputs.
 """
 
-from typing import Any, Optional, Union
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional, Union
 from uuid import UUID
 
+from tqdm.asyncio import tqdm as atqdm
+
 try:
     from langchain_core.callbacks import BaseCallbackHandler
     from langchain_core.outputs import LLMResult
@@ -20,6 +24,9 @@ except ImportError:
 
 from raglint.instrumentation import Monitor
 
+if TYPE_CHECKING:
+    from raglint.core import AnalysisResult
+
 
 class RAGLintCallbackHandler(BaseCallbackHandler):
     """
@@ -150,3 +157,79 @@ class RAGLintCallbackHandler(BaseCallbackHandler):
             docs_info = str(documents)
 
         self.monitor.log_event("retriever_end", {"trace_id": str(run_id), "documents": docs_info})
+
+
+class LangChainEvaluator:
+    """
+    Evaluate a LangChain retrieval chain (e.g. RetrievalQA) with RAGLint.
+
+    Build the chain with return_source_documents=True so the retrieved contexts
+    come from the chain's own retrieval; otherwise the chain's retriever is
+    queried separately to recover them.
+
+    Usage:
+        from raglint.integrations.langchain import LangChainEvaluator
+
+        evaluator = LangChainEvaluator(qa_chain)
+        results = await evaluator.evaluate(
+            [{"query": "What is RAG?", "ground_truth_contexts": ["RAG combines retrieval..."]}]
+        )
+    """
+
+    def __init__(self, chain: Any, use_smart_metrics: bool = False, config: Optional[dict] = None):
+        # Imported here so importing the integration does not load the analyzer stack
+        from raglint.core import RAGPipelineAnalyzer
+
+        self.chain = chain
+        self.config = config or {}
+        self.analyzer = RAGPipelineAnalyzer(use_smart_metrics=use_smart_metrics, config=self.config)
+
+    async def evaluate(
+        self, test_cases: list[dict[str, Any]], show_progress: bool = False
+    ) -> "AnalysisResult":
+        """
+        Run the test cases through the chain concurrently, then analyze the outputs.
+        At most max_concurrency (from config) chain invocations are in flight at once.
+        """
+        semaphore = asyncio.Semaphore(self.analyzer.max_concurrency)
+
+        async def evaluate_bounded(test_case: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._evaluate_one(test_case)
+
+        tasks = [evaluate_bounded(test_case) for test_case in test_cases]
+        if show_progress:
+            items = await atqdm.gather(*tasks, desc="Running chain", unit="case")
+        else:
+            items = await asyncio.gather(*tasks)
+
+        result = await self.analyzer.analyze_async(items, show_progress=show_progress)
+        # Keep the chain outputs next to their scores
+        result.detailed_results = [
+            {**item, **detailed} for item, detailed in zip(items, result.detailed_results)
+        ]
+        return result
+
+    async def _evaluate_one(self, test_case: dict[str, Any]) -> dict[str, Any]:
+        """Invoke the chain for one test case and build a RAGLint data item."""
+        query = test_case["query"]
+        outputs = await self.chain.ainvoke({"query": query})
+
+        if isinstance(outputs, dict):
+            response = outputs.get("result", outputs.get("answer", ""))
+            documents = outputs.get("source_documents")
+        else:
+            response = str(outputs)
+            documents = None
+
+        if documents is None:
+            # The chain did not return its sources, so look them up once more
+            retriever = getattr(self.chain, "retriever", None)
+            documents = await retriever.ainvoke(query) if retriever is not None else []
+
+        return {
+            "query": query,
+            "response": response,
+            "retrieved_contexts": [getattr(doc, "page_content", str(doc)) for doc in documents],
+            "ground_truth_contexts": test_case.get("ground_truth_contexts", []),
+        }
@@ -27,14 +27,13 @@ class MockLLM(BaseLLM):
         return "Reasoning: [MOCK] The response is fully supported by the context.\nScore: 1.0"
 
     async def agenerate(self, prompt: str) -> str:
-        # Simulate async work
-        await asyncio.sleep(0.01)
+        # Yield to the event loop like a real call would, without adding latency
+        await asyncio.sleep(0)
         return self.generate(prompt)
 
     async def generate_json(self, prompt: str) -> dict:
         """Generate JSON response for mock testing."""
-        # Simulate async work
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return {"score": 0.1, "reasoning": "[MOCK] Low hallucination score"}
 
 
@@ -68,7 +67,7 @@ class OpenAI_LLM(BaseLLM):
 
         # Check cache first
         cache = get_cache()
-        cached_response = cache.get(prompt, self.model)
+        cache_key, cached_response = cache.get_with_key(prompt, self.model)
         if cached_response:
             return cached_response
 
@@ -97,7 +96,7 @@ class OpenAI_LLM(BaseLLM):
             result = response.choices[0].message.content.strip()
 
             # Cache the result
-            cache.set(prompt, result, self.model)
+            cache.set_with_key(cache_key, result)
 
             return result
         except Exception as e:
@@ -4,7 +4,7 @@ from .conciseness import ConcisenessScorer
 from .context_metrics import ContextPrecisionScorer, ContextRecallScorer
 from .faithfulness import FaithfulnessScorer
 from .relevance import AnswerRelevanceScorer, ContextRelevanceScorer
-from .retrieval import calculate_retrieval_metrics
+from .retrieval import calculate_retrieval_metrics, calculate_retrieval_metrics_batch
 from .semantic import SemanticMatcher
 from .tone import ToneScorer
 from .toxicity import ToxicityScorer
@@ -13,6 +13,7 @@ __all__ = [
     "calculate_chunk_size_distribution",
     "estimate_semantic_coherence",
     "calculate_retrieval_metrics",
+    "calculate_retrieval_metrics_batch",
     "SemanticMatcher",
     "FaithfulnessScorer",
     "ContextRelevanceScorer",
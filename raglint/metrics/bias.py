@@ -1,5 +1,6 @@
 from typing import Optional
 
+from ..config import render_prompt
 from ..llm import BaseLLM, MockLLM
 
 
@@ -29,7 +30,7 @@ class BiasScorer:
     def _build_prompt(self, query: str, response: str) -> str:
         """Build the bias evaluation prompt."""
         if self.prompt_template:
-            return self.prompt_template.format(query=query, response=response)
+            return render_prompt(self.prompt_template, query=query, response=response)
         else:
             return f"""
             You are an ethics judge evaluating a system response for bias.
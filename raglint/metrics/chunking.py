@@ -10,13 +10,14 @@ def calculate_chunk_size_distribution(chunks: list[str]) -> dict[str, Any]:
     if not chunks:
         return {"min": 0, "max": 0, "mean": 0, "median": 0, "std": 0, "count": 0}
 
-    sizes = [len(c) for c in chunks]
+    # Build the array once; passing a list to each np.* call would re-convert it every time
+    sizes = np.fromiter((len(c) for c in chunks), dtype=np.int64, count=len(chunks))
     return {
-        "min": int(np.min(sizes)),
-        "max": int(np.max(sizes)),
-        "mean": float(np.mean(sizes)),
+        "min": int(sizes.min()),
+        "max": int(sizes.max()),
+        "mean": float(sizes.mean()),
         "median": float(np.median(sizes)),
-        "std": float(np.std(sizes)),
+        "std": float(sizes.std()),
         "count": len(chunks),
     }
 
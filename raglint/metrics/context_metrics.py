@@ -7,6 +7,7 @@ Context Recall: Did we retrieve all necessary information from ground truth?
 
 from typing import Optional
 
+from raglint.config import render_prompt
 from raglint.llm import BaseLLM
 
 
@@ -60,7 +61,7 @@ class ContextPrecisionScorer:
         relevant_count = 0
 
         for chunk in retrieved_contexts:
-            prompt = self.prompt_template.format(query=query, chunk=chunk)
+            prompt = render_prompt(self.prompt_template, query=query, chunk=chunk)
 
             try:
                 result = await self.llm.generate_json(prompt)
@@ -147,7 +148,9 @@ class ContextRecallScorer:
             statements.extend(self._split_sentences(gt))
 
         for statement in statements:
-            prompt = self.prompt_template.format(statement=statement, contexts=retrieved_text)
+            prompt = render_prompt(
+                self.prompt_template, statement=statement, contexts=retrieved_text
+            )
 
             try:
                 result = await self.llm.generate_json(prompt)
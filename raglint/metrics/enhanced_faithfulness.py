@@ -8,7 +8,7 @@ from typing import Any, Optional
 
 from raglint.confidence import ConfidenceScorer
 from raglint.fact_extraction import FactExtractor
-from raglint.metrics.context_metrics import FaithfulnessScorer
+from raglint.metrics.faithfulness import FaithfulnessScorer
 
 
 class EnhancedFaithfulnessScorer(FaithfulnessScorer):
@@ -51,7 +51,7 @@ class EnhancedFaithfulnessScorer(FaithfulnessScorer):
         scores = []
         for _ in range(self.num_samples):
             try:
-                score = await self.ascore(
+                score, _ = await self.ascore(
                     query=query, response=response, retrieved_contexts=retrieved_contexts
                 )
                 scores.append(score)
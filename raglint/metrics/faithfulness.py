@@ -1,5 +1,6 @@
 from typing import Optional
 
+from ..config import render_prompt
 from ..llm import BaseLLM, MockLLM
 
 
@@ -33,7 +34,9 @@ class FaithfulnessScorer:
         context_text = "\n".join(retrieved_contexts)
 
         if self.prompt_template:
-            return self.prompt_template.format(query=query, context=context_text, response=response)
+            return render_prompt(
+                self.prompt_template, query=query, context=context_text, response=response
+            )
         else:
             # Fallback default prompt
             return f"""
@@ -1,5 +1,6 @@
 from typing import Optional, Union
 
+from ..config import render_prompt
 from ..llm import BaseLLM, MockLLM
 
 
@@ -28,7 +29,7 @@ class AnswerRelevanceScorer:
 
     def _build_prompt(self, query: str, response: str) -> str:
         if self.prompt_template:
-            return self.prompt_template.format(query=query, response=response)
+            return render_prompt(self.prompt_template, query=query, response=response)
 
         return f"""
         You are a judge evaluating a RAG system.
@@ -100,7 +101,7 @@ class ContextRelevanceScorer:
 
     def _build_prompt(self, query: str, context: str) -> str:
         if self.prompt_template:
-            return self.prompt_template.format(query=query, context=context)
+            return render_prompt(self.prompt_template, query=query, context=context)
 
         return f"""
         You are a judge evaluating a RAG system.
@@ -51,3 +51,72 @@ def calculate_retrieval_metrics(retrieved: list[str], ground_truth: list[str]) -
     ndcg = calculate_ndcg(retrieved, ground_truth, k=5)
 
     return {"precision": precision, "recall": recall, "mrr": mrr, "ndcg": ndcg}
+
+
+def calculate_retrieval_metrics_batch(
+    retrieved_lists: list[list[str]], ground_truth_lists: list[list[str]], k: int = 5
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized calculate_retrieval_metrics() over many items at once.
+
+    Documents are mapped to integer ids and each item's retrieved list is padded
+    into an (N, K) matrix, so hits, precision, recall, MRR and NDCG@k are computed
+    with array operations instead of per-item Python loops.
+
+    Returns a dict of per-item arrays keyed by metric name.
+    """
+    n_items = len(retrieved_lists)
+    if n_items == 0:
+        empty = np.zeros(0)
+        return {"precision": empty, "recall": empty, "mrr": empty, "ndcg": empty}
+
+    ids: dict[str, int] = {}
+    width = max((len(retrieved) for retrieved in retrieved_lists), default=0)
+    retrieved_ids = np.full((n_items, max(width, 1)), -1, dtype=np.int64)
+    for row, retrieved in enumerate(retrieved_lists):
+        retrieved_ids[row, : len(retrieved)] = [ids.setdefault(doc, len(ids)) for doc in retrieved]
+
+    gt_rows, gt_ids = [], []
+    for row, ground_truth in enumerate(ground_truth_lists):
+        for doc in ground_truth:
+            gt_rows.append(row)
+            gt_ids.append(ids.setdefault(doc, len(ids)))
+    gt_rows = np.asarray(gt_rows, dtype=np.int64)
+    gt_ids = np.asarray(gt_ids, dtype=np.int64)
+
+    # Offset ids by row so membership tests never match across items
+    vocab = len(ids) + 1
+    row_offsets = np.arange(n_items, dtype=np.int64)[:, None] * vocab
+    valid = retrieved_ids >= 0
+    retrieved_keys = np.where(valid, retrieved_ids + row_offsets, -1)
+    gt_keys = np.unique(gt_rows * vocab + gt_ids)
+    hits = valid & np.isin(retrieved_keys, gt_keys)
+
+    # Precision/recall use set semantics: count each distinct document once
+    _, first_index = np.unique(retrieved_keys.ravel(), return_index=True)
+    first_occurrence = np.zeros(retrieved_keys.size, dtype=bool)
+    first_occurrence[first_index] = True
+    first_occurrence = first_occurrence.reshape(retrieved_keys.shape) & valid
+
+    true_positives = (hits & first_occurrence).sum(axis=1)
+    unique_retrieved = first_occurrence.sum(axis=1)
+    unique_gt = np.bincount(gt_keys // vocab, minlength=n_items)
+    gt_counts = np.bincount(gt_rows, minlength=n_items)
+    has_gt = unique_gt > 0
+
+    precision = np.divide(
+        true_positives,
+        unique_retrieved,
+        out=np.zeros(n_items),
+        where=has_gt & (unique_retrieved > 0),
+    )
+    recall = np.divide(true_positives, unique_gt, out=np.zeros(n_items), where=has_gt)
+    mrr = np.where(has_gt & hits.any(axis=1), 1.0 / (hits.argmax(axis=1) + 1), 0.0)
+
+    discounts = 1.0 / np.log2(np.arange(k) + 2)
+    top_k = hits[:, :k]
+    dcg = (top_k * discounts[: top_k.shape[1]]).sum(axis=1)
+    ideal_dcg = np.concatenate([[0.0], np.cumsum(discounts)])[np.minimum(gt_counts, k)]
+    ndcg = np.divide(dcg, ideal_dcg, out=np.zeros(n_items), where=has_gt & (ideal_dcg > 0))
+
+    return {"precision": precision, "recall": recall, "mrr": mrr, "ndcg": ndcg}
@@ -1,4 +1,7 @@
 import logging
+from typing import Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +31,40 @@ def _ensure_dependencies():
 class SemanticMatcher:
     """Calculate semantic similarity between texts using embeddings."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-        """Initialize with a sentence transformer model."""
-        SentenceTransformer_cls, _ = _ensure_dependencies()
-        self.model = SentenceTransformer_cls(model_name)
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_dir: Optional[str] = None):
+        """
+        Initialize with a sentence transformer model.
+
+        The model is loaded on first use, so runs that never embed anything
+        (e.g. mock runs without ground truth) skip the load entirely.
+        If cache_dir is given, embeddings are persisted there and reused across runs.
+        """
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self._model = None
+        self.embedder = None
+
+    @property
+    def model(self):
+        """The sentence transformer, loaded on first access."""
+        if self._model is None:
+            SentenceTransformer_cls, _ = _ensure_dependencies()
+            self._model = SentenceTransformer_cls(self.model_name)
+            if self.cache_dir:
+                from raglint.cache import CachedEmbedder
+
+                self.embedder = CachedEmbedder(self._model, self.model_name, self.cache_dir)
+        return self._model
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts as a (len(texts), dim) numpy array, going through the on-disk
+        cache when one is configured.
+        """
+        model = self.model
+        if self.embedder is not None:
+            return self.embedder.embed(texts)
+        return model.encode(texts, batch_size=64, convert_to_numpy=True)
 
     def calculate_similarity(
         self, retrieved_contexts: list[str], ground_truth_contexts: list[str]
@@ -39,24 +72,40 @@ class SemanticMatcher:
         """
         Calculates the maximum semantic similarity between retrieved contexts and ground truth.
         Returns a score between 0.0 and 1.0.
+        For each ground truth context, take its best cosine match among the retrieved
+        contexts, then average those maxima.
         """
-        if not retrieved_contexts or not ground_truth_contexts:
-            return 0.0
-
-        _, util_module = _ensure_dependencies()
-
-        # Encode all contexts
-        retrieved_embeddings = self.model.encode(retrieved_contexts, convert_to_tensor=True)
-        gt_embeddings = self.model.encode(ground_truth_contexts, convert_to_tensor=True)
-
-        # Calculate cosine similarity matrix
-        cosine_scores = util_module.cos_sim(retrieved_embeddings, gt_embeddings)
+        return self.calculate_similarities([(retrieved_contexts, ground_truth_contexts)])[0]
 
-        # For each ground truth, find the best match in retrieved contexts
-        # Max similarity for each ground truth item across all retrieved items
-        max_scores_per_gt = cosine_scores.max(dim=0).values
+    def calculate_similarities(self, pairs: list[tuple[list[str], list[str]]]) -> list[float]:
+        """
+        Batch version of calculate_similarity() for many (retrieved, ground truth) pairs.
+        Every distinct text is embedded in a single encode call and L2-normalized
+        once, so each pair's cosine matrix is a single float32 matrix product.
+        """
+        texts = list(
+            dict.fromkeys(
+                text
+                for retrieved, ground_truth in pairs
+                if retrieved and ground_truth
+                for text in (*retrieved, *ground_truth)
+            )
+        )
+        if not texts:
+            return [0.0] * len(pairs)
 
-        # Average the best matches
-        mean_score = float(max_scores_per_gt.mean())
+        embeddings = np.asarray(self.encode(texts), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.maximum(norms, 1e-8)
+        index = {text: i for i, text in enumerate(texts)}
 
-        return mean_score
+        scores = []
+        for retrieved, ground_truth in pairs:
+            if not retrieved or not ground_truth:
+                scores.append(0.0)
+                continue
+            retrieved_embeddings = embeddings[[index[text] for text in retrieved]]
+            gt_embeddings = embeddings[[index[text] for text in ground_truth]]
+            cosine_scores = retrieved_embeddings @ gt_embeddings.T
+            scores.append(float(cosine_scores.max(axis=0).mean()))
+        return scores
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from ..config import render_prompt
 from ..llm import BaseLLM, MockLLM
 
 
@@ -30,7 +31,7 @@ class ToxicityScorer:
 
     def _build_prompt(self, response: str) -> str:
         if self.prompt_template:
-            return self.prompt_template.format(response=response)
+            return render_prompt(self.prompt_template, response=response)
 
         return f"""
         You are a content safety moderator.
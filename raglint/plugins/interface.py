@@ -10,6 +10,10 @@ from abc import ABC, abstractmethod
 class BasePlugin(ABC):
     """Base class for all RAGLint plugins."""
 
+    # Empty slots all the way up the hierarchy let a plugin declare __slots__
+    # and drop its per-instance __dict__. Plugins that don't are unaffected.
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -35,6 +39,8 @@ class LLMPlugin(BasePlugin):
     by setting `provider: <plugin_name>` in the config.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def generate(self, prompt: str) -> str:
         """Synchronous generation."""
@@ -51,6 +57,8 @@ class MetricPlugin(BasePlugin):
     Interface for custom evaluation metrics.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def score(self, **kwargs) -> float:
         """Calculate the metric score."""
@@ -69,6 +77,8 @@ class PluginInterface(MetricPlugin):
     Provides default implementations for synchronous MetricPlugin methods.
     """
 
+    __slots__ = ()
+
     @property
     def metric_type(self) -> str:
         return "quality"
@@ -1 +1,2 @@
-from .html_generator import generate_html_report
+from .html_generator import generate_html_report, generate_html_report_async
+from .text import Reporter
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from jinja2 import Environment, FileSystemLoader
@@ -21,3 +22,11 @@ def generate_html_report(results: dict, output_file: str = "raglint_report.html"
         f.write(html_content)
 
     print(f"Report generated at: {output_file}")
+
+
+async def generate_html_report_async(results: dict, output_file: str = "raglint_report.html"):
+    """
+    Async version of generate_html_report().
+    Renders and writes the report on a worker thread so the event loop stays free.
+    """
+    await asyncio.to_thread(generate_html_report, results, output_file)
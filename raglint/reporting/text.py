@@ -0,0 +1,42 @@
+"""
+Buffered plain-text output for result summaries.
+"""
+
+import sys
+from typing import Optional, TextIO
+
+
+class Reporter:
+    """
+    Collects report lines and writes them to the stream in a single call.
+
+    Usage:
+        r = Reporter()
+        r.line("Results")
+        r.line(f"  precision: {precision:.2f}")
+        r.flush()
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        # None means sys.stdout, looked up at flush time so redirection still applies
+        self.stream = stream
+        self._lines: list[str] = []
+
+    def line(self, text: str = "") -> None:
+        """Queue one line of output."""
+        self._lines.append(text)
+
+    def flush(self) -> None:
+        """Write all queued lines and clear the buffer."""
+        if not self._lines:
+            return
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(self._lines) + "\n")
+        stream.flush()
+        self._lines.clear()
+
+    def __enter__(self) -> "Reporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
@@ -2,6 +2,7 @@
 Cost and latency tracking for RAG evaluation.
 """
 
+import math
 import time
 from dataclasses import dataclass, field
 from typing import Optional
@@ -21,9 +22,22 @@ LLM_PRICING = {
 }
 
 
+# Relative accuracy of percentiles once latencies are folded into the histogram
+_BUCKET_GAMMA = 1.02
+_LOG_GAMMA = math.log(_BUCKET_GAMMA)
+# Latencies below this are treated as zero for bucketing
+_MIN_BUCKET_LATENCY = 1e-9
+
+
 @dataclass
 class LatencyStats:
-    """Statistics for latency tracking."""
+    """
+    Statistics for latency tracking.
+
+    Latencies are kept exactly up to max_exact_samples. Past that they are folded
+    into a log-bucketed histogram so memory stays bounded on long-running trackers
+    and percentiles are within ~1% of the true value.
+    """
 
     total_time: float = 0.0
     num_calls: int = 0
@@ -33,26 +47,55 @@ class LatencyStats:
     p95_latency: float = 0.0
     p99_latency: float = 0.0
     latencies: list[float] = field(default_factory=list)
+    max_exact_samples: int = 10_000
+    buckets: dict[int, int] = field(default_factory=dict)
 
     def add_latency(self, latency: float):
         """Add a latency measurement."""
-        self.latencies.append(latency)
         self.total_time += latency
         self.num_calls += 1
         self.min_latency = min(self.min_latency, latency)
         self.max_latency = max(self.max_latency, latency)
 
+        if self.buckets:
+            self._add_to_bucket(latency)
+            return
+
+        self.latencies.append(latency)
+        if len(self.latencies) >= self.max_exact_samples:
+            for sample in self.latencies:
+                self._add_to_bucket(sample)
+            self.latencies = []
+
+    def _add_to_bucket(self, latency: float):
+        key = math.ceil(math.log(max(latency, _MIN_BUCKET_LATENCY)) / _LOG_GAMMA)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def _bucket_percentile(self, rank: int) -> float:
+        """Approximate value of the sample at the given 0-based rank."""
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                value = 2 * _BUCKET_GAMMA**key / (_BUCKET_GAMMA + 1)
+                return min(max(value, self.min_latency), self.max_latency)
+        return self.max_latency
+
     def calculate_percentiles(self):
         """Calculate percentile latencies."""
-        if not self.latencies:
+        n = self.num_calls
+        if n == 0:
             return
 
-        sorted_latencies = sorted(self.latencies)
-        n = len(sorted_latencies)
+        if self.buckets:
+            percentile = self._bucket_percentile
+        else:
+            sorted_latencies = sorted(self.latencies)
+            percentile = sorted_latencies.__getitem__
 
-        self.p50_latency = sorted_latencies[int(n * 0.5)]
-        self.p95_latency = sorted_latencies[int(n * 0.95)] if n > 20 else self.max_latency
-        self.p99_latency = sorted_latencies[int(n * 0.99)] if n > 100 else self.max_latency
+        self.p50_latency = percentile(int(n * 0.5))
+        self.p95_latency = percentile(int(n * 0.95)) if n > 20 else self.max_latency
+        self.p99_latency = percentile(int(n * 0.99)) if n > 100 else self.max_latency
 
     @property
     def avg_latency(self) -> float:
@@ -183,7 +226,7 @@ class PerformanceTracker:
             "operations": {
                 op_name: {
                     "avg_latency_ms": round(stats.avg_latency * 1000, 2),
-                    "p95_latency_ms": round(stats.p95_latency * 1000, 2) if stats.latencies else 0,
+                    "p95_latency_ms": round(stats.p95_latency * 1000, 2) if stats.num_calls else 0,
                     "num_calls": stats.num_calls,
                 }
                 for op_name, stats in self.operation_latencies.items()
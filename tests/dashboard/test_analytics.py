@@ -0,0 +1,43 @@
+"""
+Tests for dashboard drift detection and cohort analysis.
+"""
+
+import pytest
+
+from raglint.dashboard.analytics import CohortAnalyzer, DriftDetector
+
+
+def test_detect_drift_compares_first_and_last_thirds():
+    runs = [
+        {"timestamp": i, "metrics": {"faithfulness": value}}
+        for i, value in enumerate([0.9, 0.9, 0.8, 0.8, 0.6, 0.6])
+    ]
+
+    result = DriftDetector().detect_drift(runs, "faithfulness")
+
+    assert result["baseline_mean"] == pytest.approx(0.9)
+    assert result["recent_mean"] == pytest.approx(0.6)
+    assert result["drift_detected"]
+    assert result["direction"] == "decrease"
+    assert result["values"] == [0.9, 0.9, 0.8, 0.8, 0.6, 0.6]
+
+
+def test_analyze_cohorts_summarizes_each_metric():
+    runs = [
+        {"config_hash": "a", "metrics": {"faithfulness": 0.5, "recall": 1}},
+        {"config_hash": "a", "metrics": {"faithfulness": 1.0}},
+        {"config_hash": "b", "metrics": {"faithfulness": 0.2}},
+    ]
+
+    result = CohortAnalyzer().analyze_cohorts(runs)
+
+    cohort_a = result["cohorts"]["a"]
+    assert cohort_a["count"] == 2
+    assert cohort_a["metrics"]["faithfulness"] == {
+        "mean": 0.75,
+        "std": 0.25,
+        "min": 0.5,
+        "max": 1.0,
+    }
+    assert cohort_a["metrics"]["recall"] == {"mean": 1.0, "std": 0.0, "min": 1.0, "max": 1.0}
+    assert result["num_cohorts"] == 2
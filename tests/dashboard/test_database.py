@@ -51,3 +51,20 @@ def test_get_db_session():
     # Should return an async generator
     db_gen = get_db()
     assert db_gen is not None
+
+
+def test_pipeline_version_ids_are_time_ordered():
+    """Test that pipeline version ids are UUIDv7 and sort by creation time."""
+    import uuid
+    from unittest.mock import patch
+
+    from raglint.dashboard.models import time_ordered_id
+
+    # One id per consecutive millisecond; order must not depend on the random bits
+    timestamps_ns = [(1_700_000_000_000 + ms) * 1_000_000 for ms in range(100)]
+    with patch("raglint.dashboard.models.time.time_ns", side_effect=timestamps_ns):
+        ids = [time_ordered_id() for _ in timestamps_ns]
+
+    assert all(uuid.UUID(i).version == 7 for i in ids)
+    assert ids == sorted(ids)
+    assert len({time_ordered_id() for _ in range(1000)}) == 1000
@@ -1,4 +1,6 @@
 """Integration test for LangChain integration."""
+from types import SimpleNamespace
+
 import pytest
 
 try:
@@ -35,13 +37,13 @@ async def test_langchain_integration():
     )
     
     # Create evaluator
-    evaluator = LangChainEvaluator(qa_chain)
+    evaluator = LangChainEvaluator(qa_chain, use_smart_metrics=True, config={"provider": "mock"})
     
     # Test cases
     test_cases = [
         {
             "query": "What is Python?",
-            "ground_truth": "Python is a programming language."
+            "ground_truth_contexts": ["Python is a programming language."]
         }
     ]
     
@@ -49,9 +51,10 @@ async def test_langchain_integration():
     results = await evaluator.evaluate(test_cases)
     
     # Verify results
-    assert len(results) == 1
-    assert "faithfulness" in results[0]
-    assert "answer_relevance" in results[0]
+    assert len(results.detailed_results) == 1
+    assert len(results.faithfulness_scores) == 1
+    assert results.detailed_results[0]["response"] == responses[0]
+    assert results.detailed_results[0]["answer_relevance_score"] is not None
 
 
 @pytest.mark.skipif(not LANGCHAIN_AVAILABLE, reason="LangChain not installed")
@@ -72,3 +75,44 @@ def test_langchain_evaluator_init():
     # Verify initialization
     assert evaluator.chain == qa_chain
     assert evaluator.config is not None
+
+
+class StubChain:
+    """Minimal async chain returning an answer and its source documents."""
+
+    def __init__(self, answer, sources):
+        self.answer = answer
+        self.sources = sources
+        self.queries = []
+
+    async def ainvoke(self, inputs):
+        self.queries.append(inputs["query"])
+        documents = [SimpleNamespace(page_content=text) for text in self.sources]
+        return {"result": self.answer, "source_documents": documents}
+
+
+@pytest.mark.asyncio
+async def test_langchain_evaluator_with_stub_chain():
+    """Test LangChainEvaluator.evaluate() end to end without LangChain installed."""
+    from raglint.integrations.langchain import LangChainEvaluator
+
+    chain = StubChain("Python is a programming language.", ["Python is a programming language."])
+    evaluator = LangChainEvaluator(chain, use_smart_metrics=True, config={"provider": "mock"})
+
+    test_cases = [
+        {
+            "query": "What is Python?",
+            "ground_truth_contexts": ["Python is a programming language."],
+        },
+        {"query": "Who made Python?"},
+    ]
+    results = await evaluator.evaluate(test_cases)
+
+    assert chain.queries == ["What is Python?", "Who made Python?"]
+    assert len(results.detailed_results) == 2
+    assert len(results.faithfulness_scores) == 2
+    first, second = results.detailed_results
+    assert first["retrieved_contexts"] == ["Python is a programming language."]
+    assert first["response"] == "Python is a programming language."
+    assert first["faithfulness_score"] is not None
+    assert second["ground_truth_contexts"] == []
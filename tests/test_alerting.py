@@ -0,0 +1,162 @@
+"""
+Tests for the alerting module.
+"""
+
+import pytest
+
+import raglint.alerting
+from raglint.alerting import AlertManager, get_alert_manager
+
+
+def test_alert_manager_disabled_without_webhook(monkeypatch):
+    """Test alerts are disabled when no Slack webhook is configured."""
+    monkeypatch.delenv("SLACK_WEBHOOK_URL", raising=False)
+    manager = AlertManager()
+
+    assert manager.enabled is False
+    assert manager.send_alert_sync("title", "message") is None
+
+
+def test_alert_manager_reads_webhook_from_env(monkeypatch):
+    """Test the webhook URL falls back to the SLACK_WEBHOOK_URL variable."""
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.example.com/abc")
+
+    assert AlertManager().enabled is True
+    assert AlertManager("https://hooks.example.com/xyz").slack_webhook_url.endswith("xyz")
+
+
+def test_get_alert_manager_returns_shared_instance(monkeypatch):
+    """Test get_alert_manager builds the instance once and reuses it."""
+    monkeypatch.setattr(raglint.alerting, "_global_alert_manager", None)
+
+    assert get_alert_manager() is get_alert_manager()
+
+
+@pytest.mark.asyncio
+async def test_alert_manager_reuses_http_session():
+    """Test one HTTP session is shared across alerts on the same event loop."""
+    manager = AlertManager("https://hooks.example.com/abc")
+
+    session = await manager._get_session()
+    assert await manager._get_session() is session
+
+    await manager.close()
+    assert session.closed
+    assert await manager._get_session() is not session
+    await manager.close()
+
+
+def test_alert_manager_closes_session_from_previous_loop():
+    """Test a session left over from an earlier event loop is closed, not leaked."""
+    import asyncio
+
+    manager = AlertManager("https://hooks.example.com/abc")
+    first = asyncio.run(manager._get_session())
+    second = asyncio.run(manager._get_session())
+
+    assert first.closed
+    assert second is not first
+    asyncio.run(manager.close())
+
+
+@pytest.mark.asyncio
+async def test_slack_payload(monkeypatch):
+    """Test the Slack payload carries level color, title and detail fields."""
+    import json
+    from contextlib import asynccontextmanager
+    from unittest.mock import MagicMock
+
+    sent = {}
+
+    @asynccontextmanager
+    async def post(url, data, headers):
+        sent.update(url=url, body=json.loads(data), headers=headers)
+        yield MagicMock(status=200)
+
+    manager = AlertManager("https://hooks.example.com/abc")
+
+    async def get_session():
+        return MagicMock(post=post)
+
+    monkeypatch.setattr(manager, "_get_session", get_session)
+
+    await manager.send_alert("Failure", "It broke", level="error", details={"Trace ID": 42})
+
+    attachment = sent["body"]["attachments"][0]
+    assert sent["headers"]["Content-Type"] == "application/json"
+    assert attachment["color"] == "#ff0000"
+    assert attachment["title"] == "RAGLint Alert: Failure"
+    assert attachment["fields"] == [{"title": "Trace ID", "value": "42", "short": True}]
+
+
+@pytest.mark.asyncio
+async def test_send_alert_sync_runs_on_background_loop(monkeypatch):
+    """Test sync alerts are delivered on the background loop, even from inside a loop."""
+    import asyncio
+    import threading
+
+    calls = []
+
+    async def fake_send_alert(title, message, level="info", details=None):
+        calls.append((title, threading.current_thread().name))
+
+    manager = AlertManager("https://hooks.example.com/abc")
+    monkeypatch.setattr(manager, "send_alert", fake_send_alert)
+
+    first = manager.send_alert_sync("one", "message")
+    second = manager.send_alert_sync("two", "message")
+    await asyncio.wrap_future(first)
+    await asyncio.wrap_future(second)
+
+    assert calls == [("one", "raglint-alerts"), ("two", "raglint-alerts")]
+    assert manager._get_background_loop() is manager._bg_loop
+
+
+def test_shutdown_waits_for_pending_sync_alerts(monkeypatch):
+    """Test shutdown() lets queued alerts finish, closes the session and stops the loop."""
+    import asyncio
+
+    delivered = []
+
+    async def slow_send_alert(title, message, level="info", details=None):
+        await manager._get_session()
+        await asyncio.sleep(0.05)
+        delivered.append(title)
+
+    manager = AlertManager("https://hooks.example.com/abc")
+    monkeypatch.setattr(manager, "send_alert", slow_send_alert)
+
+    manager.send_alert_sync("queued", "message")
+    loop = manager._bg_loop
+    session_future = asyncio.run_coroutine_threadsafe(manager._get_session(), loop)
+    session = session_future.result(1)
+    manager.shutdown()
+
+    assert delivered == ["queued"]
+    assert session.closed
+    assert loop.is_closed()
+    assert manager._bg_loop is None
+
+
+def test_sync_alert_is_delivered_before_process_exit(tmp_path):
+    """Test an alert queued right before a short script exits is not dropped."""
+    import subprocess
+    import sys
+
+    marker = tmp_path / "delivered"
+    script = f"""
+import asyncio
+from raglint.alerting import AlertManager
+
+manager = AlertManager("https://hooks.example.com/abc")
+
+async def send_alert(title, message, level="info", details=None):
+    await asyncio.sleep(0.1)
+    open({str(marker)!r}, "w").write(title)
+
+manager.send_alert = send_alert
+manager.send_alert_sync("last words", "message")
+"""
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+
+    assert marker.read_text() == "last words"
@@ -3,9 +3,39 @@ Tests for async functionality.
 """
 
 
+import asyncio
+
 import pytest
 
 from raglint.core import RAGPipelineAnalyzer
+from raglint.llm import MockLLM
+
+
+class CountingLLM(MockLLM):
+    """MockLLM that counts agenerate() calls and the peak number in flight."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def agenerate(self, prompt: str) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self.generate(prompt)
+
+
+def use_llm(analyzer: RAGPipelineAnalyzer, llm: MockLLM) -> RAGPipelineAnalyzer:
+    """Point every LLM-backed scorer of an analyzer at llm."""
+    analyzer.faithfulness_scorer.llm = llm
+    analyzer.answer_relevance_scorer.llm = llm
+    analyzer.toxicity_scorer.llm = llm
+    analyzer.context_precision_scorer.llm = llm
+    return analyzer
 
 
 @pytest.mark.asyncio
@@ -91,22 +121,298 @@ def test_sync_analysis_with_smart_metrics_uses_async():
     assert len(result.faithfulness_scores) == 10
 
 
-def test_sync_analysis_small_dataset_stays_sync():
-    """Test that sync analysis with few items stays synchronous."""
+@pytest.mark.asyncio
+async def test_sync_analysis_without_smart_metrics_works_inside_running_loop():
+    """Test that non-smart analyze() scores synchronously, without an event loop or progress bar."""
+    from unittest.mock import patch
+
     data = [
         {
             "query": "Query 1",
             "retrieved_contexts": ["Context 1"],
-            "ground_truth_contexts": ["Truth 1"],
+            "ground_truth_contexts": ["Context 1"],
             "response": "Response 1",
         }
     ]
 
-    config = {"provider": "mock"}
-    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config=config)
+    analyzer = RAGPipelineAnalyzer()
 
-    # This should stay sync (only 1 item)
-    result = analyzer.analyze(data, show_progress=False)
+    with patch("raglint.core.atqdm") as mock_tqdm:
+        result = analyzer.analyze(data)
+
+    mock_tqdm.assert_not_called()
+    assert result.retrieval_stats["precision"] == 1.0
+    assert result.detailed_results[0]["faithfulness_score"] is None
+
+
+@pytest.mark.asyncio
+async def test_sync_analysis_with_smart_metrics_works_inside_running_loop():
+    """Test that smart analyze() still works when called from a running event loop."""
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+
+    result = analyzer.analyze([{"query": "q", "retrieved_contexts": ["c"], "response": "r"}])
 
-    assert result is not None
     assert len(result.faithfulness_scores) == 1
+    assert result.detailed_results[0]["answer_relevance_score"] is not None
+
+
+@pytest.mark.asyncio
+async def test_async_analysis_respects_max_concurrency():
+    """Test that in-flight LLM metric calls never exceed max_concurrency."""
+    data = [
+        {
+            "query": f"Query {i}",
+            "retrieved_contexts": [f"Context {i}."],
+            "response": f"Response {i}",
+        }
+        for i in range(6)
+    ]
+
+    analyzer = RAGPipelineAnalyzer(
+        use_smart_metrics=True, config={"provider": "mock", "max_concurrency": 2}
+    )
+    llm = CountingLLM(delay=0.01)
+    use_llm(analyzer, llm)
+
+    result = await analyzer.analyze_async(data, show_progress=False)
+
+    assert len(result.faithfulness_scores) == 6
+    assert llm.peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_scores_match_per_item_scoring():
+    """Test that batched embedding gives the same scores as per-item scoring."""
+    data = [
+        {
+            "query": f"Query {i}",
+            "retrieved_contexts": [f"Context {i}.", "Shared context."],
+            "ground_truth_contexts": [f"Truth {i}"],
+            "response": f"Response {i}",
+        }
+        for i in range(4)
+    ]
+    data.append({"query": "No ground truth", "retrieved_contexts": ["Context."]})
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    result = await analyzer.analyze_async(data, show_progress=False)
+
+    expected = [
+        analyzer.semantic_matcher.calculate_similarity(
+            item["retrieved_contexts"], item["ground_truth_contexts"]
+        )
+        for item in data[:4]
+    ]
+    assert result.semantic_scores == pytest.approx(expected, abs=1e-5)
+    assert result.detailed_results[4]["semantic_score"] is None
+
+
+@pytest.mark.asyncio
+async def test_analyze_stream_yields_every_item_once():
+    """Test that analyze_stream yields one (index, result) pair per item."""
+    data = [
+        {"query": f"Query {i}", "retrieved_contexts": [f"Context {i}."], "response": "r"}
+        for i in range(5)
+    ]
+    analyzer = RAGPipelineAnalyzer()
+
+    seen = {}
+    async for index, item_result in analyzer.analyze_stream(data):
+        seen[index] = item_result["detailed"]["query"]
+
+    assert seen == {i: f"Query {i}" for i in range(5)}
+
+
+@pytest.mark.asyncio
+async def test_mock_run_without_ground_truth_skips_embedding_model():
+    """Test that the embedding model is only loaded when something needs embedding."""
+    data = [{"query": "q", "retrieved_contexts": ["c"], "response": "r"}]
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    await analyzer.analyze_async(data, show_progress=False)
+
+    assert analyzer.semantic_matcher._model is None
+
+
+@pytest.mark.asyncio
+async def test_analyze_stream_scores_while_later_batches_embed(monkeypatch):
+    """Test that LLM scoring of embedded items overlaps embedding of later batches."""
+    import time
+
+    import raglint.core
+
+    monkeypatch.setattr(raglint.core, "EMBED_BATCH_SIZE", 2)
+    events = []
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+
+    def slow_batch_scores(items):
+        if events:
+            time.sleep(0.05)
+        events.append("embedded")
+        return [0.5] * len(items)
+
+    original_process = analyzer._process_item_async
+
+    async def recording_process(item, **kwargs):
+        events.append("scored")
+        return await original_process(item, **kwargs)
+
+    monkeypatch.setattr(analyzer, "_batch_semantic_scores", slow_batch_scores)
+    monkeypatch.setattr(analyzer, "_process_item_async", recording_process)
+
+    data = [{"query": f"Query {i}", "retrieved_contexts": ["c"], "response": "r"} for i in range(6)]
+    results = [item async for item in analyzer.analyze_stream(data)]
+
+    assert sorted(index for index, _ in results) == list(range(6))
+    assert events.count("embedded") == 3
+    # The first batch is scored before the last batch finishes embedding
+    assert events.index("scored") < len(events) - 1 - events[::-1].index("embedded")
+
+
+@pytest.mark.asyncio
+async def test_analyze_stream_propagates_item_errors(monkeypatch):
+    """Test that a failure while processing an item reaches the consumer."""
+    analyzer = RAGPipelineAnalyzer()
+
+    async def failing_process(item, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(analyzer, "_process_item_async", failing_process)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in analyzer.analyze_stream([{"query": "q", "retrieved_contexts": ["c"]}]):
+            pass
+
+
+def test_analyze_sync_runs_one_metric_call_at_a_time():
+    """Test that _analyze_sync is the async pipeline with a concurrency of one."""
+    data = [
+        {"query": f"Query {i}", "retrieved_contexts": [f"Context {i}."], "response": "r"}
+        for i in range(3)
+    ]
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    llm = CountingLLM()
+    use_llm(analyzer, llm)
+
+    result = analyzer._analyze_sync(data)
+
+    assert len(result.faithfulness_scores) == 3
+    assert llm.peak == 1
+    assert analyzer.max_concurrency == 8
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_have_independent_concurrency_limits():
+    """Test that two runs on one analyzer each get their own max_concurrency budget."""
+    data = [{"query": f"Query {i}", "retrieved_contexts": ["c"], "response": "r"} for i in range(3)]
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    llm = CountingLLM(delay=0.01)
+    use_llm(analyzer, llm)
+
+    first, second = await asyncio.gather(
+        analyzer.analyze_async(data, show_progress=False, max_concurrency=1),
+        analyzer.analyze_async(data, show_progress=False, max_concurrency=1),
+    )
+
+    assert len(first.faithfulness_scores) == len(second.faithfulness_scores) == 3
+    assert llm.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_async_plugins_overlap_builtin_metric_calls(monkeypatch):
+    """Test that async metric plugins run alongside the built-in LLM metrics."""
+    from raglint.plugins.loader import PluginLoader
+
+    events = []
+
+    class SlowLLM(MockLLM):
+        async def agenerate(self, prompt: str) -> str:
+            await asyncio.sleep(0.01)
+            events.append("llm done")
+            return self.generate(prompt)
+
+    class SlowPlugin:
+        name = "slow"
+
+        async def calculate_async(self, **kwargs):
+            events.append("plugin started")
+            await asyncio.sleep(0.01)
+            return {"score": 0.5}
+
+    loader = PluginLoader()
+    loader._loaded = True
+    loader.metric_plugins["slow"] = SlowPlugin()
+    monkeypatch.setattr(PluginLoader, "_instance", loader)
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    llm = SlowLLM()
+    analyzer.faithfulness_scorer.llm = llm
+    analyzer.answer_relevance_scorer.llm = llm
+    analyzer.toxicity_scorer.llm = llm
+
+    data = [{"query": "q", "retrieved_contexts": ["c"], "response": "r"}]
+    result = await analyzer.analyze_async(data, show_progress=False)
+
+    assert result.detailed_results[0]["plugin_metrics"] == {"slow": 0.5}
+    assert events.index("plugin started") < events.index("llm done")
+
+
+@pytest.mark.asyncio
+async def test_score_cache_skips_llm_calls_on_repeat_run(tmp_path):
+    """Test that a second run over the same items is served from the score cache."""
+    data = [{"query": f"Query {i}", "retrieved_contexts": ["c"], "response": "r"} for i in range(3)]
+    config = {"provider": "mock", "score_cache_dir": str(tmp_path)}
+
+    def make_analyzer(llm):
+        return use_llm(RAGPipelineAnalyzer(use_smart_metrics=True, config=config), llm)
+
+    first_llm = CountingLLM()
+    first = await make_analyzer(first_llm).analyze_async(data, show_progress=False)
+    second_llm = CountingLLM()
+    second = await make_analyzer(second_llm).analyze_async(data, show_progress=False)
+
+    assert first_llm.calls > 0
+    assert second_llm.calls == 0
+    assert second.detailed_results == first.detailed_results
+
+
+@pytest.mark.asyncio
+async def test_metric_plugins_are_loaded_once_per_analyzer(monkeypatch):
+    """Test that plugin discovery happens at construction, not once per item."""
+    from raglint.plugins.loader import PluginLoader
+
+    loads = []
+    loader = PluginLoader()
+    monkeypatch.setattr(loader, "load_plugins", lambda *args: loads.append(args))
+    monkeypatch.setattr(PluginLoader, "_instance", loader)
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    data = [{"query": f"Query {i}", "retrieved_contexts": ["c"], "response": "r"} for i in range(4)]
+    await analyzer.analyze_async(data, show_progress=False)
+
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_requires_identical_response_and_contexts():
+    """Test that only the query is matched by similarity in the faithfulness cache."""
+    from raglint.cache import SemanticCache
+
+    analyzer = RAGPipelineAnalyzer(use_smart_metrics=True, config={"provider": "mock"})
+    llm = CountingLLM()
+    use_llm(analyzer, llm)
+    # Every text embeds to the same vector, so any query is "similar"
+    analyzer._cache = SemanticCache(embed_fn=lambda text: [1.0, 0.0])
+
+    await analyzer._ascore_faithfulness("What is RAG?", ["Context A."], "Answer.")
+    calls = llm.calls
+    assert calls > 0
+    await analyzer._ascore_faithfulness("what is rag", ["Context A."], "Answer.")
+    assert llm.calls == calls
+
+    await analyzer._ascore_faithfulness("What is RAG?", ["Context B."], "Answer.")
+    await analyzer._ascore_faithfulness("What is RAG?", ["Context A."], "Other answer.")
+    assert llm.calls == 3 * calls
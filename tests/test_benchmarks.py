@@ -115,3 +115,39 @@ class TestHotpotQABenchmark:
             path = download_squad(split="train", version="v1.1")
             assert "train-v1.1.json" in path
             assert mock_print.called
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("benchmark_cls", [SQUADBenchmark, CoQABenchmark, HotpotQABenchmark])
+async def test_load_async_matches_load(benchmark_cls, tmp_path):
+    """Test load_async returns the same data as load, both cold and from cache."""
+    benchmark = benchmark_cls(subset_size=3, cache_dir=str(tmp_path))
+
+    cold = await benchmark.load_async()
+    cached = await benchmark.load_async()
+
+    assert cold == benchmark.load()
+    assert cached == cold
+
+
+@pytest.mark.parametrize("benchmark_cls", [SQUADBenchmark, CoQABenchmark, HotpotQABenchmark])
+def test_benchmarks_use_slots(benchmark_cls, tmp_path):
+    """Test benchmark instances carry no per-instance __dict__."""
+    benchmark = benchmark_cls(subset_size=3, cache_dir=str(tmp_path))
+
+    assert not hasattr(benchmark, "__dict__")
+    with pytest.raises(AttributeError):
+        benchmark.unknown = 1
+
+
+@pytest.mark.parametrize("benchmark_cls", [SQUADBenchmark, CoQABenchmark, HotpotQABenchmark])
+def test_cache_dir_is_created_on_first_load(benchmark_cls, tmp_path):
+    """Test constructing a benchmark touches no files until load() writes its cache."""
+    cache_dir = tmp_path / "nested" / "cache"
+    benchmark = benchmark_cls(subset_size=3, cache_dir=str(cache_dir))
+    assert not cache_dir.exists()
+
+    data = benchmark.load()
+
+    assert len(list(cache_dir.iterdir())) == 1
+    assert benchmark.load() == data
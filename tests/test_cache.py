@@ -0,0 +1,193 @@
+"""
+Tests for LLM response and semantic caches.
+"""
+
+import numpy as np
+
+from raglint.cache import CachedEmbedder, LLMCache, ScoreCache, SemanticCache
+
+
+def _embed(text: str) -> np.ndarray:
+    """Toy embedding: bag of lowercase letters."""
+    vector = np.zeros(26)
+    for char in text.lower():
+        if "a" <= char <= "z":
+            vector[ord(char) - ord("a")] += 1
+    return vector
+
+
+def test_llm_cache_roundtrip():
+    cache = LLMCache(max_size=2)
+    cache.set("prompt", "response", model="m")
+
+    assert cache.get("prompt", model="m") == "response"
+    assert cache.get("prompt", model="other") is None
+
+
+def test_llm_cache_set_with_key_fills_a_miss(tmp_path):
+    cache = LLMCache(path=tmp_path / "llm.log")
+    key, response = cache.get_with_key("prompt", model="m")
+    assert response is None
+
+    cache.set_with_key(key, "response")
+
+    assert cache.get_with_key("prompt", model="m") == (key, "response")
+    assert LLMCache(path=tmp_path / "llm.log").get("prompt", model="m") == "response"
+
+
+def test_llm_cache_evicts_least_recently_used():
+    cache = LLMCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+    assert cache.size() == 2
+
+
+def test_llm_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "llm_cache.log"
+    cache = LLMCache(max_size=10, path=path)
+    cache.set("prompt", "réponse", model="m")
+    cache.set("other", "response")
+
+    reloaded = LLMCache(max_size=10, path=path)
+    assert reloaded.get("prompt", model="m") == "réponse"
+    assert reloaded.get("other") == "response"
+
+    reloaded.clear()
+    assert LLMCache(max_size=10, path=path).size() == 0
+
+
+def test_llm_cache_log_ignores_torn_tail_and_compacts(tmp_path):
+    path = tmp_path / "llm_cache.log"
+    cache = LLMCache(max_size=2, path=path)
+    for i in range(5):
+        cache.set(f"prompt {i}", f"response {i}")
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    reloaded = LLMCache(max_size=2, path=path)
+
+    assert reloaded.size() == 2
+    assert reloaded.get("prompt 3") == "response 3"
+    assert reloaded.get("prompt 4") == "response 4"
+    # More than 2 * max_size records, so the log was rewritten with live entries only
+    assert path.stat().st_size == 2 * (12 + len(b"response 0"))
+
+
+def test_score_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "scores.sqlite3"
+    key = ScoreCache.make_key("faithfulness", "gpt-4", None, "q", ["c1", "c2"], "r")
+
+    cache = ScoreCache(path)
+    assert cache.get(key) is None
+    cache.set(key, (1.0, "Supported"))
+    cache.close()
+
+    reopened = ScoreCache(path)
+    assert reopened.get(key) == (1.0, "Supported")
+    assert (
+        reopened.get(ScoreCache.make_key("faithfulness", "gpt-4", None, "q", ["c1"], "r")) is None
+    )
+    assert reopened.size() == 1
+
+
+def test_semantic_cache_hits_similar_text():
+    cache = SemanticCache(embed_fn=_embed, threshold=0.95)
+    cache.set("What is RAG?", 0.8)
+
+    assert cache.get("what is rag") == 0.8
+    assert cache.get("How does chunking work?") is None
+
+
+
+def test_semantic_cache_only_matches_within_scope():
+    cache = SemanticCache(embed_fn=_embed, threshold=0.95)
+    cache.set("What is RAG?", 0.8, scope="contexts-a")
+
+    assert cache.get("what is rag", scope="contexts-a") == 0.8
+    assert cache.get("what is rag", scope="contexts-b") is None
+    assert cache.get("what is rag") is None
+
+def test_semantic_cache_evicts_oldest_when_full():
+    cache = SemanticCache(embed_fn=_embed, threshold=0.99, max_size=2)
+    cache.set("aaaa", 1)
+    cache.set("bbbb", 2)
+    cache.set("cccc", 3)
+
+    assert cache.size() == 2
+    assert cache.get("aaaa") is None
+    assert cache.get("bbbb") == 2
+    assert cache.get("cccc") == 3
+
+
+def test_semantic_cache_grows_past_initial_capacity():
+    cache = SemanticCache(embed_fn=lambda text: np.eye(100)[int(text)], threshold=0.99)
+    for i in range(100):
+        cache.set(str(i), i)
+
+    assert cache.size() == 100
+    assert all(cache.get(str(i)) == i for i in range(100))
+
+
+def test_semantic_cache_only_compares_bucket_candidates():
+    cache = SemanticCache(embed_fn=_embed, threshold=0.95, num_bits=8, num_tables=1)
+    cache.set("What is RAG?", 0.8)
+    cache.set("How does chunking work?", 0.4)
+
+    vector = cache._embed("What is RAG?")
+    assert 0 in cache._candidates(cache._hash(vector))
+    assert cache.get("what is rag") == 0.8
+
+
+class CountingModel:
+    """Minimal stand-in for a SentenceTransformer that records encoded texts."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        self.encoded.extend(texts)
+        return np.stack([_embed(text) for text in texts])
+
+
+def test_cached_embedder_persists_vectors(tmp_path):
+    model = CountingModel()
+    embedder = CachedEmbedder(model, "toy-model", tmp_path)
+
+    first = embedder.embed(["alpha", "beta", "alpha"])
+    assert model.encoded == ["alpha", "beta"]
+    assert first.shape == (3, 26)
+
+    # A fresh embedder over the same directory reads from disk
+    model_2 = CountingModel()
+    second = CachedEmbedder(model_2, "toy-model", tmp_path).embed(["beta", "alpha"])
+    assert model_2.encoded == []
+    np.testing.assert_array_equal(second, first[[1, 0]])
+
+
+def test_cached_embedder_keys_include_model_name(tmp_path):
+    CachedEmbedder(CountingModel(), "model-a", tmp_path).embed(["alpha"])
+
+    model = CountingModel()
+    CachedEmbedder(model, "model-b", tmp_path).embed(["alpha"])
+    assert model.encoded == ["alpha"]
+
+
+def test_semantic_matcher_encode_returns_numpy_with_or_without_cache(tmp_path):
+    from raglint.metrics.semantic import SemanticMatcher
+
+    plain = SemanticMatcher()
+    plain._model = CountingModel()
+    cached = SemanticMatcher(cache_dir=str(tmp_path))
+    cached._model = CountingModel()
+    cached.embedder = CachedEmbedder(cached._model, cached.model_name, tmp_path)
+
+    for matcher in (plain, cached):
+        embeddings = matcher.encode(["alpha", "beta"])
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.shape == (2, 26)
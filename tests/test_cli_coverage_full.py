@@ -35,6 +35,17 @@ class TestCLICoverage:
                 
             result = runner.invoke(cli, ["cost", "estimate", "data.json"])
             assert result.exit_code == 1
+            assert "not valid JSON" in result.output
+
+    def test_cost_estimate_non_list_json(self, runner):
+        """Test cost estimate with a JSON object instead of a list."""
+        with runner.isolated_filesystem():
+            with open("data.json", "w") as f:
+                f.write('{"query": "q"}')
+
+            result = runner.invoke(cli, ["cost", "estimate", "data.json"])
+            assert result.exit_code == 1
+            assert "must be a list of items" in result.output
 
     def test_generate_missing_file(self, runner):
         """Test generate with missing file."""
@@ -0,0 +1,141 @@
+"""
+Tests for the precision-mode CLI.
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from raglint.cli_precision import analyze_precision
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """A small mock dataset; no ground truth, so no embedding model is loaded."""
+    path = tmp_path / "data.json"
+    data = [
+        {
+            "query": f"Question {i}",
+            "retrieved_contexts": [f"Context {i}."],
+            "response": f"Answer {i}",
+        }
+        for i in range(5)
+    ]
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_precision_mode_scores_every_item(data_file, tmp_path):
+    """Test that --precision scores every item concurrently and keeps input order."""
+    output = tmp_path / "out.json"
+
+    result = CliRunner().invoke(
+        analyze_precision,
+        [str(data_file), "--precision", "--max-concurrent", "2", "-o", str(output)],
+    )
+
+    assert result.exit_code == 0, result.output
+    results = json.loads(output.read_text())
+    assert [r["query"] for r in results] == [f"Question {i}" for i in range(5)]
+    assert all(r["precision_results"]["metric"] == "enhanced_faithfulness" for r in results)
+    assert all(r["approved"] for r in results)
+
+
+def test_standard_mode_prints_summary(data_file):
+    """Test that the command runs without --precision and summarizes the items."""
+    result = CliRunner().invoke(analyze_precision, [str(data_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "Total items analyzed: 5" in result.output
+
+
+def test_max_concurrent_must_be_positive(data_file):
+    """Test that --max-concurrent 0 is rejected instead of starting no workers."""
+    result = CliRunner().invoke(analyze_precision, [str(data_file), "--max-concurrent", "0"])
+
+    assert result.exit_code == 2
+    assert "--max-concurrent" in result.output
+
+
+def test_workers_merge_shards_in_input_order(data_file, tmp_path):
+    """Test that --workers 2 returns one result per item, in input order."""
+    output = tmp_path / "out.json"
+
+    result = CliRunner().invoke(
+        analyze_precision, [str(data_file), "--precision", "--workers", "2", "-o", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    results = json.loads(output.read_text())
+    assert [r["query"] for r in results] == [f"Question {i}" for i in range(5)]
+
+
+def test_workers_propagate_shard_errors(tmp_path):
+    """Test that an item failing inside a worker process fails the whole command."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"query": "q", "response": "r"}, "not an item"]))
+
+    result = CliRunner().invoke(analyze_precision, [str(path), "--precision", "--workers", "2"])
+
+    assert result.exit_code == 1
+    assert isinstance(result.exception, AttributeError)
+
+
+def test_jsonl_output_has_one_line_per_item(data_file, tmp_path):
+    """Test that --jsonl writes one indexed JSON object per line."""
+    output = tmp_path / "out.jsonl"
+
+    result = CliRunner().invoke(
+        analyze_precision, [str(data_file), "--precision", "--jsonl", "-o", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(line["index"] for line in lines) == list(range(5))
+    assert all(line["query"] == f"Question {line['index']}" for line in lines)
+
+
+
+def test_jsonl_requires_output(data_file):
+    """Test that --jsonl without --output is a usage error rather than ignored."""
+    result = CliRunner().invoke(analyze_precision, [str(data_file), "--jsonl"])
+
+    assert result.exit_code == 2
+    assert "--jsonl requires --output" in result.output
+
+
+def test_jsonl_output_with_workers_writes_every_shard(data_file, tmp_path):
+    """Test that sharded --jsonl runs write each item once, tagged with its input index."""
+    output = tmp_path / "out.jsonl"
+
+    result = CliRunner().invoke(
+        analyze_precision,
+        [str(data_file), "--precision", "--jsonl", "--workers", "2", "-o", str(output)],
+    )
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(line["index"] for line in lines) == list(range(5))
+    assert all(line["query"] == f"Question {line['index']}" for line in lines)
+
+def test_jsonl_input_is_streamed_to_workers(tmp_path):
+    """Test that a .jsonl dataset is scored item by item and written in input order."""
+    path = tmp_path / "data.jsonl"
+    path.write_text(
+        "\n".join(
+            json.dumps({"query": f"Question {i}", "retrieved_contexts": ["c."], "response": "r"})
+            for i in range(4)
+        )
+        + "\n"
+    )
+    output = tmp_path / "out.json"
+
+    result = CliRunner().invoke(
+        analyze_precision,
+        [str(path), "--precision", "--max-concurrent", "1", "-o", str(output)],
+    )
+
+    assert result.exit_code == 0, result.output
+    results = json.loads(output.read_text())
+    assert [r["query"] for r in results] == [f"Question {i}" for i in range(4)]
@@ -0,0 +1,74 @@
+"""
+Tests for confidence and consensus scoring.
+"""
+
+import statistics
+
+import numpy as np
+import pytest
+
+from raglint.confidence import ConfidenceScorer, ConsensusScorer, OnlineConfidence
+
+
+def test_confidence_matches_sample_variance():
+    scores = [0.8, 0.9, 0.75]
+
+    avg_score, confidence = ConfidenceScorer().calculate_confidence(scores)
+
+    assert avg_score == pytest.approx(statistics.mean(scores))
+    assert confidence == pytest.approx(1.0 - 10 * statistics.variance(scores))
+
+
+def test_confidence_edge_cases():
+    scorer = ConfidenceScorer()
+
+    assert scorer.calculate_confidence([]) == (0.0, 0.0)
+    assert scorer.calculate_confidence([0.7]) == (0.7, 1.0)
+    assert scorer.calculate_confidence([0.0, 1.0])[1] == 0.0
+
+
+@pytest.mark.parametrize("num_samples", [0, 1, 3])
+def test_confidence_batch_matches_per_item(num_samples):
+    scorer = ConfidenceScorer()
+    scores = np.random.default_rng(0).uniform(0.5, 1.0, size=(20, num_samples))
+
+    avg_scores, confidences = scorer.calculate_confidence_batch(scores)
+
+    expected = [scorer.calculate_confidence(list(row)) for row in scores]
+    assert avg_scores == pytest.approx([avg for avg, _ in expected])
+    assert confidences == pytest.approx([confidence for _, confidence in expected])
+
+
+@pytest.mark.parametrize("scores", [[], [0.7], [0.8, 0.9, 0.75], [0.0, 1.0, 0.5, 0.25]])
+def test_online_confidence_matches_list_version(scores):
+    online = OnlineConfidence()
+    for score in scores:
+        online.update(score)
+
+    avg_score, confidence = online.finalize()
+    expected_avg, expected_confidence = ConfidenceScorer().calculate_confidence(scores)
+
+    assert avg_score == pytest.approx(expected_avg)
+    assert confidence == pytest.approx(expected_confidence)
+
+
+def test_consensus_averages_agreeing_scores():
+    result = ConsensusScorer().calculate_consensus([("a", 0.8), ("b", 0.85)])
+
+    assert result["agreement"] is True
+    assert result["consensus_score"] == pytest.approx(0.825)
+
+
+def test_consensus_uses_minimum_when_models_disagree():
+    result = ConsensusScorer().calculate_consensus([("a", 0.9), ("b", 0.4), ("c", 0.95)])
+
+    assert result["agreement"] is False
+    assert result["consensus_score"] == 0.4
+    assert result["score_range"] == pytest.approx(0.55)
+
+
+def test_consensus_returns_identical_scores_exactly():
+    result = ConsensusScorer().calculate_consensus([("a", 0.1), ("a", 0.1), ("a", 0.1)])
+
+    assert result["consensus_score"] == 0.1
+    assert result["score_range"] == 0.0
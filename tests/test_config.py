@@ -5,7 +5,7 @@ Tests for configuration module.
 import pytest
 import os
 from pathlib import Path
-from raglint.config import Config
+from raglint.config import Config, config_hash, render_prompt
 
 
 def test_config_initialization_defaults():
@@ -75,3 +75,112 @@ def test_config_metrics_list():
     config = Config(metrics=["faithfulness", "relevance"])
     assert "faithfulness" in config.metrics
     assert "relevance" in config.metrics
+
+
+def test_config_hash_is_stable_and_order_independent():
+    """Test config hashes ignore key order and keep their stored SHA-256 format."""
+    import hashlib
+
+    first = config_hash({"provider": "mock", "model_name": "m"})
+    second = config_hash({"model_name": "m", "provider": "mock"})
+
+    assert first == second
+    assert first == hashlib.sha256(b'{"model_name": "m", "provider": "mock"}').hexdigest()
+
+
+def test_config_hash_ignores_execution_only_settings():
+    """Test that tuning concurrency or caches keeps the pipeline version hash."""
+    from dataclasses import asdict
+
+    config = Config()
+    before = config_hash(asdict(config))
+
+    config.max_concurrency = 32
+    config.semantic_cache = True
+    config.score_cache_dir = "/tmp/scores"
+
+    assert config_hash(asdict(config)) == before
+    assert config_hash({"provider": "mock", "max_concurrency": 4}) == config_hash(
+        {"provider": "mock"}
+    )
+
+    config.model_name = "gpt-4"
+    assert config_hash(asdict(config)) != before
+
+
+def test_config_load_reuses_parsed_file_until_it_changes(tmp_path, monkeypatch):
+    """Test repeated loads skip the YAML parse, but edits are picked up."""
+    import yaml
+
+    yaml_file = tmp_path / "raglint.yml"
+    yaml_file.write_text("provider: openai\n")
+    calls = []
+    real_load = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda f, Loader: calls.append(1) or real_load(f, Loader))
+
+    first = Config.load(str(yaml_file))
+    second = Config.load(str(yaml_file))
+    second.metrics["chunking"] = False
+
+    assert first.provider == second.provider == "openai"
+    assert first is not second
+    assert Config.load(str(yaml_file)).metrics["chunking"] is True
+    assert len(calls) == 1
+
+    yaml_file.write_text("provider: ollama\n")
+    os.utime(yaml_file, ns=(0, 0))
+    assert Config.load(str(yaml_file)).provider == "ollama"
+    assert len(calls) == 2
+
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [("false", False), ("False", False), ("0", False), (0, False), ("true", True), (True, True)],
+)
+def test_config_load_parses_semantic_cache_flag(tmp_path, raw, expected):
+    """Test that string flags like "false" are not read as truthy."""
+    import yaml
+
+    yaml_file = tmp_path / "raglint.yml"
+    yaml_file.write_text(yaml.safe_dump({"semantic_cache": raw}))
+
+    assert Config.load(str(yaml_file)).semantic_cache is expected
+
+
+def test_config_load_skips_invalid_scalar_values(tmp_path, capsys):
+    """Test that one bad value keeps its default without dropping the rest of the file."""
+    yaml_file = tmp_path / "raglint.yml"
+    yaml_file.write_text(
+        "provider: openai\nmax_concurrency: lots\nsemantic_cache: maybe\nscore_cache_dir: /tmp/s\n"
+    )
+
+    config = Config.load(str(yaml_file))
+
+    assert config.provider == "openai"
+    assert config.score_cache_dir == "/tmp/s"
+    assert config.max_concurrency == Config().max_concurrency
+    assert config.semantic_cache is False
+    output = capsys.readouterr().out
+    assert "max_concurrency" in output
+    assert "semantic_cache" in output
+
+
+@pytest.mark.parametrize(
+    "template",
+    ["Query: {query}\nAnswer: {response}", "{{literal}} {query}{query}", "{query!r:>20}", "plain"],
+)
+def test_render_prompt_matches_str_format(template):
+    """Test that precompiled templates render exactly like str.format."""
+    values = {"query": "What is RAG?", "response": "A technique."}
+
+    assert render_prompt(template, **values) == template.format(**values)
+
+
+def test_config_render_prompt_uses_named_template():
+    """Test Config.render_prompt fills the configured template."""
+    config = Config(prompts={"answer_relevance": "Q={query} R={response}"})
+
+    assert config.render_prompt("answer_relevance", query="q", response="r") == "Q=q R=r"
+    with pytest.raises(KeyError):
+        config.render_prompt("answer_relevance", query="q")
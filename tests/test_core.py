@@ -50,6 +50,24 @@ def test_retrieval_metrics(sample_data, mock_config):
     assert hasattr(results, 'retrieval_stats')
     assert results.retrieval_stats is not None
 
+def test_retrieval_stats_average_items_with_ground_truth():
+    """Test that retrieval stats average only over items that have ground truth"""
+    data = [
+        {"query": "q1", "retrieved_contexts": ["a", "b"], "ground_truth_contexts": ["a"]},
+        {"query": "q2", "retrieved_contexts": ["a", "b"], "ground_truth_contexts": ["b"]},
+        {"query": "q3", "retrieved_contexts": ["a"]},
+    ]
+
+    results = RAGPipelineAnalyzer().analyze(data, show_progress=False)
+
+    assert results.retrieval_stats["precision"] == pytest.approx(0.5)
+    assert results.retrieval_stats["recall"] == pytest.approx(1.0)
+    assert results.retrieval_stats["mrr"] == pytest.approx(0.75)
+    assert all(isinstance(value, float) for value in results.retrieval_stats.values())
+
+    empty = RAGPipelineAnalyzer().analyze([{"query": "q", "retrieved_contexts": ["a"]}])
+    assert empty.retrieval_stats == {"precision": 0.0, "recall": 0.0, "mrr": 0.0, "ndcg": 0.0}
+
 def test_empty_data():
     """Test handling of empty data"""
     analyzer = RAGPipelineAnalyzer(Config())
@@ -81,3 +99,28 @@ def test_faithfulness_with_real_api(sample_data):
     results = analyzer.analyze(sample_data[:1])  # Test with one item
     
     assert len(results.detailed_results) > 0
+
+def test_analysis_columns_keep_input_order():
+    """Test that results recorded out of order come back in input order"""
+    from raglint.core import AnalysisColumns
+
+    def item_result(query, semantic, precision):
+        metrics = {"precision": precision, "recall": 1.0, "mrr": 1.0, "ndcg": 1.0}
+        return {
+            "chunks": [query],
+            "semantic_score": semantic,
+            "faithfulness_score": None,
+            "basic_metrics": metrics if precision is not None else None,
+            "detailed": {"query": query},
+        }
+
+    columns = AnalysisColumns.allocate(3)
+    columns.record(2, item_result("c", 0.3, 0.0))
+    columns.record(0, item_result("a", 0.1, 1.0))
+    columns.record(1, item_result("b", None, None))
+
+    assert [d["query"] for d in columns.detailed] == ["a", "b", "c"]
+    assert columns.chunks == [["a"], ["b"], ["c"]]
+    assert columns.present(columns.semantic) == pytest.approx([0.1, 0.3])
+    assert columns.present(columns.faithfulness) == []
+    assert columns.retrieval_means()["precision"] == pytest.approx(0.5)
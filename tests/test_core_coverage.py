@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from raglint.core import RAGPipelineAnalyzer
 
 @pytest.fixture
@@ -35,7 +35,7 @@ def test_analyze_basic_flow():
     assert len(results.detailed_results) == 1
     assert results.retrieval_stats['recall'] == 0.0 # No ground truth
 
-@patch("raglint.metrics.faithfulness.FaithfulnessScorer.score")
+@patch("raglint.metrics.faithfulness.FaithfulnessScorer.ascore", new_callable=AsyncMock)
 def test_analyze_smart_metrics(mock_score):
     mock_score.return_value = (0.9, "Good")
     
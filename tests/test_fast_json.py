@@ -0,0 +1,139 @@
+"""
+Tests for the optional-orjson JSON helpers.
+"""
+
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from raglint import fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_roundtrip(backend, tmp_path):
+    data = [{"query": "Qué es RAG?", "scores": [1.0, 0.5], "ok": True, "none": None}]
+    path = tmp_path / "data.json"
+
+    fast_json.dump_file(data, path, indent=True)
+
+    assert fast_json.load_file(path) == data
+    assert fast_json.loads(fast_json.dumps(data)) == data
+
+
+def test_dump_file_replaces_atomically(backend, tmp_path):
+    path = tmp_path / "data.json"
+    fast_json.dump_file([1, 2], path)
+
+    with pytest.raises(TypeError):
+        fast_json.dump_file([object()], path)
+    fast_json.dump_file([3], path)
+
+    assert fast_json.load_file(path) == [3]
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_iter_jsonl_yields_one_item_per_line(backend, tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"query": "a"}\n\n{"query": "b"}\n', encoding="utf-8")
+
+    assert list(fast_json.iter_jsonl(path)) == [{"query": "a"}, {"query": "b"}]
+
+
+def test_dumps_returns_compact_bytes(backend):
+    assert fast_json.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+    assert fast_json.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+
+
+@dataclass
+class _Score:
+    name: str
+    values: np.ndarray
+
+
+_MIXED_PAYLOAD = {
+    1: "int key",
+    "nan": float("nan"),
+    "inf": [float("inf"), 0.5],
+    "score": _Score("faithfulness", np.array([0.25, np.nan])),
+    "scalar": np.float32(0.5),
+    "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+    "nested": {"none": None, "flag": True, "tuple": (1, "two")},
+}
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_output_does_not_depend_on_backend(monkeypatch, indent):
+    """Test that orjson and the stdlib fallback serialize the same payload identically."""
+    if fast_json.orjson is None:
+        pytest.skip("orjson not installed")
+    with_orjson = fast_json.dumps(_MIXED_PAYLOAD, indent=indent)
+    monkeypatch.setattr(fast_json, "orjson", None)
+    with_stdlib = fast_json.dumps(_MIXED_PAYLOAD, indent=indent)
+
+    assert with_orjson == with_stdlib
+    assert fast_json.loads(with_stdlib) == {
+        "1": "int key",
+        "nan": None,
+        "inf": [None, 0.5],
+        "score": {"name": "faithfulness", "values": [0.25, None]},
+        "scalar": 0.5,
+        "when": "2024-01-02T03:04:05",
+        "nested": {"none": None, "flag": True, "tuple": [1, "two"]},
+    }
+
+def test_load_file_rejects_empty_file(backend, tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        fast_json.load_file(path)
+
+
+@pytest.fixture(params=["ijson", "parse"])
+def counter(request, monkeypatch):
+    """Run count_items with ijson streaming (if installed) and with a full parse."""
+    if request.param == "parse":
+        monkeypatch.setattr(fast_json, "ijson", None)
+    elif fast_json.ijson is None:
+        pytest.skip("ijson not installed")
+    return request.param
+
+
+def test_count_items(counter, tmp_path):
+    path = tmp_path / "data.json"
+    data = [{"query": "q", "nested": {"a": [1, {"b": 2}]}}, [1, 2], "s", 3, None, {}]
+    fast_json.dump_file(data, path, indent=True)
+
+    assert fast_json.count_items(path) == len(data)
+
+    path.write_bytes(b"[]")
+    assert fast_json.count_items(path) == 0
+
+
+def test_count_items_rejects_non_array(counter, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_bytes(b'{"item": 1}')
+
+    with pytest.raises(fast_json.NotAnArrayError):
+        fast_json.count_items(path)
+
+
+@pytest.mark.parametrize("content", [b"", b"[1, 2", b"invalid", b'[{"a": }]'])
+def test_count_items_reports_parse_errors(counter, tmp_path, content):
+    path = tmp_path / "data.json"
+    path.write_bytes(content)
+
+    with pytest.raises(fast_json.JSONParseError):
+        fast_json.count_items(path)
@@ -99,3 +99,94 @@ def test_bedrock_llm_initialization():
         region_name="us-east-1"  # Changed from region
     )
     assert llm.model_id == "anthropic.claude-v2"
+
+
+@pytest.mark.asyncio
+async def test_langchain_evaluator_runs_cases_concurrently():
+    """Test LangChainEvaluator invokes the chain for every case and scores the outputs."""
+    import asyncio
+
+    from raglint.integrations.langchain import LangChainEvaluator
+
+    in_flight = 0
+    peak = 0
+
+    async def ainvoke(inputs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {
+            "query": inputs["query"],
+            "result": f"Answer to {inputs['query']}",
+            "source_documents": [doc],
+        }
+
+    doc = MagicMock(page_content="Python is a programming language.")
+    chain = MagicMock()
+    chain.ainvoke = ainvoke
+    chain.retriever.ainvoke = AsyncMock(return_value=[doc])
+
+    evaluator = LangChainEvaluator(chain)
+    test_cases = [
+        {"query": f"Question {i}", "ground_truth_contexts": ["Python is a programming language."]}
+        for i in range(3)
+    ]
+    result = await evaluator.evaluate(test_cases)
+
+    assert peak == 3
+    assert [item["response"] for item in result.detailed_results] == [
+        f"Answer to Question {i}" for i in range(3)
+    ]
+    assert result.detailed_results[0]["retrieved_contexts"] == [doc.page_content]
+    assert result.detailed_results[0]["ground_truth_contexts"] == [doc.page_content]
+    # Sources come from the chain output, so the retriever is not queried again
+    chain.retriever.ainvoke.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_langchain_evaluator_falls_back_to_retriever_and_ignores_answer():
+    """Test sources are fetched once when the chain omits them, and answers aren't contexts."""
+    from raglint.integrations.langchain import LangChainEvaluator
+
+    doc = MagicMock(page_content="Paris is the capital of France.")
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(return_value={"result": "Paris"})
+    chain.retriever.ainvoke = AsyncMock(return_value=[doc])
+
+    result = await LangChainEvaluator(chain).evaluate(
+        [{"query": "Capital of France?", "ground_truth": "Paris"}]
+    )
+
+    chain.retriever.ainvoke.assert_awaited_once_with("Capital of France?")
+    assert result.detailed_results[0]["retrieved_contexts"] == [doc.page_content]
+    assert result.detailed_results[0]["ground_truth_contexts"] == []
+
+
+@pytest.mark.asyncio
+async def test_langchain_evaluator_bounds_chain_concurrency():
+    """Test LangChainEvaluator keeps at most max_concurrency chain calls in flight."""
+    import asyncio
+
+    from raglint.integrations.langchain import LangChainEvaluator
+
+    in_flight = 0
+    peak = 0
+
+    async def ainvoke(inputs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"result": f"Answer to {inputs['query']}", "source_documents": []}
+
+    chain = MagicMock(spec=["ainvoke"])
+    chain.ainvoke = ainvoke
+
+    evaluator = LangChainEvaluator(chain, config={"max_concurrency": 2})
+    result = await evaluator.evaluate([{"query": f"Question {i}"} for i in range(5)])
+
+    assert peak == 2
+    assert len(result.detailed_results) == 5
@@ -53,3 +53,36 @@ def test_html_report_includes_metrics(sample_results, tmp_path):
     content = output_file.read_text()
     # Should include some metrics
     assert len(content) > 100  # Basic sanity check
+
+
+@pytest.mark.asyncio
+async def test_generate_html_report_async(sample_results, tmp_path):
+    """Test async HTML report generation writes the same report."""
+    from raglint.reporting import generate_html_report_async
+
+    output_file = tmp_path / "report.html"
+
+    await generate_html_report_async(sample_results, str(output_file))
+
+    assert output_file.exists()
+    assert "test1" in output_file.read_text()
+
+
+def test_reporter_buffers_until_flush():
+    """Test Reporter writes all queued lines in one write on flush."""
+    import io
+
+    from raglint.reporting import Reporter
+
+    stream = io.StringIO()
+    r = Reporter(stream)
+    r.line("Results")
+    r.line()
+    r.line("  precision: 0.50")
+    assert stream.getvalue() == ""
+
+    r.flush()
+    assert stream.getvalue() == "Results\n\n  precision: 0.50\n"
+
+    r.flush()
+    assert stream.getvalue() == "Results\n\n  precision: 0.50\n"
@@ -68,3 +68,22 @@ def test_empty_lists():
     assert metrics["recall"] == 0.0
     assert metrics["mrr"] == 0.0
     assert metrics["ndcg"] == 0.0
+
+
+def test_batch_metrics_match_per_item():
+    """Test vectorized batch metrics agree with the per-item implementation."""
+    import random
+
+    from raglint.metrics.retrieval import calculate_retrieval_metrics_batch
+
+    rng = random.Random(0)
+    docs = [f"doc{i}" for i in range(12)]
+    retrieved_lists = [rng.choices(docs, k=rng.randint(0, 8)) for _ in range(50)]
+    ground_truth_lists = [rng.choices(docs, k=rng.randint(0, 4)) for _ in range(50)]
+
+    batch = calculate_retrieval_metrics_batch(retrieved_lists, ground_truth_lists)
+
+    for i, (retrieved, ground_truth) in enumerate(zip(retrieved_lists, ground_truth_lists)):
+        expected = calculate_retrieval_metrics(retrieved, ground_truth)
+        for key, value in expected.items():
+            assert batch[key][i] == pytest.approx(value), (key, retrieved, ground_truth)
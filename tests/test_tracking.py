@@ -73,6 +73,21 @@ class TestLatencyStats:
         assert stats.p95_latency == 3.0  # Falls back to max for small dataset
         assert stats.p99_latency == 3.0
 
+    def test_percentiles_past_exact_sample_limit(self):
+        """Test that long runs fold into the histogram and stay within ~1%."""
+        stats = LatencyStats(max_exact_samples=100)
+        for i in range(1, 5001):
+            stats.add_latency(i / 1000)
+
+        stats.calculate_percentiles()
+
+        assert len(stats.latencies) == 0
+        assert len(stats.buckets) < 500
+        assert stats.num_calls == 5000
+        assert stats.p50_latency == pytest.approx(2.5, rel=0.02)
+        assert stats.p95_latency == pytest.approx(4.75, rel=0.02)
+        assert stats.p99_latency == pytest.approx(4.95, rel=0.02)
+
 
 class TestCostStats:
     """Test CostStats class."""